@@ -19,7 +19,25 @@ else:
 DATA_PATH = STORAGE_PATH / "datasets"
 PROJECTS_PATH = STORAGE_PATH / "projects"
 
+# The maximum approximate size of the parsed logs cached in memory, in bytes
+# (the cache is disabled by default)
+LOG_CACHE_SIZE = int(os.environ.get("EVALSENSE_LOG_CACHE_SIZE", "0"))
+
 DATASET_CONFIG_PATHS = [Path(__file__).parent / "dataset_config"]
 if "DATASET_CONFIG_PATH" in os.environ:
     for directory in os.environ["DATASET_CONFIG_PATH"].split(os.pathsep):
         DATASET_CONFIG_PATHS.append(Path(directory))
+
+# Models
+LOCAL_MODEL_PROVIDERS = {
+    "hf",
+    "vllm",
+    "sglang",
+    "transformer_lens",
+    "nnterp",
+    "llama-cpp-python",
+    "ollama",
+}
+LOCAL_SERVER_MODEL_PROVIDERS = {"vllm", "sglang", "llama-cpp-python", "ollama"}
+# Providers loading the models and tokenizers from Hugging Face Hub
+HF_HUB_MODEL_PROVIDERS = {"hf", "vllm", "sglang"}
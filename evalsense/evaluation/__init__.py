@@ -1,4 +1,11 @@
-from evalsense.evaluation.evaluator import Evaluator, ScoreCalculator, ScorerFactory
+from evalsense.evaluation.concurrency import AdaptiveConcurrencyLimiter
+from evalsense.evaluation.evaluator import (
+    CallEstimate,
+    CallEstimator,
+    Evaluator,
+    ScoreCalculator,
+    ScorerFactory,
+)
 from evalsense.evaluation.experiment import (
     EvaluationRecord,
     ExperimentBatchConfig,
@@ -12,6 +19,9 @@ from evalsense.evaluation.experiment import (
 )
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "CallEstimate",
+    "CallEstimator",
     "Evaluator",
     "ScoreCalculator",
     "ScorerFactory",
@@ -0,0 +1,207 @@
+from collections import deque
+import time
+
+import anyio
+from inspect_ai.model import ChatMessage, GenerateConfig, Model, ModelOutput
+
+from evalsense.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _is_rate_limit_error(model: Model, error: Exception) -> bool:
+    """Checks whether a model call failed due to a rate limit.
+
+    Args:
+        model (Model): The called model.
+        error (Exception): The error raised by the call.
+
+    Returns:
+        bool: True if the error is retryable for the model provider or has
+            an HTTP 429 (Too Many Requests) status, False otherwise.
+    """
+    response = getattr(error, "response", None)
+    status_code = getattr(error, "status_code", getattr(response, "status_code", None))
+    return status_code == 429 or model.api.should_retry(error)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent judge model calls, adapting the limit
+    to the capacity of the model provider.
+
+    The limit is adapted using an additive-increase/multiplicative-decrease
+    (AIMD) scheme. While the call latency stays within `latency_tolerance`
+    times the lowest observed (smoothed) latency, the limit grows by roughly
+    one call per round of completed calls. When a rate limit is encountered,
+    i.e., a call fails with a retryable error or an HTTP 429 status, the limit
+    is multiplied by `decrease_factor`. Calls started before the last decrease
+    do not trigger further decreases, so that a burst of rate limit errors only
+    backs off once.
+
+    The limiter is applied on top of the `max_connections` setting of the model,
+    which should be set high enough not to constrain the adaptive limit. Since
+    the limiter only observes the errors raised by the calls, the requests
+    retried internally by Inspect are only reflected in the increased latency,
+    unless the retries are limited using the `max_retries` generation setting.
+    A single limiter may be shared by multiple evaluators using the same model,
+    but it should not be used by multiple event loops at the same time.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_smoothing: float = 0.1,
+    ):
+        """Initializes the adaptive concurrency limiter.
+
+        Args:
+            initial_limit (int): The initial concurrency limit. Defaults to 8.
+            min_limit (int): The minimum concurrency limit. Defaults to 1.
+            max_limit (int): The maximum concurrency limit. Defaults to 128.
+            decrease_factor (float): The factor by which the limit is multiplied
+                when a rate limit is encountered. Defaults to 0.5.
+            latency_tolerance (float): The ratio of the smoothed latency to the
+                lowest observed smoothed latency, above which the limit stops
+                growing. Defaults to 2.0.
+            latency_smoothing (float): The weight of the latest call latency in
+                the exponential moving average of the latencies. Defaults to 0.1.
+
+        Raises:
+            ValueError: If the limits or the adaptation parameters are invalid.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "The concurrency limits must satisfy "
+                "1 <= min_limit <= initial_limit <= max_limit."
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("The decrease factor must be between 0 and 1.")
+        if latency_tolerance < 1:
+            raise ValueError("The latency tolerance must be at least 1.")
+        if not 0 < latency_smoothing <= 1:
+            raise ValueError("The latency smoothing must be between 0 and 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_smoothing = latency_smoothing
+        self.num_decreases = 0
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[anyio.Event] = deque()
+        self._smoothed_latency: float | None = None
+        self._baseline_latency: float | None = None
+        # Incremented on each decrease to ignore rate limits hit by earlier calls
+        self._epoch = 0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls currently in progress."""
+        return self._in_flight
+
+    def _wake_waiters(self):
+        """Wakes up the waiting calls for which there is spare capacity."""
+        for _ in range(min(len(self._waiters), self.limit - self._in_flight)):
+            self._waiters.popleft().set()
+
+    async def _acquire(self):
+        """Waits until a call can be started within the concurrency limit."""
+        while self._in_flight >= self.limit:
+            event = anyio.Event()
+            self._waiters.append(event)
+            try:
+                await event.wait()
+            except BaseException:
+                if event in self._waiters:
+                    self._waiters.remove(event)
+                else:
+                    # Pass on the wake-up to another waiting call
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def _release(self):
+        """Marks a call as completed, waking up the waiting calls."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _on_success(self, latency: float):
+        """Updates the limit after a call completed without rate limits.
+
+        Args:
+            latency (float): The latency of the call in seconds.
+        """
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += self.latency_smoothing * (
+                latency - self._smoothed_latency
+            )
+        if self._baseline_latency is None:
+            self._baseline_latency = self._smoothed_latency
+        else:
+            self._baseline_latency = min(self._baseline_latency, self._smoothed_latency)
+
+        if self._smoothed_latency <= self._baseline_latency * self.latency_tolerance:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake_waiters()
+
+    def _on_rate_limit(self, epoch: int, model_name: str):
+        """Decreases the limit after a call encountered a rate limit.
+
+        Args:
+            epoch (int): The epoch in which the call started.
+            model_name (str): The name of the called model.
+        """
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        self.num_decreases += 1
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        logger.info(
+            f"⏬  Rate limit encountered for {model_name} — reducing the "
+            f"concurrency limit to {self.limit}."
+        )
+
+    async def generate(
+        self,
+        model: Model,
+        input: str | list[ChatMessage],
+        config: GenerateConfig | None = None,
+    ) -> ModelOutput:
+        """Generates a model output within the concurrency limit, adapting
+        the limit based on the call outcome.
+
+        Args:
+            model (Model): The model to call.
+            input (str | list[ChatMessage]): The model input.
+            config (GenerateConfig | None): The generation config. Defaults to
+                `None`.
+
+        Returns:
+            ModelOutput: The model output.
+        """
+        await self._acquire()
+        epoch = self._epoch
+        start_time = time.perf_counter()
+        try:
+            output = await model.generate(input, config=config or GenerateConfig())
+        except Exception as e:
+            if _is_rate_limit_error(model, e):
+                self._on_rate_limit(epoch, model.name)
+            raise
+        finally:
+            self._release()
+
+        self._on_success(time.perf_counter() - start_time)
+        return output
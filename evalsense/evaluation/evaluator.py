@@ -84,6 +84,68 @@ class ScorerFactory(Protocol):
         pass
 
 
+@dataclass
+class CallEstimate:
+    """An estimate of the LLM calls made for a single sample.
+
+    Attributes:
+        calls (float): The expected number of LLM calls.
+        input_tokens (float): The expected number of input tokens.
+        output_tokens (float): The expected number of output tokens.
+    """
+
+    calls: float = 0
+    input_tokens: float = 0
+    output_tokens: float = 0
+
+    def __add__(self, other: "CallEstimate") -> "CallEstimate":
+        """Sums two estimates.
+
+        Args:
+            other (CallEstimate): The other estimate.
+
+        Returns:
+            CallEstimate: The summed estimate.
+        """
+        return CallEstimate(
+            calls=self.calls + other.calls,
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+        )
+
+
+@runtime_checkable
+class CallEstimator(Protocol):
+    """A protocol for estimating the LLM calls made by a scorer before running it."""
+
+    @abstractmethod
+    def estimate_calls(
+        self,
+        *,
+        prediction: str,
+        count_tokens: Callable[[str], int],
+        input: str | None = None,
+        reference: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> CallEstimate:
+        """Estimates the LLM calls made for scoring a single sample.
+
+        Args:
+            prediction (str): The (expected) model output to evaluate.
+            count_tokens (Callable[[str], int]): A function counting the tokens
+                in a text for the evaluation model.
+            input (str, optional): The input to the model. Optional.
+            reference (str, optional): The reference output to compare against.
+                Optional.
+            metadata (dict[str, Any], optional): Additional Inspect AI sample/task
+                state metadata. Optional.
+
+        Returns:
+            CallEstimate: The estimated LLM calls for the sample.
+        """
+        pass
+
+
 @dataclass
 class Evaluator:
     """A class for LLM output evaluators."""
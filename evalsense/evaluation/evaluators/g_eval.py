@@ -1,4 +1,4 @@
-from typing import Any, override
+from typing import Any, Callable, override
 
 from inspect_ai.model import GenerateConfig, Model
 from inspect_ai.scorer import (
@@ -12,6 +12,9 @@ from inspect_ai.scorer import (
 from inspect_ai.solver import TaskState
 
 from evalsense.evaluation import (
+    AdaptiveConcurrencyLimiter,
+    CallEstimate,
+    CallEstimator,
     Evaluator,
     ScoreCalculator,
     ScorerFactory,
@@ -22,6 +25,9 @@ from evalsense.utils.text import extract_score, extract_weighted_score, format_t
 
 logger = get_logger(__name__)
 
+# Expected length of the judge response, consisting of a numerical score
+_ESTIMATED_SCORE_TOKENS = 5
+
 
 class GEvalScoreCalculator(ScoreCalculator):
     """G-Eval score calculator."""
@@ -36,6 +42,7 @@ class GEvalScoreCalculator(ScoreCalculator):
         max_score: int = 10,
         normalise: bool = True,
         debug: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         """
         Initializes the G-Eval score calculator.
@@ -50,6 +57,9 @@ class GEvalScoreCalculator(ScoreCalculator):
             max_score (int): The maximum valid score.
             normalise (bool): Whether to normalise the scores between 0 and 1.
             debug (bool): Whether to report repeated errors in the log.
+            concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+                adapting the number of concurrent judge model calls. If `None`,
+                the concurrency is only limited by the model `max_connections`.
         """
         self.model = model
         self.prompt_template = prompt_template
@@ -59,6 +69,7 @@ class GEvalScoreCalculator(ScoreCalculator):
         self.max_score = max_score
         self.normalise = normalise
         self.debug = debug
+        self.concurrency_limiter = concurrency_limiter
         self.warned_weighted_score = False
 
     @override
@@ -120,7 +131,12 @@ class GEvalScoreCalculator(ScoreCalculator):
             input=input,
             **metadata,
         )
-        output = await self.model.generate(llm_input, config=logprobs_config)
+        if self.concurrency_limiter is None:
+            output = await self.model.generate(llm_input, config=logprobs_config)
+        else:
+            output = await self.concurrency_limiter.generate(
+                self.model, llm_input, config=logprobs_config
+            )
 
         raw_score = extract_score(output.completion, self.min_score, self.max_score)
         if self.logprobs:
@@ -151,18 +167,22 @@ class GEvalScoreCalculator(ScoreCalculator):
         else:
             score = raw_score
 
+        score_metadata = {
+            "prompt": llm_input,
+            "output_text": output.completion,
+            "raw_score": raw_score,
+        }
+        if self.concurrency_limiter is not None:
+            score_metadata["concurrency_limit"] = self.concurrency_limiter.limit
+
         return Score(
             value=score,
             answer=prediction,
-            metadata={
-                "prompt": llm_input,
-                "output_text": output.completion,
-                "raw_score": raw_score,
-            },
+            metadata=score_metadata,
         )
 
 
-class GEvalScorerFactory(ScorerFactory):
+class GEvalScorerFactory(ScorerFactory, CallEstimator):
     """Scorer factory for G-Eval."""
 
     def __init__(
@@ -178,6 +198,7 @@ class GEvalScorerFactory(ScorerFactory):
         max_score: int = 10,
         normalise: bool = True,
         debug: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         """
         Initialize the G-Eval scorer factory.
@@ -195,6 +216,10 @@ class GEvalScorerFactory(ScorerFactory):
             max_score (int): The maximum valid score.
             normalise (bool): Whether to normalise the scores between 0 and 1.
             debug (bool): Whether to report repeated errors in the log.
+            concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+                adapting the number of concurrent judge model calls, shared by
+                all created scorers. If `None`, the concurrency is only limited
+                by the model `max_connections`.
         """
         self.name = name
         self.prompt_template = prompt_template
@@ -207,6 +232,7 @@ class GEvalScorerFactory(ScorerFactory):
         self.max_score = max_score
         self.normalise = normalise
         self.debug = debug
+        self.concurrency_limiter = concurrency_limiter
 
     @override
     def create_scorer(self, model: Model) -> Scorer:
@@ -231,6 +257,7 @@ class GEvalScorerFactory(ScorerFactory):
                 max_score=self.max_score,
                 normalise=self.normalise,
                 debug=self.debug,
+                concurrency_limiter=self.concurrency_limiter,
             )
 
             async def score(state: TaskState, target: Target):
@@ -245,6 +272,46 @@ class GEvalScorerFactory(ScorerFactory):
 
         return g_eval_scorer()
 
+    @override
+    def estimate_calls(
+        self,
+        *,
+        prediction: str,
+        count_tokens: Callable[[str], int],
+        input: str | None = None,
+        reference: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> CallEstimate:
+        """Estimates the LLM calls made by G-Eval for a single sample.
+
+        G-Eval makes a single call per sample, to which the judge model is
+        expected to respond with a short numerical score.
+
+        Args:
+            prediction (str): The (expected) model output to evaluate.
+            count_tokens (Callable[[str], int]): A function counting the tokens
+                in a text for the evaluation model.
+            input (str | None): The input text for the model. Defaults to `None`.
+            reference (str | None): The reference text for the model. Defaults to `None`.
+            metadata (dict[str, Any] | None): Additional metadata for the evaluation.
+                Defaults to `None`.
+
+        Returns:
+            CallEstimate: The estimated LLM calls for the sample.
+        """
+        llm_input = format_template(
+            self.prompt_template,
+            prediction=prediction,
+            reference=reference,
+            input=input,
+            **(metadata or {}),
+        )
+        return CallEstimate(
+            calls=1,
+            input_tokens=count_tokens(llm_input),
+            output_tokens=_ESTIMATED_SCORE_TOKENS,
+        )
+
 
 def get_g_eval_evaluator(
     *,
@@ -262,6 +329,7 @@ def get_g_eval_evaluator(
     max_score: int = 10,
     normalise: bool = True,
     debug: bool = False,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> Evaluator:
     """
     Constructs a G-Eval evaluator that can be used in EvalSense evaluation pipeline.
@@ -288,6 +356,10 @@ def get_g_eval_evaluator(
         max_score (int): The maximum valid score.
         normalise (bool): Whether to normalise the scores between 0 and 1.
         debug (bool): Whether to report repeated errors in the log.
+        concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+            adapting the number of concurrent judge model calls. The current
+            limit is recorded in the metadata of each score. If `None`, the
+            concurrency is only limited by the model `max_connections`.
 
     Returns:
         Evaluator: The constructed G-Eval evaluator.
@@ -305,6 +377,7 @@ def get_g_eval_evaluator(
             max_score=max_score,
             normalise=normalise,
             debug=debug,
+            concurrency_limiter=concurrency_limiter,
         ),
         model_config=model_config,
     )
@@ -1,7 +1,7 @@
 from abc import abstractmethod
-from typing import Any, Literal, Protocol, override
+from typing import Any, Callable, Literal, Protocol, override
 
-from inspect_ai.model import GenerateConfig, Model
+from inspect_ai.model import GenerateConfig, Model, ModelOutput
 from inspect_ai.scorer import (
     Metric,
     Score,
@@ -13,6 +13,9 @@ from inspect_ai.scorer import (
 from inspect_ai.solver import TaskState
 
 from evalsense.evaluation import (
+    AdaptiveConcurrencyLimiter,
+    CallEstimate,
+    CallEstimator,
     Evaluator,
     ScoreCalculator,
     ScorerFactory,
@@ -217,6 +220,7 @@ class QagsScoreCalculator(ScoreCalculator):
         config: QagsConfig,
         name: str = "QAGS",
         debug: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         """
         Initializes the QAGS score calculator.
@@ -226,10 +230,14 @@ class QagsScoreCalculator(ScoreCalculator):
             config (QagsConfig): The configuration for the QAGS score calculator.
             name (str): The name of the score calculator. Defaults to "QAGS".
             debug (bool): Whether to report repeated errors in the log.
+            concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+                adapting the number of concurrent judge model calls. If `None`,
+                the concurrency is only limited by the model `max_connections`.
         """
         self.model = model
         self.config = config
         self.name = name
+        self.concurrency_limiter = concurrency_limiter
         self.warned_weighted_answer = False
 
     @property
@@ -242,6 +250,20 @@ class QagsScoreCalculator(ScoreCalculator):
             )
         return GenerateConfig()
 
+    async def _generate(self, prompt: str, config: GenerateConfig) -> ModelOutput:
+        """Generates the judge model output for a prompt.
+
+        Args:
+            prompt (str): The prompt for the model.
+            config (GenerateConfig): The generation configuration.
+
+        Returns:
+            ModelOutput: The model output.
+        """
+        if self.concurrency_limiter is None:
+            return await self.model.generate(prompt, config=config)
+        return await self.concurrency_limiter.generate(self.model, prompt, config)
+
     @override
     def calculate(
         self,
@@ -300,7 +322,7 @@ class QagsScoreCalculator(ScoreCalculator):
         # We don't actually need the logprobs until comparing the answers,
         # but the vLLM provider uses the config from the first sample in the batch
         # so we need to use consistent config for all samples.
-        prediction_questions_output = await self.model.generate(
+        prediction_questions_output = await self._generate(
             prediction_questions_prompt, config=self.generate_config
         )
         prediction_questions = extract_lines(
@@ -316,7 +338,7 @@ class QagsScoreCalculator(ScoreCalculator):
             reference=reference,
             metadata=metadata,
         )
-        reference_questions_output = await self.model.generate(
+        reference_questions_output = await self._generate(
             reference_questions_prompt, config=self.generate_config
         )
         reference_questions = extract_lines(
@@ -381,7 +403,7 @@ class QagsScoreCalculator(ScoreCalculator):
                 reference=reference,
                 metadata=metadata,
             )
-            prediction_answer_output = await self.model.generate(
+            prediction_answer_output = await self._generate(
                 prediction_answer_prompt, config=self.generate_config
             )
             prediction_answers.append(prediction_answer_output.completion)
@@ -394,7 +416,7 @@ class QagsScoreCalculator(ScoreCalculator):
                 reference=reference,
                 metadata=metadata,
             )
-            reference_answer_output = await self.model.generate(
+            reference_answer_output = await self._generate(
                 reference_answer_prompt, config=self.generate_config
             )
             reference_answers.append(reference_answer_output.completion)
@@ -622,7 +644,7 @@ class QagsScoreCalculator(ScoreCalculator):
                 reference=reference,
                 metadata=metadata,
             )
-            answer_comparison_output = await self.model.generate(
+            answer_comparison_output = await self._generate(
                 answer_comparison_prompt, config=self.generate_config
             )
             answer_comparison = float(
@@ -754,6 +776,8 @@ class QagsScoreCalculator(ScoreCalculator):
             reference=reference,
             metadata=metadata,
         )
+        if self.concurrency_limiter is not None:
+            score_metadata["concurrency_limit"] = self.concurrency_limiter.limit
 
         match self.config.answer_comparison_mode:
             case "ternary":
@@ -790,7 +814,7 @@ class QagsScoreCalculator(ScoreCalculator):
                 )
 
 
-class QagsScorerFactory(ScorerFactory):
+class QagsScorerFactory(ScorerFactory, CallEstimator):
     """Scorer factory for QAGS."""
 
     def __init__(
@@ -800,6 +824,7 @@ class QagsScorerFactory(ScorerFactory):
         metrics: list[Metric | dict[str, list[Metric]]]
         | dict[str, list[Metric]]
         | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         """
         Initialize the QAGS scorer factory.
@@ -809,9 +834,14 @@ class QagsScorerFactory(ScorerFactory):
             metrics (list[Metric | dict[str, list[Metric]]] | dict[str, list[Metric]] | None):
                 The metrics to use for the evaluation. If `None`, the default metric
                 will be used (G-Eval).
+            concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+                adapting the number of concurrent judge model calls, shared by
+                all created scorers. If `None`, the concurrency is only limited
+                by the model `max_connections`.
         """
         self.name = name
         self.config = config
+        self.concurrency_limiter = concurrency_limiter
         if metrics is None:
             if self.config.answer_comparison_mode == "ternary":
                 metrics = [
@@ -843,6 +873,7 @@ class QagsScorerFactory(ScorerFactory):
                 model=model,
                 config=self.config,
                 name=self.name,
+                concurrency_limiter=self.concurrency_limiter,
             )
 
             async def score(state: TaskState, target: Target):
@@ -857,6 +888,101 @@ class QagsScorerFactory(ScorerFactory):
 
         return qags_scorer()
 
+    @override
+    def estimate_calls(
+        self,
+        *,
+        prediction: str,
+        count_tokens: Callable[[str], int],
+        input: str | None = None,
+        reference: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        questions_per_source: int = 5,
+        question_tokens: int = 20,
+        answer_tokens: int = 10,
+    ) -> CallEstimate:
+        """Estimates the LLM calls made by QAGS for a single sample.
+
+        QAGS makes two question generation calls (one for the model output and
+        one for the reference) and two answer generation calls per generated
+        question. In "judge" mode, it also makes one answer comparison call per
+        question. As the questions are not known in advance, their number and
+        length are estimated.
+
+        Args:
+            prediction (str): The (expected) model output to evaluate.
+            count_tokens (Callable[[str], int]): A function counting the tokens
+                in a text for the evaluation model.
+            input (str, optional): The input to the model. Optional.
+            reference (str, optional): The reference output to compare against.
+                Optional.
+            metadata (dict[str, Any], optional): Additional Inspect AI sample/task
+                state metadata. Optional.
+            questions_per_source (int): The expected number of questions generated
+                from each source. Defaults to 5.
+            question_tokens (int): The expected number of tokens in a question.
+                Defaults to 20.
+            answer_tokens (int): The expected number of tokens in an answer.
+                Defaults to 10.
+
+        Returns:
+            CallEstimate: The estimated LLM calls for the sample.
+        """
+        num_questions = 2 * questions_per_source
+        estimate = CallEstimate()
+        for source in ("prediction", "reference"):
+            question_prompt = self.config.get_question_generation_prompt(
+                source=source,
+                prediction=prediction,
+                input=input,
+                reference=reference,
+                metadata=metadata,
+            )
+            estimate += CallEstimate(
+                calls=1,
+                input_tokens=count_tokens(question_prompt),
+                output_tokens=questions_per_source * question_tokens,
+            )
+
+            # The prompt is counted without the question, whose length is estimated
+            answer_prompt = self.config.get_answer_generation_prompt(
+                source=source,
+                question="",
+                prediction=prediction,
+                input=input,
+                reference=reference,
+                metadata=metadata,
+            )
+            estimate += CallEstimate(
+                calls=num_questions,
+                input_tokens=num_questions
+                * (count_tokens(answer_prompt) + question_tokens),
+                output_tokens=num_questions * answer_tokens,
+            )
+
+        if self.config.answer_comparison_mode == "judge":
+            comparison_prompt = self.config.get_answer_comparison_prompt(
+                question="",
+                prediction_answer="",
+                reference_answer="",
+                input=input,
+                prediction=prediction,
+                reference=reference,
+                metadata=metadata,
+            )
+            estimate += CallEstimate(
+                calls=num_questions,
+                input_tokens=num_questions
+                * (
+                    count_tokens(comparison_prompt)
+                    + question_tokens
+                    + 2 * answer_tokens
+                ),
+                # The judge is expected to respond with a binary answer
+                output_tokens=num_questions,
+            )
+        return estimate
+
 
 def get_qags_evaluator(
     *,
@@ -867,6 +993,7 @@ def get_qags_evaluator(
     | dict[str, list[Metric]]
     | None = None,
     model_config: ModelConfig,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
 ) -> Evaluator:
     """
     Constructs a QAGS evaluator that can be used in EvalSense evaluation pipeline.
@@ -881,6 +1008,10 @@ def get_qags_evaluator(
             will be used (QAGS precision, recall and F1).
         model_config (ModelConfig): The configuration of the model to be used
             for evaluation.
+        concurrency_limiter (AdaptiveConcurrencyLimiter | None): The limiter
+            adapting the number of concurrent judge model calls. The current
+            limit is recorded in the metadata of each score. If `None`, the
+            concurrency is only limited by the model `max_connections`.
 
     Returns:
         Evaluator: The constructed QAGS evaluator.
@@ -892,6 +1023,7 @@ def get_qags_evaluator(
             name=metric_name,
             config=config,
             metrics=metrics,
+            concurrency_limiter=concurrency_limiter,
         ),
         model_config=model_config,
     )
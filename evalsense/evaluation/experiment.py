@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from functools import total_ordering
-from typing import Literal
+from typing import Any, Literal
 
 from inspect_ai.dataset import FieldSpec, RecordToSample
 from pydantic import BaseModel
@@ -27,11 +27,18 @@ class ResultRecord(BaseModel, frozen=True):
         status (RecordStatus): The status of the record.
         error_message (str | None): The error message, if any.
         log_location (str | None): The location of the associated Inspect log file.
+        subsample (dict[str, Any] | None): The selection parameters of the dataset
+            subsample the result was produced on, or None if the result covers
+            the full dataset.
+        partial (bool): Whether only a part of the samples was scored, e.g., when
+            the evaluation stopped early. Defaults to False.
     """
 
     status: RecordStatus = "started"
     error_message: str | None = None
     log_location: str | None = None
+    subsample: dict[str, Any] | None = None
+    partial: bool = False
 
 
 @total_ordering
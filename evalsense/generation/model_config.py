@@ -6,6 +6,9 @@ from typing import Any
 from pydantic import BaseModel
 
 from inspect_ai.model import GenerateConfigArgs, Model
+from inspect_ai.util import registry_info
+
+from evalsense.constants import LOCAL_MODEL_PROVIDERS, LOCAL_SERVER_MODEL_PROVIDERS
 
 
 @total_ordering
@@ -81,6 +84,34 @@ class ModelConfig:
             return self.model
         return self.model.name
 
+    @property
+    def provider(self) -> str:
+        """Returns the name of the model provider, or an empty string if the
+        provider of a model instance is unknown."""
+        if isinstance(self.model, str):
+            return self.model.split("/", 1)[0]
+        try:
+            return registry_info(self.model.api).name.split("/", 1)[-1]
+        except ValueError:
+            return ""
+
+    @property
+    def is_local(self) -> bool:
+        """Returns whether the model runs on the local machine.
+
+        Models served by a local inference server are considered remote when
+        connecting to an existing server through an explicit `base_url`. Model
+        instances with an unknown provider are considered local.
+        """
+        if isinstance(self.model, Model) and not self.provider:
+            return True
+        if self.provider not in LOCAL_MODEL_PROVIDERS:
+            return False
+        return not (
+            self.provider in LOCAL_SERVER_MODEL_PROVIDERS
+            and "base_url" in self.model_args
+        )
+
     @property
     def record(self) -> ModelRecord:
         """Returns a record of the model configuration."""
@@ -1,7 +1,15 @@
 from evalsense.tasks.task_preprocessor import (
+    META_SAMPLE_ID_FIELD,
     DefaultTaskPreprocessor,
+    MetaTierTaskPreprocessor,
     TaskPreprocessingFunction,
     TaskPreprocessor,
 )
 
-__all__ = ["DefaultTaskPreprocessor", "TaskPreprocessingFunction", "TaskPreprocessor"]
+__all__ = [
+    "META_SAMPLE_ID_FIELD",
+    "DefaultTaskPreprocessor",
+    "MetaTierTaskPreprocessor",
+    "TaskPreprocessingFunction",
+    "TaskPreprocessor",
+]
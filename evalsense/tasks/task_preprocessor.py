@@ -1,13 +1,21 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 import datasets
-from inspect_ai.dataset import Dataset, FieldSpec, RecordToSample, json_dataset
+from inspect_ai.dataset import (
+    Dataset,
+    FieldSpec,
+    MemoryDataset,
+    RecordToSample,
+    json_dataset,
+)
 
 from evalsense.datasets.dataset_manager import DatasetManager
 from evalsense.utils.huggingface import disable_dataset_progress_bars
 from evalsense.utils.files import to_safe_filename
 
+META_SAMPLE_ID_FIELD = "meta_sample_id"
+
 
 class TaskPreprocessingFunction(Protocol):
     """A protocol for a function that preprocesses datasets.
@@ -110,3 +118,99 @@ class DefaultTaskPreprocessor(TaskPreprocessor):
             name=name,
             preprocessing_function=default_task_preprocessing_function,
         )
+
+
+class MetaTierTaskPreprocessor(TaskPreprocessor):
+    """A task preprocessor expanding each sample into a variant per meta tier.
+
+    This allows generating all meta tiers of a meta-evaluation (e.g., the
+    progressive perturbation tiers) in a single task, tracked as a single
+    experiment in the project, instead of running a separate task per tier.
+    The tier of each variant is stored in the sample metadata together with
+    the tier-specific metadata values, which can be referenced from the
+    prompt templates of the generation steps (e.g., `system_message` or
+    `prompt_template`). The ID of the original sample is stored in the
+    `meta_sample_id` metadata field, which is used by `MetaResultAnalyser`
+    to group the variants.
+    """
+
+    def __init__(
+        self,
+        tiers: list[dict[str, Any]],
+        name: str = "MetaTier",
+        preprocessing_function: TaskPreprocessingFunction = default_task_preprocessing_function,
+        tier_field: str = "perturbation_tier",
+    ) -> None:
+        """Initializes the meta-tier task preprocessor.
+
+        Args:
+            tiers (list[dict[str, Any]]): The metadata values specific to each
+                meta tier, added to the metadata of the corresponding variants.
+                The tiers are numbered in the list order, starting from 0.
+            name (str): The name of the task preprocessor. Defaults to "MetaTier".
+            preprocessing_function (TaskPreprocessingFunction): The function used
+                to preprocess the dataset before expanding the samples. Defaults
+                to a function returning the dataset unchanged.
+            tier_field (str): The metadata field storing the tier of each variant.
+                Defaults to "perturbation_tier".
+
+        Raises:
+            ValueError: If no tiers are given.
+        """
+        if not tiers:
+            raise ValueError("At least one meta tier must be given.")
+        super().__init__(name=name, preprocessing_function=preprocessing_function)
+        self.tiers = tiers
+        self.tier_field = tier_field
+
+    def __call__(
+        self,
+        hf_dataset: datasets.Dataset,
+        dataset_manager: DatasetManager,
+        field_spec: FieldSpec | RecordToSample | None = None,
+        force_reprocess: bool = False,
+    ) -> Dataset:
+        """Preprocesses the input dataset and expands each sample into a variant
+        per meta tier.
+
+        Args:
+            hf_dataset (datasets.Dataset): The input dataset to preprocess,
+                in HuggingFace format.
+            dataset_manager (DatasetManager): The dataset manager used to
+                retrieve the dataset.
+            field_spec (FieldSpec): Specification mapping dataset fields to
+                sample fields. See Inspect AI documentation for more details.
+            force_reprocess (bool): Whether to force reprocess the dataset
+                even if it already exists. Defaults to False.
+
+        Returns:
+            (Dataset): The preprocessed dataset, with the variants of each
+                sample placed consecutively.
+        """
+        dataset = super().__call__(
+            hf_dataset, dataset_manager, field_spec, force_reprocess
+        )
+        samples = []
+        for index, sample in enumerate(dataset, start=1):
+            sample_id = sample.id if sample.id is not None else index
+            for tier, tier_metadata in enumerate(self.tiers):
+                samples.append(
+                    sample.model_copy(
+                        update={
+                            "id": f"{sample_id}-tier-{tier}",
+                            "metadata": (sample.metadata or {})
+                            | tier_metadata
+                            | {
+                                self.tier_field: tier,
+                                META_SAMPLE_ID_FIELD: sample_id,
+                            },
+                        },
+                        deep=True,
+                    )
+                )
+        return MemoryDataset(
+            samples=samples,
+            name=dataset.name,
+            location=dataset.location,
+            shuffled=dataset.shuffled,
+        )
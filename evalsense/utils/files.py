@@ -26,6 +26,23 @@ def to_safe_filename(name: str) -> str:
     return name
 
 
+def get_file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Returns a signature identifying the current version of a file.
+
+    Args:
+        path (Path): The path to the file.
+
+    Returns:
+        tuple[int, int, int] | None: The inode, modification time and size of
+            the file, or None if the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
 def get_remote_file_headers(
     url: str, max_attempts: int = 2
 ) -> CaseInsensitiveDict[str]:
@@ -1,10 +1,24 @@
 from contextlib import contextmanager
+from pathlib import Path
 
 from datasets import (
     disable_progress_bars,
     enable_progress_bars,
     are_progress_bars_disabled,
 )
+from huggingface_hub import list_repo_files, snapshot_download
+
+# Model files not needed for loading the models with transformers or vLLM
+_PREFETCH_IGNORE_PATTERNS = [
+    "*.pt",
+    "*.pth",
+    "*.gguf",
+    "*.onnx",
+    "*.msgpack",
+    "*.h5",
+    "*.ot",
+    "original/*",
+]
 
 
 @contextmanager
@@ -18,3 +32,75 @@ def disable_dataset_progress_bars():
     finally:
         if progress_bars_enabled:
             enable_progress_bars()
+
+
+def warm_page_cache(path: str | Path, chunk_size: int = 16 * 1024 * 1024) -> int:
+    """Reads all files under a path, loading them into the page cache of the
+    operating system, so that they can be read quickly afterwards.
+
+    Args:
+        path (str | Path): The path to a file or directory.
+        chunk_size (int): The size of the chunks to read, in bytes. Defaults
+            to 16 MiB.
+
+    Returns:
+        int: The total number of bytes read.
+    """
+    path = Path(path)
+    files = [path] if path.is_file() else sorted(p for p in path.rglob("*"))
+    total_bytes = 0
+    for file in files:
+        if not file.is_file():
+            continue
+        with open(file, "rb", buffering=0) as f:
+            while chunk := f.read(chunk_size):
+                total_bytes += len(chunk)
+    return total_bytes
+
+
+def prefetch_model_files(
+    model_name_or_path: str,
+    revision: str | None = None,
+    cache_dir: str | None = None,
+    warm_cache: bool = True,
+) -> Path:
+    """Downloads the files of a Hugging Face model and loads them into the page
+    cache of the operating system, so that the model can be loaded quickly.
+
+    Model weights in the safetensors format are preferred to the weights in the
+    PyTorch format, if both are available.
+
+    Args:
+        model_name_or_path (str): The name of the model on the Hugging Face Hub,
+            or a path to a local directory with the model files.
+        revision (str, optional): The revision of the model to download.
+            Defaults to None (the main branch).
+        cache_dir (str, optional): The directory in which to cache the model
+            files. Defaults to None (the default Hugging Face cache).
+        warm_cache (bool): Whether to load the model files into the page cache.
+            Defaults to True.
+
+    Returns:
+        Path: The path to the directory with the model files.
+    """
+    model_path = Path(model_name_or_path)
+    if not model_path.exists():
+        ignore_patterns = list(_PREFETCH_IGNORE_PATTERNS)
+        try:
+            repo_files = list_repo_files(model_name_or_path, revision=revision)
+        except Exception:
+            # E.g., when running in offline mode
+            repo_files = []
+        if any(file.endswith(".safetensors") for file in repo_files):
+            ignore_patterns.append("*.bin")
+        model_path = Path(
+            snapshot_download(
+                model_name_or_path,
+                revision=revision,
+                cache_dir=cache_dir,
+                ignore_patterns=ignore_patterns,
+            )
+        )
+    if warm_cache:
+        warm_page_cache(model_path)
+    return model_path
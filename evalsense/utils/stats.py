@@ -0,0 +1,61 @@
+from statistics import NormalDist
+from typing import Sequence
+
+import numpy as np
+
+
+def normal_confidence_interval(
+    values: Sequence[float],
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """Computes a normal-approximation confidence interval for the mean.
+
+    Args:
+        values (Sequence[float]): The sample values. At least two values are
+            required.
+        confidence (float): The confidence level. Defaults to 0.95.
+
+    Raises:
+        ValueError: If fewer than two values are given.
+
+    Returns:
+        tuple[float, float]: The lower and upper bounds of the interval.
+    """
+    data = np.asarray(values, dtype=float)
+    if len(data) < 2:
+        raise ValueError("At least two values are required for a confidence interval.")
+    mean = data.mean()
+    standard_error = data.std(ddof=1) / np.sqrt(len(data))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return float(mean - z * standard_error), float(mean + z * standard_error)
+
+
+def bootstrap_confidence_interval(
+    values: Sequence[float],
+    confidence: float = 0.95,
+    num_resamples: int = 1000,
+    seed: int | None = None,
+) -> tuple[float, float]:
+    """Computes a percentile bootstrap confidence interval for the mean.
+
+    Args:
+        values (Sequence[float]): The sample values. At least two values are
+            required.
+        confidence (float): The confidence level. Defaults to 0.95.
+        num_resamples (int): The number of bootstrap resamples. Defaults to 1000.
+        seed (int | None): The random seed for the resampling. Defaults to None.
+
+    Raises:
+        ValueError: If fewer than two values are given.
+
+    Returns:
+        tuple[float, float]: The lower and upper bounds of the interval.
+    """
+    data = np.asarray(values, dtype=float)
+    if len(data) < 2:
+        raise ValueError("At least two values are required for a confidence interval.")
+    rng = np.random.default_rng(seed)
+    resampled_means = rng.choice(data, size=(num_resamples, len(data))).mean(axis=1)
+    alpha = 1 - confidence
+    lower, upper = np.quantile(resampled_means, [alpha / 2, 1 - alpha / 2])
+    return float(lower), float(upper)
@@ -0,0 +1,98 @@
+import functools
+import math
+from typing import Callable
+
+from evalsense.constants import HF_HUB_MODEL_PROVIDERS
+from evalsense.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rough number of characters per token for English text
+_CHARS_PER_TOKEN = 4
+_DEFAULT_TIKTOKEN_ENCODING = "o200k_base"
+
+
+def count_tokens_approximately(text: str) -> int:
+    """Approximates the number of tokens in a text based on its length.
+
+    Args:
+        text (str): The text to count the tokens in.
+
+    Returns:
+        int: The approximate number of tokens.
+    """
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+def _get_hf_token_counter(model_name: str) -> Callable[[str], int] | None:
+    """Returns a token counter using a locally cached Hugging Face tokenizer.
+
+    Args:
+        model_name (str): The name of the model on Hugging Face Hub.
+
+    Returns:
+        Callable[[str], int] | None: The token counter, or None if the tokenizer
+            is not available locally.
+    """
+    try:
+        from transformers import AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+    except Exception:
+        return None
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+
+
+def _get_tiktoken_token_counter(model_name: str) -> Callable[[str], int] | None:
+    """Returns a token counter using a tiktoken encoding.
+
+    The encoding for the model is used if known, otherwise a generic encoding
+    is used as an approximation.
+
+    Args:
+        model_name (str): The name of the model.
+
+    Returns:
+        Callable[[str], int] | None: The token counter, or None if the encoding
+            is not available.
+    """
+    try:
+        import tiktoken
+
+        try:
+            encoding = tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            encoding = tiktoken.get_encoding(_DEFAULT_TIKTOKEN_ENCODING)
+    except Exception:
+        return None
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+@functools.cache
+def get_token_counter(model_name: str) -> Callable[[str], int]:
+    """Returns a function counting the tokens in a text for a given model.
+
+    A locally cached Hugging Face tokenizer is used for models loaded from
+    Hugging Face Hub, falling back to a tiktoken encoding and finally to
+    an approximation based on the text length.
+
+    Args:
+        model_name (str): The name of the model, including the provider prefix
+            (e.g., `"openai/gpt-4o"` or `"hf/meta-llama/Llama-3.1-8B-Instruct"`).
+
+    Returns:
+        Callable[[str], int]: The token counter.
+    """
+    provider, _, name = model_name.partition("/")
+    token_counter = None
+    if provider in HF_HUB_MODEL_PROVIDERS:
+        token_counter = _get_hf_token_counter(name)
+    if token_counter is None:
+        token_counter = _get_tiktoken_token_counter(name or provider)
+    if token_counter is None:
+        logger.warning(
+            f"⚠️  No tokenizer available for {model_name} — approximating "
+            "the token counts based on the text length."
+        )
+        token_counter = count_tokens_approximately
+    return token_counter
@@ -14,37 +14,38 @@ from evalsense.workflow.analysers.meta_result_analyser import MetaResultAnalyser
 def load_project(project_name: str, is_meta_eval: bool):
     """Loads the project and returns the summary results and correlation plot."""
     try:
-        project = Project(project_name)
+        with Project(project_name) as project:
+            if is_meta_eval:
+                tabular_analyser = MetaResultAnalyser[pd.DataFrame](
+                    output_format="pandas"
+                )
+                summary_results = tabular_analyser(
+                    project,
+                    meta_tier_field="perturbation_tier",
+                    lower_tier_is_better=True,
+                )
+                summary_results.sort_values(
+                    by=["avg_correlation"], inplace=True, ascending=False
+                )
+                plot = None
+            else:
+                tabular_analyser = TabularResultAnalyser[pd.DataFrame](
+                    output_format="pandas"
+                )
+                summary_results = tabular_analyser(project)
+                summary_results.sort_values(
+                    by="model", inplace=True, key=lambda col: col.str.lower()
+                )
+                summary_results = summary_results.round(2)
 
-        if is_meta_eval:
-            tabular_analyser = MetaResultAnalyser[pd.DataFrame](output_format="pandas")
-            summary_results = tabular_analyser(
-                project,
-                meta_tier_field="perturbation_tier",
-                lower_tier_is_better=True,
-            )
-            summary_results.sort_values(
-                by=["avg_correlation"], inplace=True, ascending=False
-            )
-            plot = None
-        else:
-            tabular_analyser = TabularResultAnalyser[pd.DataFrame](
-                output_format="pandas"
-            )
-            summary_results = tabular_analyser(project)
-            summary_results.sort_values(
-                by="model", inplace=True, key=lambda col: col.str.lower()
-            )
-            summary_results = summary_results.round(2)
-
-            correlation_analyser = MetricCorrelationAnalyser[
-                CorrelationResults[pd.DataFrame]
-            ](output_format="pandas")
-            correlation_results = correlation_analyser(
-                project, return_plot=True, figsize=(9, 7)
-            )
-            plot = correlation_results.figure
-            assert plot, "Correlation plot cannot be None"
+                correlation_analyser = MetricCorrelationAnalyser[
+                    CorrelationResults[pd.DataFrame]
+                ](output_format="pandas")
+                correlation_results = correlation_analyser(
+                    project, return_plot=True, figsize=(9, 7)
+                )
+                plot = correlation_results.figure
+                assert plot, "Correlation plot cannot be None"
     except Exception as e:
         raise gr.Error(f"Error loading results: {type(e).__name__}: {e}")
 
@@ -1,6 +1,4 @@
-from typing import Any
-
-from inspect_ai.dataset import FieldSpec, Sample
+from inspect_ai.dataset import FieldSpec
 from inspect_ai.model import GenerateConfigArgs
 from inspect_ai.solver import generate, prompt_template, system_message
 
@@ -11,7 +9,7 @@ from evalsense.evaluation import (
     TaskConfig,
 )
 from evalsense.generation import ModelConfig, GenerationSteps
-from evalsense.tasks.task_preprocessor import DefaultTaskPreprocessor
+from evalsense.tasks import MetaTierTaskPreprocessor
 from evalsense.webui.configurators import EvaluatorConfigurator
 from evalsense.webui.state import AppState
 from evalsense.workflow import Pipeline, Project
@@ -103,9 +101,9 @@ def execute_standard_evaluation(state: AppState):
     experiment_config = ExperimentBatchConfig(
         tasks=[task_config], model_configs=model_configs, evaluators=evaluators
     )
-    project = Project(name=state["project_name"])
-    pipeline = Pipeline(experiments=experiment_config, project=project)
-    pipeline.run()
+    with Project(name=state["project_name"]) as project:
+        pipeline = Pipeline(experiments=experiment_config, project=project)
+        pipeline.run()
 
 
 def execute_meta_evaluation(state: AppState):
@@ -116,57 +114,48 @@ def execute_meta_evaluation(state: AppState):
     """
     dataset_manager = get_dataset_manager(state)
 
-    tasks = []
-    for tier_id, perturbation_tier_subprompt in enumerate(
-        state["perturbation_tier_subprompts"]
-    ):
-        system_prompt = state["system_prompt"].replace(
-            "{perturbation_tier_subprompt}", perturbation_tier_subprompt
-        )
-        user_prompt = state["user_prompt"].replace(
-            "{perturbation_tier_subprompt}", perturbation_tier_subprompt
-        )
-        generation_steps = GenerationSteps(
-            name=f"{state['generation_steps_name']} (Tier {tier_id + 1})",
-            steps=[
-                system_message(system_prompt),
-                prompt_template(user_prompt),
-                generate(),
-            ],
-        )
-
-        # We use a RecordToSample function to add the perturbation tier
-        # to the metadata
-        def perturbation_record_to_sample(
-            record: dict[str, Any],
-            tier_id: int = tier_id,
-        ) -> Sample:
-            return Sample(
-                input=record[state["input_field_name"]],
-                target=record.get(state["target_field_name"], ""),
-                choices=record.get(state["choices_field_name"]),
-                id=record.get(state["id_field_name"]),
-                metadata={k: record[k] for k in state["metadata_fields"]}
-                | {"perturbation_tier": tier_id},
-            )
-
-        perturb_task_preprocessor = DefaultTaskPreprocessor(name="Perturbation")
-        task_config = TaskConfig(
+    # All perturbation tiers are generated in a single task, with the
+    # tier-specific subprompt substituted from the sample metadata
+    generation_steps = GenerationSteps(
+        name=state["generation_steps_name"],
+        steps=[
+            system_message(state["system_prompt"]),
+            prompt_template(state["user_prompt"]),
+            generate(),
+        ],
+    )
+    field_spec = FieldSpec(
+        input=state["input_field_name"],
+        target=state["target_field_name"],
+        choices=state["choices_field_name"],
+        id=state["id_field_name"],
+        metadata=state["metadata_fields"],
+    )
+    perturb_task_preprocessor = MetaTierTaskPreprocessor(
+        tiers=[
+            {"perturbation_tier_subprompt": perturbation_tier_subprompt}
+            for perturbation_tier_subprompt in state["perturbation_tier_subprompts"]
+        ],
+        name="Perturbation",
+        tier_field="perturbation_tier",
+    )
+    tasks = [
+        TaskConfig(
             dataset_manager=dataset_manager,
             generation_steps=generation_steps,
-            field_spec=perturbation_record_to_sample,
+            field_spec=field_spec,
             task_preprocessor=perturb_task_preprocessor,
         )
-        tasks.append(task_config)
+    ]
 
     model_configs = get_model_configs(state)
     evaluators = get_evaluators(state)
     experiment_config = ExperimentBatchConfig(
         tasks=tasks, model_configs=model_configs, evaluators=evaluators
     )
-    project = Project(name=state["project_name"])
-    pipeline = Pipeline(experiments=experiment_config, project=project)
-    pipeline.run()
+    with Project(name=state["project_name"]) as project:
+        pipeline = Pipeline(experiments=experiment_config, project=project)
+        pipeline.run()
 
 
 def execute_evaluation(state: AppState):
@@ -1,9 +1,20 @@
+from evalsense.workflow.early_stopping import EarlyStoppingConfig
 from evalsense.workflow.pipeline import Pipeline
 from evalsense.workflow.project import Project
 from evalsense.workflow.result_analyser import ResultAnalyser
+from evalsense.workflow.scheduling import ExecutionPlan, PlanStep
+from evalsense.workflow.sharding import slurm_array_shard
+from evalsense.workflow.subsampling import SubsampleConfig
+from evalsense.workflow.telemetry import TimingSpan
 
 __all__ = [
+    "EarlyStoppingConfig",
+    "ExecutionPlan",
     "Pipeline",
+    "PlanStep",
     "Project",
     "ResultAnalyser",
+    "slurm_array_shard",
+    "SubsampleConfig",
+    "TimingSpan",
 ]
@@ -7,7 +7,9 @@ import polars as pl
 from scipy.stats import spearmanr
 
 from evalsense.evaluation import MetaTierGroupedRecord
+from evalsense.tasks import META_SAMPLE_ID_FIELD
 from evalsense.workflow import Project, ResultAnalyser
+from evalsense.workflow.project import TRANSCRIPT_SAMPLE_FIELDS
 
 OUTPUT_FORMATTERS = {
     "polars": lambda df: df,
@@ -22,6 +24,12 @@ class MetaResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
     the meta tiers and the scores returned by the evaluation methods.
     The meta tiers can either be sourced from human annotations or be based on
     progressive perturbations for automatic meta-evaluation.
+
+    The meta tiers of a sample can either be generated in separate experiments
+    (with the same sample IDs) or as variants of the sample in a single
+    experiment (see `MetaTierTaskPreprocessor`), in which case the variants
+    are grouped by the original sample ID stored in the `meta_sample_id`
+    metadata field.
     """
 
     def __init__(
@@ -63,7 +71,9 @@ class MetaResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
         Returns:
             T: The analysed results in the specified output format.
         """
-        eval_logs = project.get_logs(type="evaluation", status="success")
+        eval_logs = project.iter_logs(
+            type="evaluation", status="success", header_only=True
+        )
 
         # Data structure for tracking the intermediate results
         # The nested dictionary is indexed by perturbation record → sample ID → perturbation tier
@@ -71,12 +81,11 @@ class MetaResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
             MetaTierGroupedRecord, dict[str | int, dict[int, float | int]]
         ] = defaultdict(lambda: defaultdict(dict))
 
-        for eval_record, log in eval_logs.items():
-            if not hasattr(log, "samples") or not log.samples:
-                continue
-
-            # Extract scores for the individual samples
-            for sample in log.samples:
+        for eval_record, _ in eval_logs:
+            # Stream the scores of the individual samples
+            for sample in project.iter_samples(
+                eval_record, exclude_fields=TRANSCRIPT_SAMPLE_FIELDS
+            ):
                 if not hasattr(sample, "scores") or not sample.scores:
                     continue
 
@@ -85,7 +94,7 @@ class MetaResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
                         f"Meta tier field '{meta_tier_field}' not found in sample metadata."
                     )
                 meta_tier = int(cast(int, sample.metadata.get(meta_tier_field)))
-                sample_id = sample.id
+                sample_id = sample.metadata.get(META_SAMPLE_ID_FIELD, sample.id)
 
                 for metric_name, score in sample.scores.items():
                     if type(score.value) is float or type(score.value) is int:
@@ -110,7 +119,6 @@ class MetaResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
                                         inner_metric_name
                                     )
                                 ][sample_id][meta_tier] = inner_score
-            del log
 
         # For each metric, compute average spearman rank correlation between the
         # meta tiers and the scores
@@ -11,6 +11,7 @@ from matplotlib.figure import Figure
 import seaborn as sns
 
 from evalsense.workflow import Project, ResultAnalyser
+from evalsense.workflow.project import TRANSCRIPT_SAMPLE_FIELDS
 
 OUTPUT_FORMATTERS = {
     "polars": lambda df: df,
@@ -91,18 +92,19 @@ class MetricCorrelationAnalyser[T: CorrelationResults](ResultAnalyser[T]):
             T: The correlation results containing the correlation matrix and
                 optionally a visualization.
         """
-        eval_logs = project.get_logs(type="evaluation", status="success")
+        eval_logs = project.iter_logs(
+            type="evaluation", status="success", header_only=True
+        )
 
         result_data: dict[str, list[float | int]] = defaultdict(list)
-        for log in eval_logs.values():
-            if not hasattr(log, "samples") or not log.samples:
-                continue
-
+        for eval_record, _ in eval_logs:
             # Extract scores from individual samples
             sample_result_data: dict[str, list[tuple[str | int, float | int]]] = (
                 defaultdict(list)
             )
-            for sample in log.samples:
+            for sample in project.iter_samples(
+                eval_record, exclude_fields=TRANSCRIPT_SAMPLE_FIELDS
+            ):
                 if not hasattr(sample, "scores") or not sample.scores:
                     continue
 
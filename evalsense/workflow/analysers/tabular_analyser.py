@@ -55,10 +55,12 @@ class TabularResultAnalyser[T: pl.DataFrame | pd.DataFrame](ResultAnalyser[T]):
         Returns:
             T: The analysed results in the specified output format.
         """
-        eval_logs = project.get_logs(type="evaluation", status="success")
+        eval_logs = project.iter_logs(
+            type="evaluation", status="success", header_only=True
+        )
 
         result_data = []
-        for eval_record, log in eval_logs.items():
+        for eval_record, log in eval_logs:
             if not log.results:
                 continue
 
@@ -0,0 +1,195 @@
+import json
+import os
+from pathlib import Path
+
+from inspect_ai.scorer import Score, Scorer, Target
+from inspect_ai.scorer import scorer as inspect_scorer
+from inspect_ai.solver import TaskState
+from inspect_ai.util import registry_info
+
+from evalsense.logging import get_logger
+
+logger = get_logger(__name__)
+
+type SampleKey = tuple[str | int, int]
+
+
+class ScoreCheckpoint:
+    """A checkpoint of the sample scores produced by a scorer, allowing an
+    interrupted evaluation to resume without rescoring the scored samples.
+
+    The scores are stored in a JSON Lines file and flushed to disk periodically.
+    The first line of the file identifies the scored log, so that the scores are
+    discarded when the generations they were computed for are replaced. Without
+    a file, the scores are only kept in memory for reuse within the process.
+    """
+
+    def __init__(self, path: Path | None, log_id: str, flush_interval: int = 100):
+        """Initializes a score checkpoint, loading the previously saved scores.
+
+        Args:
+            path (Path | None): The path to the checkpoint file, or None to keep
+                the scores in memory only.
+            log_id (str): The ID of the scored log.
+            flush_interval (int): The number of new scores after which the
+                scores are flushed to disk. Defaults to 100.
+        """
+        self.path = path
+        self.log_id = log_id
+        self.flush_interval = flush_interval
+        self._scores: dict[SampleKey, Score] = {}
+        self._pending_scores: list[tuple[SampleKey, Score]] = []
+        self._load()
+
+    def __len__(self) -> int:
+        """Returns the number of scored samples in the checkpoint."""
+        return len(self._scores)
+
+    def _load(self):
+        """Loads the previously saved scores from the checkpoint file."""
+        if self.path is None or not self.path.exists():
+            return
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("log_id") != self.log_id:
+            logger.warning(
+                f"⚠️  Discarding stale score checkpoint {self.path} — the scored "
+                "generations have changed."
+            )
+            self.path.unlink()
+            return
+
+        corrupted = False
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+                self._scores[(entry["sample_id"], entry["epoch"])] = (
+                    Score.model_validate(entry["score"])
+                )
+            except (json.JSONDecodeError, KeyError, ValueError):
+                # The last line may have been partially written before a crash
+                corrupted = True
+        if corrupted:
+            self._rewrite()
+
+    def _rewrite(self):
+        """Rewrites the checkpoint file with the valid scores only."""
+        assert self.path is not None
+        temp_path = self.path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"log_id": self.log_id}) + "\n")
+            for key, score in self._scores.items():
+                f.write(self._format_entry(key, score))
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def _format_entry(key: SampleKey, score: Score) -> str:
+        """Formats a sample score as a line of the checkpoint file.
+
+        Args:
+            key (SampleKey): The ID and epoch of the sample.
+            score (Score): The sample score.
+
+        Returns:
+            str: The formatted line.
+        """
+        sample_id, epoch = key
+        return (
+            json.dumps(
+                {
+                    "sample_id": sample_id,
+                    "epoch": epoch,
+                    "score": score.model_dump(mode="json"),
+                }
+            )
+            + "\n"
+        )
+
+    def get(self, sample_id: str | int, epoch: int) -> Score | None:
+        """Returns the saved score for a sample, if any.
+
+        Args:
+            sample_id (str | int): The ID of the sample.
+            epoch (int): The epoch of the sample.
+
+        Returns:
+            Score | None: The saved score, or None if the sample is not scored.
+        """
+        return self._scores.get((sample_id, epoch))
+
+    def add(self, sample_id: str | int, epoch: int, score: Score):
+        """Adds a new sample score, flushing the scores to disk if needed.
+
+        Args:
+            sample_id (str | int): The ID of the sample.
+            epoch (int): The epoch of the sample.
+            score (Score): The sample score.
+        """
+        self._scores[(sample_id, epoch)] = score
+        self._pending_scores.append(((sample_id, epoch), score))
+        if len(self._pending_scores) >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Writes the new scores to disk."""
+        if self.path is None:
+            self._pending_scores.clear()
+            return
+        if not self._pending_scores:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new_file = not self.path.exists()
+        with self.path.open("a", encoding="utf-8") as f:
+            if is_new_file:
+                f.write(json.dumps({"log_id": self.log_id}) + "\n")
+            for key, score in self._pending_scores:
+                f.write(self._format_entry(key, score))
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending_scores.clear()
+
+    def remove(self):
+        """Removes the checkpoint, discarding all saved scores."""
+        self._scores.clear()
+        self._pending_scores.clear()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+def checkpointed_scorer(scorer: Scorer, checkpoint: ScoreCheckpoint) -> Scorer:
+    """Wraps a scorer to save the sample scores to a checkpoint and reuse the
+    scores already saved in the checkpoint.
+
+    The wrapped scorer keeps the name and metrics of the original scorer.
+
+    Args:
+        scorer (Scorer): The scorer to wrap.
+        checkpoint (ScoreCheckpoint): The checkpoint of the sample scores.
+
+    Returns:
+        Scorer: The wrapped scorer.
+    """
+
+    info = registry_info(scorer)
+    metadata = dict(info.metadata)
+    metrics = metadata.pop("metrics")
+
+    # The results are stored under the registered name without the package
+    # prefix, which is kept when registering the wrapper under that name
+    @inspect_scorer(metrics, name=info.name.split("/", 1)[-1], **metadata)
+    def checkpointed() -> Scorer:
+        async def score(state: TaskState, target: Target) -> Score | None:
+            saved_score = checkpoint.get(state.sample_id, state.epoch)
+            if saved_score is not None:
+                return saved_score
+            sample_score = await scorer(state, target)
+            if sample_score is not None:
+                checkpoint.add(state.sample_id, state.epoch, sample_score)
+            return sample_score
+
+        return score
+
+    return checkpointed()
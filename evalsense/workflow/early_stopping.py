@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+import math
+from typing import Iterable, Literal
+
+from inspect_ai.log import EvalSample
+from inspect_ai.scorer import Score, value_to_float
+from pydantic import BaseModel
+
+from evalsense.utils.stats import (
+    bootstrap_confidence_interval,
+    normal_confidence_interval,
+)
+
+_to_float = value_to_float()
+
+
+@dataclass
+class EarlyStoppingConfig:
+    """Configuration of the sequential early-stopping evaluation mode.
+
+    In this mode, the samples are scored in a random order, in batches, until
+    the confidence interval for the mean of the evaluator's primary score is
+    narrow enough or all samples are scored. The evaluation does not stop while
+    all scored samples have the same score, as the interval is degenerate in
+    that case. The records of evaluations stopped early are marked as partial.
+
+    Attributes:
+        max_ci_half_width (float): The maximum half-width of the confidence
+            interval at which the evaluation stops. Defaults to 0.01.
+        confidence (float): The confidence level of the interval. Defaults
+            to 0.95.
+        method (Literal["normal", "bootstrap"]): The method for computing the
+            confidence interval — either a normal approximation or a percentile
+            bootstrap. Defaults to "normal".
+        min_samples (int): The number of samples scored before checking the
+            interval for the first time. Defaults to 30.
+        batch_size (int): The number of samples scored between the subsequent
+            checks of the interval. Defaults to 50.
+        score_key (str | None): The key of the primary score for evaluators
+            returning multiple scores per sample (e.g., QAGS). Defaults to the
+            first key when None.
+        num_bootstrap_resamples (int): The number of resamples used by the
+            bootstrap method. Defaults to 1000.
+        seed (int): The random seed for ordering the samples and resampling.
+            Defaults to 0.
+    """
+
+    max_ci_half_width: float = 0.01
+    confidence: float = 0.95
+    method: Literal["normal", "bootstrap"] = "normal"
+    min_samples: int = 30
+    batch_size: int = 50
+    score_key: str | None = None
+    num_bootstrap_resamples: int = 1000
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.max_ci_half_width <= 0:
+            raise ValueError("The maximum interval half-width must be positive.")
+        if not 0 < self.confidence < 1:
+            raise ValueError("The confidence level must be between 0 and 1.")
+        if self.min_samples < 2:
+            raise ValueError("At least two samples must be scored before stopping.")
+        if self.batch_size < 1:
+            raise ValueError("The batch size must be positive.")
+
+    def confidence_interval(self, values: list[float]) -> tuple[float, float]:
+        """Computes the confidence interval for the mean of the score values.
+
+        Args:
+            values (list[float]): The score values. At least two values are
+                required.
+
+        Returns:
+            tuple[float, float]: The lower and upper bounds of the interval.
+        """
+        if self.method == "bootstrap":
+            return bootstrap_confidence_interval(
+                values,
+                confidence=self.confidence,
+                num_resamples=self.num_bootstrap_resamples,
+                seed=self.seed,
+            )
+        return normal_confidence_interval(values, confidence=self.confidence)
+
+
+class EarlyStoppingResult(BaseModel, frozen=True):
+    """The outcome of an evaluation in the early-stopping mode, stored in the
+    metadata of the evaluation log.
+
+    Attributes:
+        scored_samples (int): The number of scored samples.
+        total_samples (int): The total number of samples in the generation log.
+        mean (float | None): The mean of the primary score values, if any.
+        ci_lower (float | None): The lower bound of the confidence interval,
+            if computed.
+        ci_upper (float | None): The upper bound of the confidence interval,
+            if computed.
+        converged (bool): Whether the evaluation stopped because the interval
+            was narrow enough, rather than after scoring all samples.
+    """
+
+    scored_samples: int
+    total_samples: int
+    mean: float | None = None
+    ci_lower: float | None = None
+    ci_upper: float | None = None
+    converged: bool = False
+
+
+def _score_to_float(score: Score, score_key: str | None) -> float | None:
+    """Converts the primary value of a score to a float.
+
+    Args:
+        score (Score): The score.
+        score_key (str | None): The key of the primary value for scores with
+            multiple values, or None to use the first key.
+
+    Returns:
+        float | None: The primary score value, or None if it is missing or
+            not numeric.
+    """
+    value = score.value
+    if isinstance(value, dict):
+        if not value:
+            return None
+        value = value.get(score_key if score_key is not None else next(iter(value)))
+    if value is None or isinstance(value, (list, dict)):
+        return None
+    float_value = _to_float(value)
+    return float_value if math.isfinite(float_value) else None
+
+
+def get_primary_score_values(
+    samples: Iterable[EvalSample],
+    score_key: str | None = None,
+) -> list[float]:
+    """Extracts the primary score values from scored samples.
+
+    The first score of each sample is used, ignoring missing or non-numeric
+    values.
+
+    Args:
+        samples (Iterable[EvalSample]): The scored samples.
+        score_key (str | None): The key of the primary value for scores with
+            multiple values, or None to use the first key.
+
+    Returns:
+        list[float]: The primary score values.
+    """
+    values = []
+    for sample in samples:
+        if not sample.scores:
+            continue
+        value = _score_to_float(next(iter(sample.scores.values())), score_key)
+        if value is not None:
+            values.append(value)
+    return values
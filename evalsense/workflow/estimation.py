@@ -0,0 +1,128 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from inspect_ai.dataset import Sample
+from inspect_ai.log import EvalSample
+from inspect_ai.model import ChatMessage
+
+from evalsense.evaluation import CallEstimate, CallEstimator, Evaluator, ScorerFactory
+from evalsense.utils.tokens import get_token_counter
+
+
+@dataclass
+class EstimationSample:
+    """The texts of a sample used for estimating the LLM calls.
+
+    Attributes:
+        input (str): The input to the model.
+        reference (str): The reference output.
+        prediction (str | None): The model output, or None if the sample has
+            not been generated yet.
+        metadata (dict[str, Any]): The sample metadata.
+    """
+
+    input: str
+    reference: str
+    prediction: str | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_sample(cls, sample: Sample | EvalSample) -> "EstimationSample":
+        """Extracts the texts from a dataset sample or a generated log sample.
+
+        Args:
+            sample (Sample | EvalSample): The sample.
+
+        Returns:
+            EstimationSample: The texts of the sample.
+        """
+        return cls(
+            input=_to_text(sample.input),
+            reference=_to_text(sample.target),
+            prediction=sample.output.completion
+            if isinstance(sample, EvalSample)
+            else None,
+            metadata=sample.metadata or {},
+        )
+
+
+def _to_text(value: str | list[str] | list[ChatMessage]) -> str:
+    """Converts a sample input or target into plain text.
+
+    Args:
+        value (str | list[str] | list[ChatMessage]): The input or target.
+
+    Returns:
+        str: The plain text.
+    """
+    if isinstance(value, str):
+        return value
+    return "\n".join(item if isinstance(item, str) else item.text for item in value)
+
+
+def estimate_generation(
+    samples: Iterable[EstimationSample],
+    model_name: str,
+) -> CallEstimate:
+    """Estimates the LLM calls made for generating the model outputs.
+
+    A single call is assumed per sample, using the reference output length
+    as a proxy for the output length.
+
+    Args:
+        samples (Iterable[EstimationSample]): The samples to generate.
+        model_name (str): The name of the generation model.
+
+    Returns:
+        CallEstimate: The estimated LLM calls.
+    """
+    count_tokens = get_token_counter(model_name)
+    estimate = CallEstimate()
+    for sample in samples:
+        estimate += CallEstimate(
+            calls=1,
+            input_tokens=count_tokens(sample.input),
+            output_tokens=count_tokens(sample.reference),
+        )
+    return estimate
+
+
+def estimate_evaluation(
+    samples: Iterable[EstimationSample],
+    evaluator: Evaluator,
+) -> CallEstimate | None:
+    """Estimates the LLM calls made for evaluating the model outputs.
+
+    The reference outputs are used as proxies for the samples that have not
+    been generated yet.
+
+    Args:
+        samples (Iterable[EstimationSample]): The samples to evaluate.
+        evaluator (Evaluator): The evaluator.
+
+    Returns:
+        CallEstimate | None: The estimated LLM calls, or None if the evaluator
+            uses a model but does not support estimating its calls.
+    """
+    if evaluator.model_config is None and not isinstance(
+        evaluator.scorer, ScorerFactory
+    ):
+        return CallEstimate()
+    if evaluator.model_config is None or not isinstance(
+        evaluator.scorer, CallEstimator
+    ):
+        return None
+
+    count_tokens = get_token_counter(evaluator.model_config.name)
+    estimate = CallEstimate()
+    for sample in samples:
+        estimate += evaluator.scorer.estimate_calls(
+            prediction=sample.prediction
+            if sample.prediction is not None
+            else sample.reference,
+            count_tokens=count_tokens,
+            input=sample.input,
+            reference=sample.reference,
+            metadata=sample.metadata,
+        )
+    return estimate
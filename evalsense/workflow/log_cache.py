@@ -0,0 +1,209 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import zipfile
+
+from inspect_ai.log import EvalLog, read_eval_log
+
+from evalsense.constants import LOG_CACHE_SIZE
+from evalsense.utils.files import get_file_signature
+
+
+def _estimate_log_size(path: Path) -> int:
+    """Estimates the memory needed for holding a parsed log, including samples.
+
+    The size is approximated by the size of the serialised log, i.e., the
+    uncompressed size of the log archive for logs in the `eval` format.
+
+    Args:
+        path (Path): The path to the log file.
+
+    Returns:
+        int: The estimated size of the parsed log in bytes.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return sum(info.file_size for info in archive.infolist())
+    return path.stat().st_size
+
+
+@dataclass
+class _CachedLog:
+    """A parsed log held in the log cache.
+
+    Attributes:
+        signature (tuple[int, int, int]): The signature of the log file version
+            the log was parsed from.
+        eval_log (EvalLog): The parsed log.
+        size (int): The estimated size of the parsed log in bytes.
+    """
+
+    signature: tuple[int, int, int]
+    eval_log: EvalLog
+    size: int
+
+
+class EvalLogCache:
+    """A least-recently-used cache of parsed logs, bounded by their approximate
+    size in memory.
+
+    The cached logs are invalidated when the log files change, as detected by
+    their inode, modification time and size, so that the logs rewritten by other
+    sessions are read again. A cached full log is also used for serving the
+    header of the same log.
+
+    The size of the parsed logs is estimated by the size of the serialised
+    logs, while the parsed logs typically take up several times more memory,
+    so the maximum size should leave enough headroom.
+
+    The cached logs are shared by all callers and should be copied before
+    being modified.
+    """
+
+    def __init__(self, max_size: int = LOG_CACHE_SIZE):
+        """Initializes the log cache.
+
+        Args:
+            max_size (int): The maximum total estimated size of the cached logs
+                in bytes. Logs larger than this are never cached, and a size of
+                zero disables the cache. Defaults to zero (disabled), unless
+                overridden by the `EVALSENSE_LOG_CACHE_SIZE` environment variable.
+
+        Raises:
+            ValueError: If the maximum size is negative.
+        """
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, bool], _CachedLog] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total estimated size of the cached logs in bytes."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int):
+        if max_size < 0:
+            raise ValueError("The maximum log cache size must not be negative.")
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        """Removes the least recently used logs until the cache fits its
+        maximum size."""
+        while self.size > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _lookup(
+        self,
+        key: tuple[str, bool],
+        signature: tuple[int, int, int],
+    ) -> EvalLog | None:
+        """Returns a cached log for the given key if it is up to date.
+
+        Args:
+            key (tuple[str, bool]): The path to the log file and whether only
+                the header was read.
+            signature (tuple[int, int, int]): The current signature of the
+                log file.
+
+        Returns:
+            EvalLog | None: The cached log, or None if it is missing or stale.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.signature != signature:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.eval_log
+
+    def _remove(self, key: tuple[str, bool]):
+        """Removes a log from the cache, if present.
+
+        Args:
+            key (tuple[str, bool]): The path to the log file and whether only
+                the header was read.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def read(self, path: str | Path, header_only: bool = False) -> EvalLog:
+        """Reads a log, using the cached log if the log file is unchanged.
+
+        Args:
+            path (str | Path): The path to the log file.
+            header_only (bool): Whether to read only the log header, without
+                the samples. Defaults to False.
+
+        Returns:
+            EvalLog: The parsed log.
+        """
+        path = Path(path)
+        key = str(path.resolve())
+        signature = get_file_signature(path)
+        if signature is None or self.max_size == 0:
+            return read_eval_log(str(path), header_only=header_only)
+
+        with self._lock:
+            eval_log = self._lookup((key, header_only), signature)
+            if eval_log is None and header_only:
+                full_log = self._lookup((key, False), signature)
+                if full_log is not None:
+                    eval_log = full_log.model_copy(update={"samples": None})
+        if eval_log is not None:
+            return eval_log
+
+        eval_log = read_eval_log(str(path), header_only=header_only)
+        size = (
+            len(eval_log.model_dump_json(exclude={"samples"}))
+            if header_only
+            else _estimate_log_size(path)
+        )
+        # Only cache the log if the file did not change while it was read
+        if size <= self.max_size and get_file_signature(path) == signature:
+            with self._lock:
+                self._remove((key, header_only))
+                self._entries[(key, header_only)] = _CachedLog(
+                    signature, eval_log, size
+                )
+                self.size += size
+                self._evict()
+        return eval_log
+
+    def fits(self, path: str | Path) -> bool:
+        """Checks whether the full log would fit into the cache.
+
+        Args:
+            path (str | Path): The path to the log file.
+
+        Returns:
+            bool: Whether the estimated size of the parsed log does not exceed
+                the maximum cache size.
+        """
+        path = Path(path)
+        if self.max_size == 0 or not path.exists():
+            return False
+        return _estimate_log_size(path) <= self.max_size
+
+    def discard(self, path: str | Path):
+        """Removes the cached logs read from the given log file.
+
+        Args:
+            path (str | Path): The path to the log file.
+        """
+        key = str(Path(path).resolve())
+        with self._lock:
+            self._remove((key, False))
+            self._remove((key, True))
+
+    def clear(self):
+        """Removes all cached logs."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+import json
+from typing import Callable
+
+from inspect_ai.model import Model
+
+from evalsense.generation import ModelConfig
+
+
+def get_model_key(model_config: ModelConfig | None) -> str | None:
+    """Computes a hashable key identifying a model configuration.
+
+    Two configurations have the same key if they are equal, in which case
+    the pipeline reuses the loaded model instead of loading a new one.
+
+    Args:
+        model_config (ModelConfig | None): The model configuration.
+
+    Returns:
+        str | None: The key of the model configuration, or None if no model
+            configuration is given.
+    """
+    if model_config is None:
+        return None
+    model = model_config.model
+    return json.dumps(
+        [
+            model if isinstance(model, str) else f"<model {id(model)}>",
+            model_config.model_args,
+            model_config.generation_args,
+        ],
+        default=str,
+        sort_keys=True,
+    )
+
+
+def get_gpu_memory_fraction(model_config: ModelConfig) -> float:
+    """Estimates the fraction of the GPU memory used by a model.
+
+    Models not running on the local machine are assumed not to use any GPU
+    memory, while local models are assumed to use the whole GPU memory unless
+    specified otherwise through the `gpu_memory_utilization` model argument.
+
+    Args:
+        model_config (ModelConfig): The model configuration.
+
+    Returns:
+        float: The estimated fraction of the GPU memory used by the model.
+    """
+    if not model_config.is_local:
+        return 0.0
+    return float(model_config.model_args.get("gpu_memory_utilization", 1.0))
+
+
+class ModelPool:
+    """A bounded pool of loaded models, evicting the least recently used models
+    when the pool is full."""
+
+    def __init__(
+        self,
+        create_model: Callable[[ModelConfig], Model],
+        close_model: Callable[[Model, ModelConfig], None],
+        max_models: int = 1,
+        gpu_memory_budget: float = 1.0,
+    ):
+        """Initializes a new ModelPool.
+
+        Args:
+            create_model (Callable[[ModelConfig], Model]): The function used for
+                loading a new model.
+            close_model (Callable[[Model, ModelConfig], None]): The function used
+                for cleaning up an evicted model.
+            max_models (int): The maximum number of models kept loaded at the same
+                time. Defaults to 1.
+            gpu_memory_budget (float): The maximum total fraction of the GPU memory
+                used by the loaded models, as estimated by `get_gpu_memory_fraction`.
+                Defaults to 1.0.
+        """
+        if max_models < 1:
+            raise ValueError("The model pool must be able to hold at least one model.")
+        self.max_models = max_models
+        self.gpu_memory_budget = gpu_memory_budget
+        self._create_model = create_model
+        self._close_model = close_model
+        self._models: OrderedDict[str, tuple[ModelConfig, Model]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of loaded models."""
+        return len(self._models)
+
+    def __contains__(self, model_config: ModelConfig) -> bool:
+        """Checks whether a model is loaded in the pool.
+
+        Args:
+            model_config (ModelConfig): The model configuration.
+
+        Returns:
+            bool: True if the model is loaded, False otherwise.
+        """
+        return get_model_key(model_config) in self._models
+
+    @property
+    def gpu_memory_usage(self) -> float:
+        """Returns the estimated fraction of the GPU memory used by the loaded
+        models."""
+        return sum(
+            get_gpu_memory_fraction(model_config)
+            for model_config, _ in self._models.values()
+        )
+
+    def get(self, model_config: ModelConfig) -> Model:
+        """Returns a loaded model, loading it if needed.
+
+        Args:
+            model_config (ModelConfig): The model configuration.
+
+        Returns:
+            Model: The loaded model.
+        """
+        model_key = str(get_model_key(model_config))
+        if model_key in self._models:
+            self._models.move_to_end(model_key)
+            return self._models[model_key][1]
+
+        # Make room for the new model
+        required_memory = get_gpu_memory_fraction(model_config)
+        while self._models and (
+            len(self._models) >= self.max_models
+            or self.gpu_memory_usage + required_memory > self.gpu_memory_budget
+        ):
+            self._evict_least_recently_used()
+
+        model = self._create_model(model_config)
+        self._models[model_key] = (model_config, model)
+        return model
+
+    def _evict_least_recently_used(self):
+        """Evicts the least recently used model from the pool."""
+        _, (model_config, model) = self._models.popitem(last=False)
+        self._close_model(model, model_config)
+
+    def clear(self):
+        """Evicts all models from the pool."""
+        while self._models:
+            self._evict_least_recently_used()
@@ -1,35 +1,382 @@
-from typing import Any, cast
+import asyncio
+from concurrent.futures import Future
+from contextlib import AbstractContextManager
+import copy
+from itertools import groupby
+from pathlib import Path
+import queue
+import random
+import shutil
+import threading
+from typing import Any, Callable, ClassVar, Coroutine, cast
+import weakref
 
-from inspect_ai import Task, eval, eval_retry, score, task
+from inspect_ai import (
+    Task,
+    eval,
+    eval_async,
+    eval_retry,
+    eval_retry_async,
+    score,
+    score_async,
+    task,
+)
 from inspect_ai.dataset import Dataset
 from inspect_ai.log import EvalLog, read_eval_log, write_eval_log
 from inspect_ai.model import GenerateConfig, Model, get_model
+from inspect_ai.scorer import Scorer
+from inspect_ai.util import registry_info
+import polars as pl
 from tqdm.auto import tqdm
 
+from evalsense.constants import HF_HUB_MODEL_PROVIDERS
 from evalsense.evaluation import (
+    EvaluationRecord,
     Evaluator,
     ExperimentBatchConfig,
     ExperimentConfig,
     ExperimentDefinitions,
+    GenerationRecord,
     ResultRecord,
     ScorerFactory,
 )
 from evalsense.logging import get_logger
 from evalsense.generation import ModelConfig
 from evalsense.utils.files import to_safe_filename
+from evalsense.utils.huggingface import prefetch_model_files
+from evalsense.workflow.checkpointing import ScoreCheckpoint, checkpointed_scorer
+from evalsense.workflow.early_stopping import (
+    EarlyStoppingConfig,
+    EarlyStoppingResult,
+    get_primary_score_values,
+)
+from evalsense.workflow.estimation import (
+    EstimationSample,
+    estimate_evaluation,
+    estimate_generation,
+)
+from evalsense.workflow.model_pool import ModelPool, get_model_key
+from evalsense.workflow.prefix_caching import (
+    PrefixSharingStats,
+    get_prefix_cache_usage,
+    order_by_shared_prefix,
+)
 from evalsense.workflow.project import Project
+from evalsense.workflow.scheduling import (
+    ExecutionPlan,
+    plan_interleaved_execution,
+    plan_staged_execution,
+)
+from evalsense.workflow.sharding import get_sample_shard, get_shard_index
+from evalsense.workflow.subsampling import (
+    SubsampleConfig,
+    get_subsample_intervals,
+    select_stratified_subsample,
+    subsample_covers,
+)
+from evalsense.workflow.telemetry import SpanStage, timed_span
 
 logger = get_logger(__name__)
 
+_GENERATION_RECORD_METADATA_KEY = "evalsense_generation_record"
+_EARLY_STOPPING_METADATA_KEY = "evalsense_early_stopping"
+_SUBSAMPLE_METADATA_KEY = "evalsense_subsample"
+_PREFIX_SHARING_METADATA_KEY = "evalsense_prefix_sharing"
+
+
+def _group_fusable_experiments(
+    experiments: list[ExperimentConfig],
+) -> list[list[ExperimentConfig]]:
+    """Groups experiments that can be evaluated in a single scoring pass, i.e.,
+    experiments sharing the same generation record and evaluator model config.
+
+    Args:
+        experiments (list[ExperimentConfig]): The experiments to group. All
+            experiments must have an evaluator.
+
+    Returns:
+        list[list[ExperimentConfig]]: The grouped experiments, in the order of
+            their first occurrence.
+    """
+    groups: list[list[ExperimentConfig]] = []
+    for experiment in experiments:
+        model_config = cast(Evaluator, experiment.evaluator).model_config
+        for group in groups:
+            if (
+                group[0].generation_record == experiment.generation_record
+                and cast(Evaluator, group[0].evaluator).model_config == model_config
+            ):
+                group.append(experiment)
+                break
+        else:
+            groups.append([experiment])
+    return groups
+
+
+def _scorer_name(scorer: Scorer) -> str:
+    """Returns the name under which the results of a scorer are stored in the
+    logs, i.e., its registered name without the package prefix.
+
+    Args:
+        scorer (Scorer): The scorer.
+
+    Returns:
+        str: The name of the scorer results.
+    """
+    return registry_info(scorer).name.split("/", 1)[-1]
+
+
+def _select_scorer_results(log: EvalLog, scorer_name: str, location: str) -> EvalLog:
+    """Creates a copy of a log scored by multiple scorers, which only retains
+    the results of a single scorer.
+
+    Args:
+        log (EvalLog): The log scored by multiple scorers.
+        scorer_name (str): The name of the scorer whose results to retain.
+        location (str): The location of the new log.
+
+    Returns:
+        EvalLog: The log with the results of the selected scorer.
+    """
+    samples = None
+    if log.samples is not None:
+        samples = [
+            sample.model_copy(
+                update={
+                    "scores": {
+                        name: value
+                        for name, value in (sample.scores or {}).items()
+                        if name == scorer_name
+                    }
+                }
+            )
+            for sample in log.samples
+        ]
+    results = None
+    if log.results is not None:
+        results = log.results.model_copy(
+            update={
+                "scores": [s for s in log.results.scores if s.scorer == scorer_name]
+            }
+        )
+    reductions = None
+    if log.reductions is not None:
+        reductions = [r for r in log.reductions if r.scorer == scorer_name]
+    return log.model_copy(
+        update={
+            "samples": samples,
+            "results": results,
+            "reductions": reductions,
+            "location": location,
+        }
+    )
+
+
+def _is_background_evaluable(experiment: ExperimentConfig) -> bool:
+    """Checks whether an experiment can be evaluated in the background.
+
+    Args:
+        experiment (ExperimentConfig): The experiment to check.
+
+    Returns:
+        bool: True if the experiment has an evaluator not requiring a model,
+            False otherwise.
+    """
+    evaluator = experiment.evaluator
+    return (
+        evaluator is not None
+        and evaluator.model_config is None
+        and not isinstance(evaluator.scorer, ScorerFactory)
+    )
+
+
+class _EvaluationWorker:
+    """A background worker evaluating experiments that do not require a model.
+
+    The worker is used by the pipelined execution mode to score the generations
+    of model-free evaluators (e.g., ROUGE or BLEU) while the main thread proceeds
+    with further generation experiments. The scoring uses the asynchronous
+    Inspect entry point, which leaves the display of the concurrently running
+    generation intact, and runs in the event loop of the asynchronous pipeline
+    run, or in an event loop owned by the worker otherwise.
+
+    The worker evaluates the experiments with a copy of the pipeline owning its
+    own model pool, so that the models loaded by the main thread are not shared.
+    The project is shared with the main thread, as its methods are synchronised.
+    """
+
+    def __init__(
+        self,
+        pipeline: "Pipeline",
+        force_rerun: bool,
+        score_kwargs: dict[str, Any] | None,
+        fuse_evaluators: bool = False,
+    ):
+        """Initializes the evaluation worker.
+
+        Args:
+            pipeline (Pipeline): The pipeline on behalf of which the worker runs.
+            force_rerun (bool): Whether to force rerun the experiments.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
+            fuse_evaluators (bool): Whether to score the generations with all
+                submitted evaluators in a single pass. Defaults to False.
+        """
+        self.pipeline = pipeline
+        self.force_rerun = force_rerun
+        self.fuse_evaluators = fuse_evaluators
+        # Only used if no display has been initialised by the generation yet
+        self.score_kwargs = {"display": "none"} | (score_kwargs or dict())
+        self.completed: set[EvaluationRecord] = set()
+        self.failed: set[EvaluationRecord] = set()
+        self.errors: list[Exception] = []
+        self._queue: queue.Queue[list[ExperimentConfig] | None] = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="evalsense-evaluation-worker",
+            daemon=True,
+        )
+
+    def start(self):
+        """Starts the evaluation worker."""
+        self._thread.start()
+
+    def submit(self, experiments: list[ExperimentConfig]):
+        """Schedules experiments sharing the same generation record for evaluation.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to evaluate.
+        """
+        self._queue.put(experiments)
+
+    def stop(self, cancel: bool = False):
+        """Waits for the scheduled evaluations to finish and stops the worker.
+
+        The evaluations completed by the worker are collected in `completed`,
+        the failed evaluations in `failed` and their errors in `errors`.
+
+        Args:
+            cancel (bool): Whether to drop the evaluations that have not been
+                started yet. Defaults to False.
+        """
+        if cancel:
+            self._cancelled.set()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _copy_pipeline(self) -> "Pipeline":
+        """Copies the pipeline for use by the worker, with its own model state.
+
+        Returns:
+            Pipeline: The copy of the pipeline.
+        """
+        pipeline = copy.copy(self.pipeline)
+        pipeline._model_pool = ModelPool(
+            create_model=pipeline._create_model,
+            close_model=pipeline._close_model,
+            max_models=self.pipeline._model_pool.max_models,
+            gpu_memory_budget=self.pipeline._model_pool.gpu_memory_budget,
+        )
+        pipeline._keep_models_loaded = False
+        pipeline._prefetch_models = False
+        pipeline._prefetch_futures = {}
+        pipeline._active_model_config = None
+        pipeline._active_model = None
+        pipeline._evaluation_worker = None
+        return pipeline
+
+    def _run(self):
+        """Runs the worker until it is stopped."""
+        pipeline = self._copy_pipeline()
+        try:
+            if pipeline._event_loop is not None:
+                self._process_evaluations(pipeline)
+                return
+            # The copy of the pipeline scores the logs in the event loop of the
+            # worker, while the main thread keeps using the synchronous entry points
+            asyncio.run(
+                pipeline._run_async(self._process_evaluations, pipeline=pipeline)
+            )
+        except Exception as e:
+            logger.error(f"❌  Background evaluation failed: {e}")
+            self.errors.append(e)
+        finally:
+            pipeline._cleanup_active_model()
+
+    def _process_evaluations(self, pipeline: "Pipeline"):
+        """Processes the scheduled evaluations until the worker is stopped.
+
+        Args:
+            pipeline (Pipeline): The pipeline to evaluate the experiments with.
+        """
+        while (experiments := self._queue.get()) is not None:
+            if self._cancelled.is_set():
+                continue
+            if self.fuse_evaluators:
+                try:
+                    pipeline._evaluate_experiments_fused(
+                        experiments,
+                        force_rerun=self.force_rerun,
+                        score_kwargs=self.score_kwargs,
+                    )
+                    self.completed.update(e.evaluation_record for e in experiments)
+                except Exception as e:
+                    self._record_failure(experiments, e)
+                continue
+            for experiment in experiments:
+                try:
+                    pipeline._evaluate_experiment(
+                        experiment,
+                        force_rerun=self.force_rerun,
+                        score_kwargs=self.score_kwargs,
+                    )
+                    self.completed.add(experiment.evaluation_record)
+                except Exception as e:
+                    self._record_failure([experiment], e)
+
+    def _record_failure(self, experiments: list[ExperimentConfig], error: Exception):
+        """Records the failure of background evaluations.
+
+        Args:
+            experiments (list[ExperimentConfig]): The failed experiments.
+            error (Exception): The error raised by the evaluations.
+        """
+        for experiment in experiments:
+            logger.error(
+                "❌  Background evaluation for "
+                f"{experiment.evaluation_record.label} failed: {error}"
+            )
+        self.failed.update(e.evaluation_record for e in experiments)
+        self.errors.append(error)
+
 
 class Pipeline:
     """A pipeline for evaluating LLMs."""
 
+    # Inspect does not support concurrent evaluations within a single process,
+    # so the generations of pipelines sharing an event loop are serialised
+    _eval_locks: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         experiments: ExperimentDefinitions,
         project: Project,
         maintain_order: bool = False,
+        shard_index: int | None = None,
+        num_shards: int | None = None,
+        sample_shard_index: int | None = None,
+        num_sample_shards: int | None = None,
+        max_loaded_models: int = 1,
+        gpu_memory_budget: float = 1.0,
+        prefetch_models: bool = False,
+        evaluation_checkpoint_interval: int | None = 100,
+        early_stopping: EarlyStoppingConfig | None = None,
+        subsample: SubsampleConfig | None = None,
+        prefix_cache_ordering: bool = False,
     ):
         """Initializes a new Pipeline.
 
@@ -40,6 +387,68 @@ class Pipeline:
             maintain_order (bool): Whether to maintain the order of the experiments or
                 whether to reorder them to reduce the number of model loads. Defaults
                 to False.
+            shard_index (int, optional): The index of the shard of experiments to
+                run in this pipeline, when splitting the experiments across multiple
+                workers sharing the same project (e.g., in a SLURM job array, see
+                `slurm_array_shard`). The experiments are assigned to shards based on
+                a stable hash of their generation records, so that all evaluations
+                of a generation run in the same shard. Defaults to None (running all
+                experiments).
+            num_shards (int, optional): The total number of shards. Must be given
+                together with `shard_index`. Defaults to None.
+            sample_shard_index (int, optional): The index of the shard of samples
+                to generate in this pipeline, when splitting the samples of each
+                experiment across multiple workers sharing the same project. The
+                worker completing the last sample shard of an experiment merges
+                the logs for all shards into a single generation log. In this
+                mode, `Pipeline.run` only runs the generation stage, and the
+                evaluation stage should be run once all sample shards have been
+                merged. Defaults to None (generating all samples).
+            num_sample_shards (int, optional): The total number of sample shards.
+                Must be given together with `sample_shard_index`. Defaults to None.
+            max_loaded_models (int, optional): The maximum number of models kept
+                loaded at the same time, so that experiments alternating between
+                models can reuse the loaded models. The least recently used model
+                is cleaned up when loading a new model into a full pool. During
+                `Pipeline.run`, the models are kept loaded across the pipeline
+                stages. Defaults to 1.
+            gpu_memory_budget (float, optional): The maximum total fraction of the
+                GPU memory used by the loaded models. Local models are assumed to
+                use the whole GPU memory, unless specified otherwise through the
+                `gpu_memory_utilization` model argument. Defaults to 1.0.
+            prefetch_models (bool, optional): Whether to download the files of the
+                next local Hugging Face model and load them into the page cache
+                in a background thread while the current model is generating,
+                so that the next model loads faster. Loading the model waits for
+                the prefetching to finish and raises its errors. Defaults to False.
+            evaluation_checkpoint_interval (int | None, optional): The number of
+                newly scored samples after which the scores are checkpointed to
+                disk during evaluation. An interrupted or failed evaluation then
+                resumes from the checkpoint, only scoring the samples missing
+                from it. Defaults to 100. If None, checkpointing is disabled.
+            early_stopping (EarlyStoppingConfig | None, optional): The configuration
+                of the sequential early-stopping evaluation mode, in which the
+                samples are scored in a random order until the confidence interval
+                for the mean of the evaluator's primary score is narrow enough.
+                The number of scored samples and the final interval are stored in
+                the evaluation log metadata. Evaluators are not fused in this
+                mode. Defaults to None, scoring all samples.
+            subsample (SubsampleConfig | None, optional): The configuration of
+                a stratified subsample of the datasets to run the experiments on.
+                Bootstrap confidence intervals for the mean of the primary scores
+                are stored in the evaluation log metadata. The subsampled runs
+                can be expanded later by running the pipeline with a larger
+                subsample (or without subsampling) with `incremental=True`, which
+                reuses the already generated and scored samples. Defaults to
+                None, using the full datasets.
+            prefix_cache_ordering (bool, optional): Whether to order the samples
+                of each generation task so that prompts sharing long prefixes
+                (e.g., the same source document with different instructions) are
+                sent consecutively, improving the hit rate of the prefix cache of
+                local inference servers such as vLLM. The estimated prefix sharing
+                is stored in the generation log metadata and logged together with
+                the cache hit rate reported by the model provider, if any.
+                Defaults to False, keeping the dataset order.
         """
         # Standardize experiments to a list of ExperimentConfigs
         if not isinstance(experiments, list):
@@ -51,11 +460,63 @@ class Pipeline:
                 all_experiments.extend(experiment.all_experiments)
             else:
                 all_experiments.append(experiment)
+
+        # Select the experiments for the current shard
+        if (shard_index is None) != (num_shards is None):
+            raise ValueError("shard_index and num_shards must be given together.")
+        if shard_index is not None and num_shards is not None:
+            if not 0 <= shard_index < num_shards:
+                raise ValueError(
+                    f"Invalid shard index {shard_index} for {num_shards} shards."
+                )
+            shard_experiments = [
+                e
+                for e in all_experiments
+                if get_shard_index(e.generation_record, num_shards) == shard_index
+            ]
+            logger.info(
+                f"🧩  Running shard {shard_index + 1}/{num_shards} with "
+                f"{len(shard_experiments)} of {len(all_experiments)} experiments."
+            )
+            all_experiments = shard_experiments
         self.experiments = all_experiments
+
+        # Validate the sample shard
+        if (sample_shard_index is None) != (num_sample_shards is None):
+            raise ValueError(
+                "sample_shard_index and num_sample_shards must be given together."
+            )
+        self._sample_shard: tuple[int, int] | None = None
+        if sample_shard_index is not None and num_sample_shards is not None:
+            if not 0 <= sample_shard_index < num_sample_shards:
+                raise ValueError(
+                    f"Invalid sample shard index {sample_shard_index} for "
+                    f"{num_sample_shards} sample shards."
+                )
+            self._sample_shard = (sample_shard_index, num_sample_shards)
         self.project = project
         self._maintain_order = maintain_order
+        self._model_pool = ModelPool(
+            create_model=self._create_model,
+            close_model=self._close_model,
+            max_models=max_loaded_models,
+            gpu_memory_budget=gpu_memory_budget,
+        )
+        self._keep_models_loaded = False
+        self._prefetch_models = prefetch_models
+        self._prefetch_futures: dict[str, Future[Path]] = {}
+        self._evaluation_checkpoint_interval = evaluation_checkpoint_interval
+        self._early_stopping = early_stopping
+        self._subsample = subsample
+        self._subsample_params = (
+            subsample.get_selection_params() if subsample is not None else None
+        )
+        self._prefix_cache_ordering = prefix_cache_ordering
         self._active_model_config: ModelConfig | None = None
         self._active_model: Model | None = None
+        self._evaluation_worker: _EvaluationWorker | None = None
+        # The event loop running the Inspect functions when running asynchronously
+        self._event_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def generation_experiments(self):
@@ -82,93 +543,282 @@ class Pipeline:
             )
         return experiments_list
 
-    def _cleanup_active_model(self):
-        """Cleans up the active model if it exists."""
-        if self._active_model is not None:
-            logger.info(
-                f"🧹 Cleaning up model{' ' + self._active_model_config.name if self._active_model_config else ''}."
-            )
-            self._active_model.api.close()
-            if hasattr(self._active_model.api, "_server_resolved"):
-                # FIXME: Temporary Inspect AI fix, as Inspect does not re-resolve the server after the provider is closed
-                self._active_model.api._server_resolved = False  # type: ignore
-            if hasattr(self._active_model.api, "_server") and hasattr(
-                self._active_model.api._server,  # type: ignore
-                "base_url",
-            ):
-                # FIXME: Temporary Inspect AI fix, as Inspect does not reset the base_url after the provider is closed
-                new_base_url = None
-                if (
-                    self._active_model_config
-                    and "base_url" in self._active_model_config.model_args
-                ):
-                    new_base_url = self._active_model_config.model_args["base_url"]
-                self._active_model.api._server.base_url = new_base_url  # type: ignore
+    def _timed(
+        self,
+        stage: SpanStage,
+        label: str | None = None,
+    ) -> AbstractContextManager[None]:
+        """Times a pipeline stage, recording the span in the project.
+
+        Args:
+            stage (SpanStage): The pipeline stage.
+            label (str | None): The label of the records or the name of the model
+                processed in the stage, if applicable.
+
+        Returns:
+            AbstractContextManager[None]: The context manager timing the stage.
+        """
+        return timed_span(stage, label, self.project.record_span)
+
+    def _await[T](self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine in the event loop of the asynchronous pipeline run,
+        blocking the calling thread until the coroutine completes.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): The coroutine to run.
+
+        Returns:
+            T: The result of the coroutine.
+        """
+        event_loop = cast(asyncio.AbstractEventLoop, self._event_loop)
+        return asyncio.run_coroutine_threadsafe(coroutine, event_loop).result()
+
+    @classmethod
+    async def _eval_lock(cls) -> asyncio.Lock:
+        """Returns the lock serialising the Inspect evaluations in the running
+        event loop.
+
+        Returns:
+            asyncio.Lock: The evaluation lock.
+        """
+        event_loop = asyncio.get_running_loop()
+        if event_loop not in cls._eval_locks:
+            cls._eval_locks[event_loop] = asyncio.Lock()
+        return cls._eval_locks[event_loop]
+
+    def _eval(self, **kwargs: Any) -> list[EvalLog]:
+        """Runs an Inspect evaluation, using the asynchronous entry point
+        when the pipeline is running asynchronously.
+
+        Args:
+            **kwargs (Any): The arguments to pass to the Inspect eval function.
+
+        Returns:
+            list[EvalLog]: The evaluation logs.
+        """
+        if self._event_loop is None:
+            return eval(**kwargs)
+
+        async def run_eval() -> list[EvalLog]:
+            async with await self._eval_lock():
+                return await eval_async(**kwargs)
+
+        return self._await(run_eval())
+
+    def _eval_retry(self, **kwargs: Any) -> list[EvalLog]:
+        """Retries an Inspect evaluation, using the asynchronous entry point
+        when the pipeline is running asynchronously.
+
+        Args:
+            **kwargs (Any): The arguments to pass to the Inspect eval_retry
+                function.
+
+        Returns:
+            list[EvalLog]: The evaluation logs.
+        """
+        if self._event_loop is None:
+            return eval_retry(**kwargs)
+
+        async def run_eval_retry() -> list[EvalLog]:
+            async with await self._eval_lock():
+                return await eval_retry_async(**kwargs)
+
+        return self._await(run_eval_retry())
+
+    def _score(self, **kwargs: Any) -> EvalLog:
+        """Scores an Inspect evaluation log, using the asynchronous entry point
+        when the pipeline is running asynchronously.
+
+        Unlike the evaluations, scoring may run concurrently with other
+        pipelines sharing the event loop.
 
-            self._active_model_config = None
-            self._active_model = None
+        Args:
+            **kwargs (Any): The arguments to pass to the Inspect score function.
+
+        Returns:
+            EvalLog: The scored evaluation log.
+        """
+        if self._event_loop is None:
+            return score(**kwargs)
+        return self._await(score_async(**kwargs))
+
+    async def _run_async(self, stage: Callable[..., None], **kwargs: Any):
+        """Runs a pipeline stage asynchronously.
+
+        The stage runs in a worker thread, while the Inspect evaluations and
+        scoring are run in the current event loop, so that multiple pipelines
+        can share the event loop and the model connections.
+
+        Args:
+            stage (Callable[..., None]): The pipeline stage to run.
+            **kwargs (Any): The arguments to pass to the pipeline stage.
+
+        Raises:
+            RuntimeError: If the pipeline is already running asynchronously.
+        """
+        if self._event_loop is not None:
+            raise RuntimeError("The pipeline is already running asynchronously.")
+        self._event_loop = asyncio.get_running_loop()
+
+        def run_stage():
+            try:
+                stage(**kwargs)
+            finally:
+                self._event_loop = None
+
+        await asyncio.to_thread(run_stage)
+
+    def _create_model(self, model_config: ModelConfig) -> Model:
+        """Creates a new model from the given model configuration.
+
+        Args:
+            model_config (ModelConfig): The model configuration.
+
+        Returns:
+            Model: The created model.
+        """
+        if isinstance(model_config.model, Model):
+            return model_config.model
+        with self._timed("model_load", model_config.name):
+            return get_model(
+                model=model_config.model,
+                **model_config.model_args,
+                config=GenerateConfig(**model_config.generation_args),
+                memoize=False,
+            )
+
+    def _close_model(self, model: Model, model_config: ModelConfig | None):
+        """Closes a model and releases its resources.
+
+        Args:
+            model (Model): The model to close.
+            model_config (ModelConfig | None): The configuration used to create
+                the model, if available.
+        """
+        logger.info(
+            f"🧹 Cleaning up model{' ' + model_config.name if model_config else ''}."
+        )
+        with self._timed("model_cleanup", model_config.name if model_config else None):
+            model.api.close()
+        if hasattr(model.api, "_server_resolved"):
+            # FIXME: Temporary Inspect AI fix, as Inspect does not re-resolve the server after the provider is closed
+            model.api._server_resolved = False  # type: ignore
+        if hasattr(model.api, "_server") and hasattr(
+            model.api._server,  # type: ignore
+            "base_url",
+        ):
+            # FIXME: Temporary Inspect AI fix, as Inspect does not reset the base_url after the provider is closed
+            new_base_url = None
+            if model_config and "base_url" in model_config.model_args:
+                new_base_url = model_config.model_args["base_url"]
+            model.api._server.base_url = new_base_url  # type: ignore
+
+    def _cleanup_active_model(self):
+        """Cleans up the loaded models, unless they should be kept loaded
+        until the end of the pipeline run."""
+        if self._keep_models_loaded:
+            return
+        self._model_pool.clear()
+        self._active_model_config = None
+        self._active_model = None
 
     def _load_model(
         self,
         new_model_config: ModelConfig,
     ) -> Model:
-        """Gets the model for the current experiment.
+        """Gets the model for the current experiment, reusing the loaded model
+        if available.
 
         Args:
             new_model_config (ModelConfig): The model configuration for the new model
                 to be loaded.
 
+        Raises:
+            Exception: If prefetching the files of the model failed.
+
         Returns:
             Model: The model for the current experiment.
         """
-        if new_model_config != self._active_model_config:
+        prefetch_future = self._prefetch_futures.pop(
+            cast(str, get_model_key(new_model_config)), None
+        )
+        if prefetch_future is not None:
+            # Wait for the model files before loading the model
+            prefetch_future.result()
+        if new_model_config not in self._model_pool:
             logger.info(f"▶️  Loading model {new_model_config.name}.")
+        self._active_model = self._model_pool.get(new_model_config)
+        self._active_model_config = new_model_config
+        return self._active_model
 
-            # Loading a new model — clean up the previous one
-            self._cleanup_active_model()
+    def _prefetch_model(self, model_config: ModelConfig):
+        """Prefetches the files of a local Hugging Face model in a background
+        thread, if model prefetching is enabled. The model loading waits for the
+        prefetching to finish and raises its errors.
 
-            # Prepare the new model
-            if isinstance(new_model_config.model, Model):
-                new_model = new_model_config.model
-            else:
-                new_model = get_model(
-                    model=new_model_config.model,
-                    **new_model_config.model_args,
-                    config=GenerateConfig(**new_model_config.generation_args),
-                    memoize=False,
-                )
+        Args:
+            model_config (ModelConfig): The configuration of the model to prefetch.
+        """
+        model_key = cast(str, get_model_key(model_config))
+        if (
+            not self._prefetch_models
+            or not isinstance(model_config.model, str)
+            or model_config.provider not in HF_HUB_MODEL_PROVIDERS
+            or not model_config.is_local
+            or model_config in self._model_pool
+            or model_key in self._prefetch_futures
+        ):
+            return
 
-            self._active_model_config = new_model_config
-            self._active_model = new_model
+        model_name = model_config.model.split("/", 1)[1]
+        future: Future[Path] = Future()
 
-            return new_model
+        def prefetch():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(
+                    prefetch_model_files(
+                        model_name,
+                        revision=model_config.model_args.get("revision"),
+                        cache_dir=model_config.model_args.get("download_dir"),
+                    )
+                )
+                logger.info(f"📦  Prefetched model {model_config.name}.")
+            except Exception as e:
+                logger.error(f"❌  Failed to prefetch model {model_config.name}: {e}")
+                # Raised when the model is loaded
+                future.set_exception(e)
 
-        # Reusing the previous model
-        return cast(Model, self._active_model)
+        logger.info(f"📦  Prefetching model {model_config.name} in the background.")
+        self._prefetch_futures[model_key] = future
+        threading.Thread(
+            target=prefetch, name="evalsense-model-prefetch", daemon=True
+        ).start()
 
-    def _generate_on_dataset(
+    def _create_generation_task(
         self,
         experiment: ExperimentConfig,
         inspect_dataset: Dataset,
-        force_rerun: bool,
-        eval_kwargs: dict[str, Any] | None,
-        eval_retry_kwargs: dict[str, Any] | None,
-    ):
-        """Generates the results for a given dataset and experiment.
+        model: Model | None = None,
+    ) -> Task:
+        """Creates the Inspect AI task for the generation stage of an experiment.
 
         Args:
             experiment (ExperimentConfig): The experiment configuration.
             inspect_dataset (Dataset): The dataset to process.
-            force_rerun (bool): Whether to force rerun the experiment.
-            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
-                to the Inspect eval function. Defaults to empty dictionary when
-                None.
-            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
-                to pass to the Inspect eval function for retrying failed tasks.
-                Defaults to empty dictionary when None.
+            model (Model | None): The model to bind to the task, if any.
+
+        Returns:
+            Task: The Inspect AI task.
         """
-        prev_record = self.project.get_record(experiment.generation_record)
-        interrupted = False
+        task_metadata: dict[str, Any] = {
+            _GENERATION_RECORD_METADATA_KEY: (
+                experiment.generation_record.model_dump(mode="json")
+            )
+        }
+        if self._prefix_cache_ordering:
+            inspect_dataset, prefix_sharing = order_by_shared_prefix(inspect_dataset)
+            task_metadata[_PREFIX_SHARING_METADATA_KEY] = prefix_sharing.model_dump()
 
         # Inspect AI logs can only include serialisible task arguments, so we
         # need to use a closure to pass the dataset and solvers to the task.
@@ -186,57 +836,60 @@ class Pipeline:
                 dataset=inspect_dataset,
                 solver=experiment.generation_steps.steps,
                 name=task_name,
+                model=model,
+                metadata=task_metadata,
             )
 
-        # We need to create the task even when resuming from a previous log,
-        # otherwise Inspect will not be able to resolve it.
-        inspect_task = create_task(to_safe_filename(experiment.generation_record.label))
-        if prev_record is None or prev_record.log_location is None or force_rerun:
-            self.project.update_record(experiment.generation_record, ResultRecord())
+        return create_task(to_safe_filename(experiment.generation_record.label))
 
-            # Try generating the model outputs.
-            try:
-                eval_logs = eval(
-                    tasks=inspect_task,
-                    model=self._active_model,
-                    log_dir=str(self.project.generation_log_path),
-                    score=False,
-                    **(eval_kwargs or dict()),
-                )
-            except BaseException as e:
-                eval_logs = self.project.get_incomplete_logs(type="generation")
-                interrupted = isinstance(e, KeyboardInterrupt)
-        else:
-            logger.info(
-                f"🔁  Retrying generation using log: {prev_record.log_location}"
-            )
-            prev_log = read_eval_log(prev_record.log_location)
+    def _get_incomplete_generation_logs(
+        self, experiments: list[ExperimentConfig]
+    ) -> list[EvalLog]:
+        """Returns the incomplete generation logs possibly belonging to the given
+        experiments.
 
-            # Retry generation using the previous log
-            try:
-                eval_logs = eval_retry(
-                    tasks=prev_log,
-                    log_dir=str(self.project.generation_log_path),
-                    **(eval_retry_kwargs or dict()),
+        Logs tagged with other generation records, e.g., by experiments running
+        in other processes sharing the project, are excluded.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiment configurations.
+
+        Returns:
+            list[EvalLog]: The incomplete generation logs.
+        """
+        generation_records = {e.generation_record for e in experiments}
+        eval_logs = []
+        for eval_log in self.project.get_incomplete_logs(type="generation"):
+            log_metadata = eval_log.eval.metadata or {}
+            if (
+                _GENERATION_RECORD_METADATA_KEY in log_metadata
+                and GenerationRecord.model_validate(
+                    log_metadata[_GENERATION_RECORD_METADATA_KEY]
                 )
-            except BaseException as e:
-                eval_logs = self.project.get_incomplete_logs(type="generation")
-                interrupted = isinstance(e, KeyboardInterrupt)
+                not in generation_records
+            ):
+                continue
+            eval_logs.append(eval_log)
+        return eval_logs
 
-        # Check generation status and update the project record
+    def _record_generation_result(
+        self,
+        experiment: ExperimentConfig,
+        eval_log: EvalLog | None,
+    ):
+        """Checks the generation status and updates the project record.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration.
+            eval_log (EvalLog | None): The log returned from the generation.
+        """
         status = "error"
         error_message = "Unknown error"
         log_location = None
-        if not eval_logs:
+        if eval_log is None:
             error_message = "No log returned from an experiment."
             logger.error("❌  Generation failed: no log returned from an experiment.")
         else:
-            if len(eval_logs) > 1:
-                logger.warning(
-                    f"⚠️  Unexpected number of eval logs ({len(eval_logs)} > 1), "
-                    "results may be ignored."
-                )
-            eval_log = eval_logs[0]
             log_location = eval_log.location
 
             if eval_log.status == "error":
@@ -258,102 +911,1477 @@ class Pipeline:
                     f"✅  Generation for {experiment.generation_record.label} "
                     "completed successfully."
                 )
+                self._report_prefix_cache_usage(eval_log)
         self.project.update_record(
             experiment.generation_record,
             ResultRecord(
-                status=status, error_message=error_message, log_location=log_location
+                status=status,
+                error_message=error_message,
+                log_location=log_location,
+                subsample=self._subsample_params,
             ),
         )
 
-        # If user interrupted the generation, raise KeyboardInterrupt
-        if interrupted:
-            logger.critical("🛑  Execution was interrupted.")
-            raise KeyboardInterrupt()
+    def _report_prefix_cache_usage(self, eval_log: EvalLog):
+        """Logs the estimated prefix sharing and the prefix cache hit rate
+        reported by the model provider for a generation.
 
-    def generate(
+        Args:
+            eval_log (EvalLog): The generation log.
+        """
+        log_metadata = eval_log.eval.metadata or {}
+        if _PREFIX_SHARING_METADATA_KEY not in log_metadata:
+            return
+        prefix_sharing = PrefixSharingStats.model_validate(
+            log_metadata[_PREFIX_SHARING_METADATA_KEY]
+        )
+        message = (
+            f"🗂️  Prefix-cache-aware ordering shares "
+            f"{prefix_sharing.ordered_shared_fraction:.1%} of the prompt characters "
+            f"with the preceding prompt ({prefix_sharing.shared_fraction:.1%} in "
+            "the dataset order)"
+        )
+        cache_usage = get_prefix_cache_usage(eval_log)
+        if cache_usage is not None:
+            message += (
+                f", the provider reported a {cache_usage.hit_rate:.1%} cache hit "
+                f"rate ({cache_usage.cached_input_tokens}/"
+                f"{cache_usage.input_tokens} input tokens)"
+            )
+        logger.info(f"{message}.")
+
+    def _generate_on_dataset(
         self,
-        show_progress: bool = True,
-        force_rerun: bool = False,
-        force_reload: bool = False,
-        eval_kwargs: dict[str, Any] | None = None,
-        eval_retry_kwargs: dict[str, Any] | None = None,
+        experiment: ExperimentConfig,
+        inspect_dataset: Dataset,
+        force_rerun: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
     ):
-        """Runs the generation stage of the pipeline.
+        """Generates the results for a given dataset and experiment.
 
         Args:
-            show_progress (bool, optional): Whether to show a progress bar.
-                Defaults to True.
-            force_rerun (bool, optional): Whether to force rerunning the experiments.
-                Defaults to False.
+            experiment (ExperimentConfig): The experiment configuration.
+            inspect_dataset (Dataset): The dataset to process.
+            force_rerun (bool): Whether to force rerun the experiment.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+        """
+        prev_record = self.project.get_record(experiment.generation_record)
+        interrupted = False
+
+        # We need to create the task even when resuming from a previous log,
+        # otherwise Inspect will not be able to resolve it.
+        inspect_task = self._create_generation_task(experiment, inspect_dataset)
+        if (
+            prev_record is None
+            or prev_record.log_location is None
+            or force_rerun
+            or not self._covers_requested_samples(prev_record)
+        ):
+            self.project.update_record(experiment.generation_record, ResultRecord())
+
+            # Try generating the model outputs.
+            try:
+                with self._timed("generation", experiment.generation_record.label):
+                    eval_logs = self._eval(
+                        tasks=inspect_task,
+                        model=self._active_model,
+                        log_dir=str(self.project.generation_log_path),
+                        score=False,
+                        **(eval_kwargs or dict()),
+                    )
+            except BaseException as e:
+                eval_logs = self._get_incomplete_generation_logs([experiment])
+                interrupted = isinstance(e, KeyboardInterrupt)
+        else:
+            logger.info(
+                f"🔁  Retrying generation using log: {prev_record.log_location}"
+            )
+            prev_log = read_eval_log(prev_record.log_location)
+
+            # Retry generation using the previous log
+            try:
+                with self._timed("generation", experiment.generation_record.label):
+                    eval_logs = self._eval_retry(
+                        tasks=prev_log,
+                        log_dir=str(self.project.generation_log_path),
+                        **(eval_retry_kwargs or dict()),
+                    )
+            except BaseException as e:
+                eval_logs = self._get_incomplete_generation_logs([experiment])
+                interrupted = isinstance(e, KeyboardInterrupt)
+
+        # Check generation status and update the project record
+        eval_log = None
+        if eval_logs:
+            if len(eval_logs) > 1:
+                logger.warning(
+                    f"⚠️  Unexpected number of eval logs ({len(eval_logs)} > 1), "
+                    "results may be ignored."
+                )
+            eval_log = eval_logs[0]
+        self._record_generation_result(experiment, eval_log)
+
+        # If user interrupted the generation, raise KeyboardInterrupt
+        if interrupted:
+            logger.critical("🛑  Execution was interrupted.")
+            raise KeyboardInterrupt()
+
+    def _load_inspect_dataset(
+        self,
+        experiment: ExperimentConfig,
+        force_reload: bool,
+    ) -> Dataset:
+        """Loads and preprocesses the dataset for a given experiment.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the dataset.
+
+        Returns:
+            Dataset: The preprocessed Inspect AI dataset.
+        """
+        # Load the dataset
+        logger.info(f"▶️  Loading dataset {experiment.dataset_manager.name}.")
+        dataset_manager = experiment.dataset_manager
+        label = experiment.generation_record.label
+        with self._timed("dataset_load", label):
+            hf_dataset = dataset_manager.load(
+                retrieve=not force_reload,
+                cache=True,
+                force_retrieve=force_reload,
+            )
+
+        # Preprocess the dataset
+        logger.info(
+            "▶️  Preprocessing dataset with task preprocessor "
+            f"{experiment.task_preprocessor.name}."
+        )
+        task_preprocessor = experiment.task_preprocessor
+        with self._timed("task_preprocessing", label):
+            dataset = task_preprocessor(
+                hf_dataset,
+                dataset_manager,
+                field_spec=experiment.field_spec,
+                force_reprocess=force_reload,
+            )
+            if self._subsample is not None:
+                full_size = len(dataset)
+                dataset = select_stratified_subsample(dataset, self._subsample)
+                logger.info(
+                    f"🔍  Using a subsample of {len(dataset)}/{full_size} samples."
+                )
+        return dataset
+
+    def _generate_missing_samples(
+        self,
+        experiment: ExperimentConfig,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+    ):
+        """Generates the samples missing from the existing successful generation
+        log for a given experiment and appends them to the log.
+
+        The samples are matched by their IDs, so the dataset samples need to have
+        stable IDs. The evaluations depending on the generations are invalidated
+        when new samples are appended.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the dataset.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+        """
+        record_key = experiment.generation_record
+        prev_record = cast(ResultRecord, self.project.get_record(record_key))
+        prev_log = read_eval_log(cast(str, prev_record.log_location), header_only=True)
+        generated_ids = prev_log.eval.dataset.sample_ids
+        if generated_ids is None:
+            generated_ids = [
+                sample.id
+                for sample in read_eval_log(cast(str, prev_log.location)).samples or []
+            ]
+
+        inspect_dataset = self._load_inspect_dataset(experiment, force_reload)
+        if any(sample.id is None for sample in inspect_dataset):
+            logger.warning(
+                "⚠️  Incremental generation skipped — the dataset samples "
+                "do not have IDs."
+            )
+            return
+        generated_ids = set(generated_ids)
+        missing_dataset = inspect_dataset.filter(
+            lambda sample: sample.id not in generated_ids
+        )
+        if len(missing_dataset) == 0:
+            logger.info("⏭️  Generation skipped — already completed.")
+            return
+
+        logger.info(
+            f"➕  Generating {len(missing_dataset)} new samples for {record_key.label}."
+        )
+        model = self._load_model(experiment.model_config)
+        log_dir = self.project.increment_log_path(record_key)
+        shutil.rmtree(log_dir, ignore_errors=True)
+        try:
+            with self._timed("generation", record_key.label):
+                eval_logs = self._eval(
+                    tasks=self._create_generation_task(experiment, missing_dataset),
+                    model=model,
+                    log_dir=str(log_dir),
+                    score=False,
+                    **(eval_kwargs or dict()),
+                )
+        except KeyboardInterrupt:
+            logger.critical("🛑  Execution was interrupted.")
+            raise
+        except BaseException as e:
+            eval_logs = []
+            logger.error(f"❌  Generation failed due to an error: {e}")
+
+        if not eval_logs or eval_logs[0].status != "success":
+            logger.error(
+                "❌  Generation of the new samples did not complete successfully "
+                "— keeping the existing generations."
+            )
+            return
+        self.project.append_generations(
+            record_key, eval_logs[0], subsample=self._subsample_params
+        )
+        logger.info(
+            f"✅  Appended {len(missing_dataset)} new samples to the generations "
+            f"for {record_key.label}."
+        )
+
+    def _generate_experiment(
+        self,
+        experiment: ExperimentConfig,
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        incremental: bool = False,
+    ):
+        """Runs the generation stage for a given experiment.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration.
+            force_rerun (bool): Whether to force rerun the experiment.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the dataset.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+            incremental (bool): Whether to generate the samples missing from
+                the existing successful generations. Defaults to False.
+        """
+        logger.info(f"🔄  Starting generation for {experiment.generation_record.label}")
+
+        # Check if we we already have existing generations
+        prev_record = self.project.get_record(
+            experiment.generation_record,
+        )
+        if (
+            prev_record is not None
+            and prev_record.status == "success"
+            and not force_rerun
+        ):
+            if incremental:
+                self._generate_missing_samples(experiment, force_reload, eval_kwargs)
+                self._submit_background_evaluations(experiment)
+                return
+            if self._covers_requested_samples(prev_record):
+                logger.info("⏭️  Generation skipped — already completed.")
+                self._submit_background_evaluations(experiment)
+                return
+            logger.info(
+                "🔁  Existing generations only cover a subsample of the dataset "
+                "— generating all requested samples."
+            )
+
+        inspect_dataset = self._load_inspect_dataset(experiment, force_reload)
+        self._load_model(experiment.model_config)
+
+        self._generate_on_dataset(
+            experiment,
+            inspect_dataset,
+            force_rerun=force_rerun,
+            eval_kwargs=eval_kwargs,
+            eval_retry_kwargs=eval_retry_kwargs,
+        )
+        self._submit_background_evaluations(experiment)
+
+    def _submit_background_evaluations(self, experiment: ExperimentConfig):
+        """Hands the model-free evaluations of an experiment to the background
+        evaluation worker, if the worker is running and the generation succeeded.
+
+        Args:
+            experiment (ExperimentConfig): The experiment whose generation stage
+                has just been completed.
+        """
+        if self._evaluation_worker is None:
+            return
+        record = self.project.get_record(experiment.generation_record)
+        if record is None or record.status != "success":
+            return
+
+        evaluation_experiments = [
+            evaluation_experiment
+            for evaluation_experiment in self.evaluation_experiments
+            if _is_background_evaluable(evaluation_experiment)
+            and evaluation_experiment.generation_record == experiment.generation_record
+        ]
+        if evaluation_experiments:
+            self._evaluation_worker.submit(evaluation_experiments)
+
+    def _run_pending_generations(
+        self,
+        experiments: list[ExperimentConfig],
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        incremental: bool = False,
+        progress: tqdm | None = None,
+    ) -> list[ExperimentConfig]:
+        """Skips, extends or retries the experiments with previous generation
+        records.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to check.
+            force_rerun (bool): Whether to force rerun the experiments.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the datasets.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+            incremental (bool): Whether to generate the samples missing from
+                the existing successful generations. Defaults to False.
+            progress (tqdm | None): The progress bar to update, if any.
+
+        Returns:
+            list[ExperimentConfig]: The experiments to be generated from scratch.
+        """
+        new_experiments = []
+        for experiment in experiments:
+            prev_record = self.project.get_record(experiment.generation_record)
+            if (
+                prev_record is None
+                or force_rerun
+                or (
+                    prev_record.status != "success" and prev_record.log_location is None
+                )
+            ):
+                new_experiments.append(experiment)
+                continue
+
+            # Skip, extend or retry the experiment using the standard procedure
+            self._generate_experiment(
+                experiment,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                incremental=incremental,
+            )
+            if progress is not None:
+                progress.update(1)
+        return new_experiments
+
+    def _generate_batch(
+        self,
+        experiments: list[tuple[ExperimentConfig, Model]],
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        max_tasks: int,
+        progress: tqdm | None = None,
+    ):
+        """Runs the generation stage for several experiments in a single
+        multi-task Inspect evaluation.
+
+        Args:
+            experiments (list[tuple[ExperimentConfig, Model]]): The experiments
+                to run, together with the models to use for them.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the datasets.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            max_tasks (int): The maximum number of experiments to run in parallel.
+            progress (tqdm | None): The progress bar to update, if any.
+        """
+        inspect_tasks = []
+        for experiment, model in experiments:
+            logger.info(
+                f"🔄  Starting generation for {experiment.generation_record.label}"
+            )
+            inspect_dataset = self._load_inspect_dataset(experiment, force_reload)
+            inspect_tasks.append(
+                self._create_generation_task(experiment, inspect_dataset, model=model)
+            )
+            self.project.update_record(experiment.generation_record, ResultRecord())
+
+        # Try generating the model outputs.
+        interrupted = False
+        try:
+            with self._timed(
+                "generation",
+                "; ".join(e.generation_record.label for e, _ in experiments),
+            ):
+                eval_logs = self._eval(
+                    tasks=inspect_tasks,
+                    log_dir=str(self.project.generation_log_path),
+                    score=False,
+                    **({"max_tasks": max_tasks} | (eval_kwargs or dict())),
+                )
+        except BaseException as e:
+            eval_logs = self._get_incomplete_generation_logs(
+                [experiment for experiment, _ in experiments]
+            )
+            interrupted = isinstance(e, KeyboardInterrupt)
+
+        # Map the logs back to the experiments and update the records
+        eval_logs_by_record = {}
+        for eval_log in eval_logs:
+            log_metadata = eval_log.eval.metadata or {}
+            if _GENERATION_RECORD_METADATA_KEY in log_metadata:
+                record = GenerationRecord.model_validate(
+                    log_metadata[_GENERATION_RECORD_METADATA_KEY]
+                )
+                eval_logs_by_record[record] = eval_log
+        for experiment, _ in experiments:
+            self._record_generation_result(
+                experiment,
+                eval_logs_by_record.get(experiment.generation_record),
+            )
+            self._submit_background_evaluations(experiment)
+            if progress is not None:
+                progress.update(1)
+
+        # If user interrupted the generation, raise KeyboardInterrupt
+        if interrupted:
+            logger.critical("🛑  Execution was interrupted.")
+            raise KeyboardInterrupt()
+
+    def _generate_concurrently(
+        self,
+        experiments: list[ExperimentConfig],
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        max_tasks_per_model: int,
+        incremental: bool = False,
+        progress: tqdm | None = None,
+    ):
+        """Runs the generation stage for experiments using different models
+        concurrently.
+
+        The pending experiments are run in waves of multi-task Inspect
+        evaluations, each including at most `max_tasks_per_model` experiments
+        for every model. Experiments resuming from previous logs are retried
+        one after another.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to run. The
+                experiments should use models not running on the local machine.
+            force_rerun (bool): Whether to force rerun the experiments.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the datasets.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+            max_tasks_per_model (int): The maximum number of experiments to run
+                concurrently for a single model.
+            incremental (bool): Whether to generate the samples missing from
+                the existing successful generations. Defaults to False.
+            progress (tqdm | None): The progress bar to update, if any.
+        """
+        pending_experiments: dict[str, list[ExperimentConfig]] = {}
+        model_configs: dict[str, ModelConfig] = {}
+        for experiment in self._run_pending_generations(
+            experiments,
+            force_rerun=force_rerun,
+            force_reload=force_reload,
+            eval_kwargs=eval_kwargs,
+            eval_retry_kwargs=eval_retry_kwargs,
+            incremental=incremental,
+            progress=progress,
+        ):
+            model_key = cast(str, get_model_key(experiment.model_config))
+            pending_experiments.setdefault(model_key, []).append(experiment)
+            model_configs.setdefault(model_key, experiment.model_config)
+        if not pending_experiments:
+            return
+
+        logger.info(
+            f"🔀  Generating concurrently with {len(pending_experiments)} models."
+        )
+        models = {
+            model_key: self._create_model(model_config)
+            for model_key, model_config in model_configs.items()
+        }
+        try:
+            while pending_experiments:
+                wave: list[tuple[ExperimentConfig, Model]] = []
+                for model_key in list(pending_experiments):
+                    model_experiments = pending_experiments[model_key]
+                    wave.extend(
+                        (experiment, models[model_key])
+                        for experiment in model_experiments[:max_tasks_per_model]
+                    )
+                    if len(model_experiments) > max_tasks_per_model:
+                        pending_experiments[model_key] = model_experiments[
+                            max_tasks_per_model:
+                        ]
+                    else:
+                        del pending_experiments[model_key]
+                self._generate_batch(
+                    wave,
+                    force_reload=force_reload,
+                    eval_kwargs=eval_kwargs,
+                    max_tasks=len(wave),
+                    progress=progress,
+                )
+        finally:
+            # Only close the models created here, not the instances passed in
+            for model_key, model in models.items():
+                if isinstance(model_configs[model_key].model, str):
+                    self._close_model(model, model_configs[model_key])
+
+    def _generate_sample_shard(
+        self,
+        experiment: ExperimentConfig,
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+    ):
+        """Runs the generation stage for the current sample shard of an experiment
+        and merges the sample shards if all of them have been completed.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration.
+            force_rerun (bool): Whether to force rerun the experiment.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the dataset.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+        """
+        shard_index, num_shards = cast(tuple[int, int], self._sample_shard)
+        record_key = experiment.generation_record
+        logger.info(
+            f"🔄  Starting generation for {record_key.label} "
+            f"(sample shard {shard_index + 1}/{num_shards})"
+        )
+
+        prev_record = self.project.get_record(record_key)
+        if (
+            prev_record is not None
+            and prev_record.status == "success"
+            and not force_rerun
+            and self._covers_requested_samples(prev_record)
+        ):
+            logger.info("⏭️  Generation skipped — already completed.")
+            return
+
+        log_dir = self.project.sample_shard_log_path(
+            record_key, shard_index, num_shards
+        )
+        prev_log = self.project.get_sample_shard_log(
+            record_key, shard_index, num_shards, header_only=True
+        )
+        if prev_log is not None and prev_log.status == "success" and not force_rerun:
+            logger.info("⏭️  Generation skipped — sample shard already completed.")
+        else:
+            inspect_dataset = get_sample_shard(
+                self._load_inspect_dataset(experiment, force_reload),
+                shard_index,
+                num_shards,
+            )
+            model = self._load_model(experiment.model_config)
+
+            # We need to create the task even when resuming from a previous log,
+            # otherwise Inspect will not be able to resolve it.
+            inspect_task = self._create_generation_task(experiment, inspect_dataset)
+            try:
+                with self._timed("generation", record_key.label):
+                    if prev_log is None or force_rerun:
+                        shutil.rmtree(log_dir, ignore_errors=True)
+                        eval_logs = self._eval(
+                            tasks=inspect_task,
+                            model=model,
+                            log_dir=str(log_dir),
+                            score=False,
+                            **(eval_kwargs or dict()),
+                        )
+                    else:
+                        logger.info(
+                            f"🔁  Retrying generation using log: {prev_log.location}"
+                        )
+                        eval_logs = self._eval_retry(
+                            tasks=prev_log.location,
+                            log_dir=str(log_dir),
+                            **(eval_retry_kwargs or dict()),
+                        )
+            except KeyboardInterrupt:
+                logger.critical("🛑  Execution was interrupted.")
+                raise
+            except BaseException as e:
+                eval_logs = []
+                logger.error(f"❌  Generation failed due to an error: {e}")
+
+            if not eval_logs or eval_logs[0].status != "success":
+                logger.error(
+                    f"❌  Generation for sample shard {shard_index + 1}/{num_shards} "
+                    "did not complete successfully."
+                )
+                return
+
+        if self.project.merge_sample_shards(
+            record_key, num_shards, subsample=self._subsample_params
+        ):
+            logger.info(
+                f"✅  Generation for {record_key.label} completed successfully — "
+                f"merged {num_shards} sample shards."
+            )
+        else:
+            logger.info(
+                f"⏳  Generation for sample shard {shard_index + 1}/{num_shards} "
+                "completed — waiting for the remaining sample shards."
+            )
+
+    def merge_sample_shards(self, num_sample_shards: int):
+        """Merges the logs for the sample shards of all experiments into single
+        generation logs, if all sample shards have been completed successfully.
+
+        The sample shards are normally merged automatically by the worker
+        completing the last shard, so this is only needed for recovering from
+        interrupted merges.
+
+        Args:
+            num_sample_shards (int): The total number of sample shards.
+        """
+        for experiment in self.generation_experiments:
+            record_key = experiment.generation_record
+            if self.project.merge_sample_shards(
+                record_key, num_sample_shards, subsample=self._subsample_params
+            ):
+                logger.info(f"✅  Generations for {record_key.label} are merged.")
+            else:
+                logger.warning(
+                    f"⚠️  Generations for {record_key.label} have incomplete "
+                    "sample shards."
+                )
+
+    def _generate_experiments(
+        self,
+        experiments: list[ExperimentConfig],
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        concurrent_api_models: bool,
+        max_tasks_per_model: int,
+        incremental: bool = False,
+        progress: tqdm | None = None,
+    ):
+        """Runs the generation stage for the given experiments.
+
+        Consecutive experiments using the same model are run in a single
+        multi-task Inspect evaluation with the loaded model.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to run.
+            force_rerun (bool): Whether to force rerun the experiments.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the datasets.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function. Defaults to empty dictionary when
+                None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+            concurrent_api_models (bool): Whether to run the experiments using
+                models not running on the local machine concurrently.
+            max_tasks_per_model (int): The maximum number of experiments to run
+                concurrently for a single model.
+            incremental (bool): Whether to generate the samples missing from
+                the existing successful generations. Defaults to False.
+            progress (tqdm | None): The progress bar to update, if any.
+        """
+        if self._sample_shard is not None:
+            for experiment in experiments:
+                self._generate_sample_shard(
+                    experiment,
+                    force_rerun=force_rerun,
+                    force_reload=force_reload,
+                    eval_kwargs=eval_kwargs,
+                    eval_retry_kwargs=eval_retry_kwargs,
+                )
+                if progress is not None:
+                    progress.update(1)
+            return
+
+        if concurrent_api_models:
+            self._generate_concurrently(
+                [e for e in experiments if not e.model_config.is_local],
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                max_tasks_per_model=max_tasks_per_model,
+                incremental=incremental,
+                progress=progress,
+            )
+            experiments = [e for e in experiments if e.model_config.is_local]
+
+        model_groups = [
+            list(model_experiments)
+            for _, model_experiments in groupby(
+                experiments, key=lambda e: get_model_key(e.model_config)
+            )
+        ]
+        for i, model_experiments in enumerate(model_groups):
+            new_experiments = self._run_pending_generations(
+                model_experiments,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                incremental=incremental,
+                progress=progress,
+            )
+            if not new_experiments:
+                continue
+
+            model = self._load_model(new_experiments[0].model_config)
+
+            # Prefetch the next model needed while generating with this one
+            for next_experiments in model_groups[i + 1 :]:
+                if any(
+                    self._is_pending(e.generation_record, force_rerun)
+                    for e in next_experiments
+                ):
+                    self._prefetch_model(next_experiments[0].model_config)
+                    break
+
+            self._generate_batch(
+                [(experiment, model) for experiment in new_experiments],
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                max_tasks=max_tasks_per_model,
+                progress=progress,
+            )
+
+    def generate(
+        self,
+        show_progress: bool = True,
+        force_rerun: bool = False,
+        force_reload: bool = False,
+        eval_kwargs: dict[str, Any] | None = None,
+        eval_retry_kwargs: dict[str, Any] | None = None,
+        concurrent_api_models: bool = False,
+        max_tasks_per_model: int = 1,
+        incremental: bool = False,
+    ):
+        """Runs the generation stage of the pipeline.
+
+        Args:
+            show_progress (bool, optional): Whether to show a progress bar.
+                Defaults to True.
+            force_rerun (bool, optional): Whether to force rerunning the experiments.
+                Defaults to False.
             force_reload (bool, optional): Whether to force reloading and
                 reprocessing the datasets. Defaults to False.
             eval_kwargs (dict[str, Any], optional): Additional arguments to pass
                 to the Inspect eval function. Defaults to empty dictionary when
                 None.
-            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
-                to pass to the Inspect eval function for retrying failed tasks.
-                Defaults to empty dictionary when None.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+                Defaults to empty dictionary when None.
+            concurrent_api_models (bool, optional): Whether to run the experiments
+                for different models not running on the local machine (e.g.,
+                hosted API models) concurrently. Experiments using local models
+                are still run one after another. Defaults to False.
+            max_tasks_per_model (int, optional): The maximum number of experiments
+                to run concurrently for a single model. The pending experiments for
+                the same model are run in a single multi-task Inspect evaluation,
+                sharing the model connections. Defaults to 1.
+            incremental (bool, optional): Whether to extend the existing successful
+                generations with the samples newly added to the datasets. The
+                sample IDs in the current datasets are compared against the
+                existing generation logs, only the missing samples are generated
+                and appended to the logs, and the dependent evaluations are
+                invalidated. Requires the dataset samples to have stable IDs.
+                Defaults to False.
+
+        Raises:
+            ValueError: If incremental generation is requested when running
+                a sample shard.
+        """
+        if incremental and self._sample_shard is not None:
+            raise ValueError(
+                "Incremental generation is not supported when running a sample shard."
+            )
+
+        generation_experiments = self.generation_experiments
+        with tqdm(
+            total=len(generation_experiments),
+            disable=not show_progress,
+            desc="Experiment Generation",
+        ) as progress:
+            self._generate_experiments(
+                generation_experiments,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                concurrent_api_models=concurrent_api_models,
+                max_tasks_per_model=max_tasks_per_model,
+                incremental=incremental,
+                progress=progress,
+            )
+        self._cleanup_active_model()
+        logger.info("✨  Generation tasks completed.")
+
+    async def agenerate(self, **kwargs: Any):
+        """Runs the generation stage of the pipeline asynchronously.
+
+        The Inspect evaluations are run in the current event loop, allowing
+        multiple pipelines to run side by side and share the model connections.
+        The evaluations of different pipelines are serialised, as Inspect does
+        not support concurrent evaluations within a single process.
+
+        Args:
+            **kwargs (Any): The arguments to pass to `Pipeline.generate`.
+
+        Raises:
+            RuntimeError: If the pipeline is already running asynchronously.
+        """
+        await self._run_async(self.generate, **kwargs)
+
+    def _record_evaluation_result(
+        self,
+        experiment: ExperimentConfig,
+        score_log: EvalLog | None,
+        exception: BaseException | None = None,
+    ):
+        """Checks the evaluation status and updates the project record.
+
+        Args:
+            experiment (ExperimentConfig): The evaluated experiment.
+            score_log (EvalLog | None): The log returned from the evaluation.
+            exception (BaseException | None): The exception raised during the
+                evaluation, if any.
+        """
+        status = "error"
+        error_message = "Unknown error"
+        log_location = None
+        partial = False
+        if not score_log:
+            error_message = "No log returned from evaluation."
+            logger.error("❌  Evaluation failed: no log returned from evaluation.")
+        else:
+            log_location = score_log.location
+            if score_log.status == "error" or exception is not None:
+                if score_log.error is not None:
+                    error_message = score_log.error.message
+                elif exception is not None:
+                    error_message = str(exception)
+                logger.error(f"❌  Evaluation failed due to an error: {error_message}")
+            elif score_log.status == "cancelled":
+                error_message = "Evaluation was cancelled."
+                logger.error("❌  Evaluation was cancelled.")
+            elif score_log.status == "success":
+                status = "success"
+                error_message = None
+                logger.info(
+                    f"✅  Evaluation for {experiment.evaluation_record.label} "
+                    "completed successfully."
+                )
+            early_stopping = (score_log.eval.metadata or {}).get(
+                _EARLY_STOPPING_METADATA_KEY
+            )
+            if early_stopping is not None:
+                result = EarlyStoppingResult.model_validate(early_stopping)
+                partial = result.scored_samples < result.total_samples
+        # The evaluation covers the same samples as the scored generations
+        generation_result = self.project.get_record(experiment.generation_record)
+        self.project.update_record(
+            experiment.evaluation_record,
+            ResultRecord(
+                status=status,
+                error_message=error_message,
+                log_location=log_location,
+                subsample=(
+                    generation_result.subsample
+                    if generation_result is not None
+                    else self._subsample_params
+                ),
+                partial=partial,
+            ),
+        )
+        if status == "success" and score_log is not None:
+            with self._timed("score_index", experiment.evaluation_record.label):
+                self.project.write_scores(experiment.evaluation_record, score_log)
+
+    def _cleanup_evaluator(self, evaluator: Evaluator):
+        """Performs the evaluator cleanup, if needed.
+
+        Args:
+            evaluator (Evaluator): The evaluator to clean up.
+        """
+        if evaluator.cleanup_fun is not None:
+            try:
+                with self._timed("evaluator_cleanup", evaluator.name):
+                    evaluator.cleanup_fun()
+            except Exception as e:
+                logger.error(
+                    f"❌  Error during cleanup for {evaluator.name}: {e}. "
+                    "Please check the evaluator's cleanup function."
+                )
+
+    def _prepare_scorer(self, evaluator: Evaluator) -> Scorer | None:
+        """Prepares the scorer for the given evaluator, loading the model
+        required by the evaluator if needed.
+
+        Args:
+            evaluator (Evaluator): The evaluator for which to prepare the scorer.
+
+        Returns:
+            Scorer | None: The prepared scorer, or None if the scorer could not
+                be prepared.
+        """
+        scorer = evaluator.scorer
+        if isinstance(scorer, ScorerFactory):
+            if evaluator.model_config is None:
+                logger.error(
+                    "❌  Using ScorerFactory as a scorer for evaluation requires a "
+                    "model config to specify the used model. Skipping evaluation."
+                )
+                return None
+            scorer = scorer.create_scorer(self._load_model(evaluator.model_config))
+        return scorer
+
+    def _checkpoint_scorer(
+        self,
+        experiment: ExperimentConfig,
+        scorer: Scorer,
+        score_log: EvalLog,
+        force_rerun: bool,
+    ) -> tuple[Scorer, ScoreCheckpoint | None]:
+        """Wraps a scorer to checkpoint the sample scores, resuming from the
+        previous checkpoint for the experiment if it exists.
+
+        Args:
+            experiment (ExperimentConfig): The evaluated experiment.
+            scorer (Scorer): The scorer to wrap.
+            score_log (EvalLog): The log to be scored.
+            force_rerun (bool): Whether to discard the previous checkpoint.
+
+        Returns:
+            tuple[Scorer, ScoreCheckpoint | None]: The wrapped scorer and the
+                score checkpoint, or the original scorer and None if
+                checkpointing is disabled.
+        """
+        if self._evaluation_checkpoint_interval is None:
+            return scorer, None
+
+        checkpoint_path = self.project.evaluation_checkpoint_path(
+            experiment.evaluation_record
+        )
+        if force_rerun:
+            checkpoint_path.unlink(missing_ok=True)
+        checkpoint = ScoreCheckpoint(
+            checkpoint_path,
+            log_id=score_log.eval.eval_id,
+            flush_interval=self._evaluation_checkpoint_interval,
+        )
+        if len(checkpoint):
+            logger.info(
+                f"🔁  Resuming evaluation from a checkpoint with {len(checkpoint)} "
+                "scored samples."
+            )
+        return checkpointed_scorer(scorer, checkpoint), checkpoint
+
+    @staticmethod
+    def _finalise_checkpoint(checkpoint: ScoreCheckpoint | None, succeeded: bool):
+        """Removes the score checkpoint after a successful evaluation, or flushes
+        the remaining scores to disk for resuming a failed evaluation.
+
+        Args:
+            checkpoint (ScoreCheckpoint | None): The score checkpoint, if any.
+            succeeded (bool): Whether the evaluation succeeded.
+        """
+        if checkpoint is None:
+            return
+        if succeeded:
+            checkpoint.remove()
+        else:
+            checkpoint.flush()
+
+    def _annotate_subsample_intervals(self, score_log: EvalLog):
+        """Stores the bootstrap confidence intervals for the mean of the primary
+        score in the metadata of an evaluation log, if subsampling is enabled.
+
+        Args:
+            score_log (EvalLog): The scored evaluation log.
+        """
+        if self._subsample is None or not score_log.samples:
+            return
+        intervals = get_subsample_intervals(score_log.samples, self._subsample)
+        score_log.eval.metadata = (score_log.eval.metadata or {}) | {
+            _SUBSAMPLE_METADATA_KEY: {
+                "fraction": self._subsample.fraction,
+                "stratify_by": self._subsample.stratify_by,
+                "intervals": [interval.model_dump() for interval in intervals],
+            }
+        }
+        overall = intervals[0]
+        if overall.ci_lower is not None and overall.ci_upper is not None:
+            logger.info(
+                f"📊  Subsample mean {overall.mean:.4f} over {overall.samples} "
+                f"samples, {self._subsample.confidence:.0%} bootstrap CI "
+                f"[{overall.ci_lower:.4f}, {overall.ci_upper:.4f}]."
+            )
+
+    def _score_with_early_stopping(
+        self,
+        log: EvalLog,
+        scorer: Scorer,
+        checkpoint: ScoreCheckpoint | None,
+        config: EarlyStoppingConfig,
+        score_kwargs: dict[str, Any] | None,
+    ) -> EvalLog:
+        """Scores the samples in a random order until the confidence interval
+        for the mean of the primary score is narrow enough.
+
+        The samples of a random permutation are scored in batches, with the
+        interval checked after each batch. Once the scoring stops, the metrics
+        are computed over all scored samples in a final pass, which reuses the
+        checkpointed scores instead of scoring the samples again. The evaluation
+        only stops early if the scores vary, since the interval for identical
+        scores is degenerate.
+
+        Args:
+            log (EvalLog): The log to score.
+            scorer (Scorer): The scorer to use.
+            checkpoint (ScoreCheckpoint | None): The checkpoint used by the
+                scorer, if any. If None, the scores are reused through an
+                in-memory checkpoint.
+            config (EarlyStoppingConfig): The early-stopping configuration.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
+
+        Returns:
+            EvalLog: The scored log, including only the scored samples.
+        """
+        if checkpoint is None:
+            checkpoint = ScoreCheckpoint(None, log_id=log.eval.eval_id)
+            scorer = checkpointed_scorer(scorer, checkpoint)
+
+        samples = list(log.samples or [])
+        random.Random(config.seed).shuffle(samples)
+        values: list[float] = []
+        num_samples = 0
+        batch_size = config.min_samples
+        while True:
+            batch = samples[num_samples : num_samples + batch_size]
+            batch_log = self._score(
+                log=log.model_copy(update={"samples": batch}),
+                scorers=scorer,
+                action="overwrite",
+                **(score_kwargs or dict()),
+            )
+            values.extend(
+                get_primary_score_values(batch_log.samples or [], config.score_key)
+            )
+            num_samples += len(batch)
+            interval = config.confidence_interval(values) if len(values) >= 2 else None
+            converged = (
+                interval is not None
+                and (interval[1] - interval[0]) / 2 <= config.max_ci_half_width
+                and min(values) < max(values)
+            )
+            if converged or num_samples >= len(samples):
+                break
+            batch_size = config.batch_size
+
+        # Compute the metrics over all scored samples using the saved scores
+        score_log = self._score(
+            log=log.model_copy(update={"samples": samples[:num_samples]}),
+            scorers=scorer,
+            action="overwrite",
+            **(score_kwargs or dict()),
+        )
+
+        result = EarlyStoppingResult(
+            scored_samples=num_samples,
+            total_samples=len(samples),
+            mean=sum(values) / len(values) if values else None,
+            ci_lower=interval[0] if interval is not None else None,
+            ci_upper=interval[1] if interval is not None else None,
+            converged=converged,
+        )
+        score_log.eval.metadata = (score_log.eval.metadata or {}) | {
+            _EARLY_STOPPING_METADATA_KEY: result.model_dump()
+        }
+        if converged and interval is not None:
+            logger.info(
+                f"⏹️  Evaluation stopped early after {num_samples}/{len(samples)} "
+                f"samples — mean {result.mean:.4f}, {config.confidence:.0%} CI "
+                f"[{interval[0]:.4f}, {interval[1]:.4f}]."
+            )
+        else:
+            logger.info(
+                f"⏹️  Confidence interval target not reached — scored all "
+                f"{len(samples)} samples."
+            )
+        return score_log
+
+    def _evaluate_experiment(
+        self,
+        experiment: ExperimentConfig,
+        force_rerun: bool,
+        score_kwargs: dict[str, Any] | None,
+    ):
+        """Evaluates the generations for a given experiment.
+
+        Args:
+            experiment (ExperimentConfig): The experiment configuration. The
+                experiment must have an evaluator.
+            force_rerun (bool): Whether to force rerun the experiment.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
+        """
+        logger.info(f"🔄  Starting evaluation for {experiment.evaluation_record.label}")
+
+        # Check if we have a record from the generations.
+        prev_record = self.project.get_record(
+            experiment.evaluation_record,
+            init_eval_record_from_generations=True,
+        )
+        if prev_record is None or prev_record.log_location is None:
+            logger.error("❌  Evaluation skipped — no valid generations found.")
+            return
+        if self._skip_completed_evaluation(experiment, prev_record, force_rerun):
+            return
+        if prev_record.partial:
+            # The log of a partial evaluation only includes the scored samples
+            self.project.remove_record(experiment.evaluation_record)
+            prev_record = self.project.get_record(
+                experiment.evaluation_record,
+                init_eval_record_from_generations=True,
+            )
+            if prev_record is None or prev_record.log_location is None:
+                logger.error("❌  Evaluation skipped — no valid generations found.")
+                return
+
+        # Prepare the scorer
+        # Safe cast, as the caller only passes experiments with evaluators
+        evaluator = cast(Evaluator, experiment.evaluator)
+        scorer = self._prepare_scorer(evaluator)
+        if scorer is None:
+            return
+
+        # Retrieve the initial evaluation log.
+        label = experiment.evaluation_record.label
+        with self._timed("log_read", label):
+            init_score_log = self.project.get_log(
+                experiment.evaluation_record,
+            )
+        if init_score_log is None:
+            logger.error(
+                "❌  Couldn't load initial evaluation log. Skipping evaluation."
+            )
+            return
+        scorer, checkpoint = self._checkpoint_scorer(
+            experiment, scorer, init_score_log, force_rerun
+        )
+
+        # Try scoring the model outputs in the log
+        exception = None
+        try:
+            with self._timed("scoring", label):
+                if self._early_stopping is None:
+                    score_log = self._score(
+                        log=init_score_log,
+                        scorers=scorer,
+                        action="overwrite",
+                        **(score_kwargs or dict()),
+                    )
+                else:
+                    score_log = self._score_with_early_stopping(
+                        init_score_log,
+                        scorer=scorer,
+                        checkpoint=checkpoint,
+                        config=self._early_stopping,
+                        score_kwargs=score_kwargs,
+                    )
+        except BaseException as e:
+            score_log = self.project.get_log(experiment.evaluation_record)
+            exception = e
+        score_log = cast(EvalLog, score_log)
+        if exception is None:
+            self._annotate_subsample_intervals(score_log)
+        with self._timed("log_write", label):
+            write_eval_log(score_log, location=score_log.location)
+
+        self._record_evaluation_result(experiment, score_log, exception)
+        self._finalise_checkpoint(
+            checkpoint, exception is None and score_log.status == "success"
+        )
+        self._cleanup_evaluator(evaluator)
+
+        # If user interrupted the evaluation, raise KeyboardInterrupt
+        if isinstance(exception, KeyboardInterrupt):
+            logger.critical("🛑  Execution was interrupted.")
+            raise KeyboardInterrupt()
+
+    def _evaluate_experiments_fused(
+        self,
+        experiments: list[ExperimentConfig],
+        force_rerun: bool,
+        score_kwargs: dict[str, Any] | None,
+    ):
+        """Evaluates the generations for experiments sharing the same generation
+        record and evaluation model in a single scoring pass.
+
+        The generation log is read only once and scored with the scorers of all
+        the pending evaluators at the same time. The results are then split into
+        separate logs and records for the individual evaluators.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to evaluate.
+                All experiments must have an evaluator and share the same
+                generation record and evaluator model config.
+            force_rerun (bool): Whether to force rerun the experiments.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
         """
-        for experiment in tqdm(
-            self.generation_experiments,
-            disable=not show_progress,
-            desc="Experiment Generation",
-        ):
-            logger.info(
-                f"🔄  Starting generation for {experiment.generation_record.label}"
-            )
+        if self._early_stopping is not None:
+            # The samples used for early stopping depend on the individual scores
+            for experiment in experiments:
+                self._evaluate_experiment(
+                    experiment,
+                    force_rerun=force_rerun,
+                    score_kwargs=score_kwargs,
+                )
+            return
 
-            # Check if we we already have existing generations
-            prev_record = self.project.get_record(
-                experiment.generation_record,
-            )
-            if (
-                prev_record is not None
-                and prev_record.status == "success"
-                and not force_rerun
+        pending_experiments: list[ExperimentConfig] = []
+        for experiment in experiments:
+            prev_record = self.project.get_record(experiment.evaluation_record)
+            if prev_record is not None and self._skip_completed_evaluation(
+                experiment, prev_record, force_rerun
             ):
-                logger.info("⏭️  Generation skipped — already completed.")
                 continue
+            pending_experiments.append(experiment)
 
-            # Load the dataset
-            logger.info(f"▶️  Loading dataset {experiment.dataset_manager.name}.")
-            dataset_manager = experiment.dataset_manager
-            hf_dataset = dataset_manager.load(
-                retrieve=not force_reload,
-                cache=True,
-                force_retrieve=force_reload,
+        generation_record = experiments[0].generation_record
+        generation_result = self.project.get_record(generation_record)
+        if (
+            len(pending_experiments) <= 1
+            or generation_result is None
+            or generation_result.status != "success"
+            or generation_result.log_location is None
+        ):
+            # Nothing to fuse — use the standard evaluation procedure, which
+            # also reports and records any missing generations
+            for experiment in pending_experiments:
+                self._evaluate_experiment(
+                    experiment, force_rerun=force_rerun, score_kwargs=score_kwargs
+                )
+            return
+
+        # Prepare the scorers, evaluating any scorers with clashing names separately
+        with self._timed("log_read", generation_record.label):
+            generation_log = read_eval_log(generation_result.log_location)
+        fused_experiments: list[tuple[ExperimentConfig, str]] = []
+        checkpoints: list[ScoreCheckpoint | None] = []
+        fused_scorers: list[Scorer] = []
+        separate_experiments: list[ExperimentConfig] = []
+        for experiment in pending_experiments:
+            scorer = self._prepare_scorer(cast(Evaluator, experiment.evaluator))
+            if scorer is None:
+                continue
+            scorer_name = _scorer_name(scorer)
+            if any(scorer_name == name for _, name in fused_experiments):
+                separate_experiments.append(experiment)
+                continue
+            scorer, checkpoint = self._checkpoint_scorer(
+                experiment, scorer, generation_log, force_rerun
             )
+            fused_experiments.append((experiment, scorer_name))
+            fused_scorers.append(scorer)
+            checkpoints.append(checkpoint)
+        if not fused_experiments:
+            return
 
-            # Preprocess the dataset
-            logger.info(
-                "▶️  Preprocessing dataset with task preprocessor "
-                f"{experiment.task_preprocessor.name}."
+        logger.info(
+            f"🔄  Starting fused evaluation for {generation_record.label} with "
+            f"{len(fused_experiments)} evaluators"
+        )
+
+        # Try scoring the model outputs with all scorers in a single pass
+        exception = None
+        fused_log = None
+        try:
+            with self._timed(
+                "scoring",
+                "; ".join(e.evaluation_record.label for e, _ in fused_experiments),
+            ):
+                fused_log = self._score(
+                    log=generation_log,
+                    scorers=fused_scorers,
+                    action="overwrite",
+                    **(score_kwargs or dict()),
+                )
+        except BaseException as e:
+            exception = e
+
+        # Split the results into logs and records for the individual evaluators
+        for (experiment, scorer_name), checkpoint in zip(
+            fused_experiments, checkpoints
+        ):
+            location = cast(
+                str,
+                self.project.evaluation_log_location(experiment.evaluation_record),
             )
-            task_preprocessor = experiment.task_preprocessor
-            inspect_dataset = task_preprocessor(
-                hf_dataset,
-                dataset_manager,
-                field_spec=experiment.field_spec,
-                force_reprocess=force_reload,
+            if fused_log is not None:
+                score_log = _select_scorer_results(fused_log, scorer_name, location)
+            else:
+                score_log = generation_log.model_copy(update={"location": location})
+            if exception is None:
+                self._annotate_subsample_intervals(score_log)
+            with self._timed("log_write", experiment.evaluation_record.label):
+                write_eval_log(score_log, location=location)
+            self._record_evaluation_result(experiment, score_log, exception)
+            self._finalise_checkpoint(
+                checkpoint, exception is None and score_log.status == "success"
             )
+            self._cleanup_evaluator(cast(Evaluator, experiment.evaluator))
+
+        # If user interrupted the evaluation, raise KeyboardInterrupt
+        if isinstance(exception, KeyboardInterrupt):
+            logger.critical("🛑  Execution was interrupted.")
+            raise KeyboardInterrupt()
 
-            self._load_model(experiment.model_config)
+        for experiment in separate_experiments:
+            self._evaluate_experiment(
+                experiment, force_rerun=force_rerun, score_kwargs=score_kwargs
+            )
 
-            self._generate_on_dataset(
-                experiment,
-                inspect_dataset,
+    def _evaluate_experiment_block(
+        self,
+        experiments: list[ExperimentConfig],
+        force_rerun: bool,
+        score_kwargs: dict[str, Any] | None,
+        fuse_evaluators: bool,
+        progress: tqdm | None = None,
+    ):
+        """Evaluates a block of experiments, without cleaning up the active model.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to evaluate.
+                All experiments must have an evaluator.
+            force_rerun (bool): Whether to force rerun the experiments.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
+            fuse_evaluators (bool): Whether to score the generations with all
+                evaluators sharing the same evaluation model in a single pass.
+            progress (tqdm | None): The progress bar to update, if any.
+        """
+        if fuse_evaluators:
+            for group in _group_fusable_experiments(experiments):
+                self._evaluate_experiments_fused(
+                    group,
+                    force_rerun=force_rerun,
+                    score_kwargs=score_kwargs,
+                )
+                if progress is not None:
+                    progress.update(len(group))
+        else:
+            for experiment in experiments:
+                self._evaluate_experiment(
+                    experiment,
+                    force_rerun=force_rerun,
+                    score_kwargs=score_kwargs,
+                )
+                if progress is not None:
+                    progress.update(1)
+
+    def _evaluate_experiments(
+        self,
+        experiments: list[ExperimentConfig],
+        show_progress: bool,
+        force_rerun: bool,
+        score_kwargs: dict[str, Any] | None,
+        fuse_evaluators: bool = False,
+    ):
+        """Evaluates the generations for the given experiments.
+
+        Args:
+            experiments (list[ExperimentConfig]): The experiments to evaluate.
+                Experiments without an evaluator are ignored.
+            show_progress (bool): Whether to show a progress bar.
+            force_rerun (bool): Whether to force rerun the experiments.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function. Defaults to empty dictionary when
+                None.
+            fuse_evaluators (bool): Whether to score the generations with all
+                evaluators sharing the same evaluation model in a single pass.
+                Defaults to False.
+        """
+        experiments_to_evaluate = [
+            experiment for experiment in experiments if experiment.evaluator is not None
+        ]
+        with tqdm(
+            total=len(experiments_to_evaluate),
+            disable=not show_progress,
+            desc="Experiment Evaluation",
+        ) as progress:
+            self._evaluate_experiment_block(
+                experiments_to_evaluate,
                 force_rerun=force_rerun,
-                eval_kwargs=eval_kwargs,
-                eval_retry_kwargs=eval_retry_kwargs,
+                score_kwargs=score_kwargs,
+                fuse_evaluators=fuse_evaluators,
+                progress=progress,
             )
+
         self._cleanup_active_model()
-        logger.info("✨  Generation tasks completed.")
+        logger.info("✨  Evaluation tasks completed.")
 
     def evaluate(
         self,
         show_progress: bool = True,
         force_rerun: bool = False,
         score_kwargs: dict[str, Any] | None = None,
+        fuse_evaluators: bool = False,
     ):
         """Runs the evaluation stage of the pipeline.
 
@@ -365,124 +2393,370 @@ class Pipeline:
             score_kwargs (dict[str, Any], optional): Additional arguments to pass
                 to the Inspect score function. Defaults to empty dictionary when
                 None.
+            fuse_evaluators (bool, optional): Whether to read each generation log
+                only once and score it with all evaluators sharing the same
+                evaluation model in a single pass. The results are still stored
+                in separate logs and records for the individual evaluators.
+                Defaults to False.
         """
-        experiments_to_evaluate = [
-            experiment
-            for experiment in self.evaluation_experiments
-            if experiment.evaluator is not None
-        ]
-        for experiment in tqdm(
-            experiments_to_evaluate,
-            disable=not show_progress,
-            desc="Experiment Evaluation",
+        self._evaluate_experiments(
+            self.evaluation_experiments,
+            show_progress=show_progress,
+            force_rerun=force_rerun,
+            score_kwargs=score_kwargs,
+            fuse_evaluators=fuse_evaluators,
+        )
+
+    async def aevaluate(self, **kwargs: Any):
+        """Runs the evaluation stage of the pipeline asynchronously.
+
+        The Inspect scoring is run in the current event loop, allowing multiple
+        pipelines to score their generations concurrently and share the model
+        connections.
+
+        Args:
+            **kwargs (Any): The arguments to pass to `Pipeline.evaluate`.
+
+        Raises:
+            RuntimeError: If the pipeline is already running asynchronously.
+        """
+        await self._run_async(self.evaluate, **kwargs)
+
+    def _covers_requested_samples(self, result: ResultRecord) -> bool:
+        """Checks whether a generation or evaluation result covers all samples
+        requested by the pipeline, rather than only a subsample of them. Partial
+        evaluations stopped early only cover the requested samples when the
+        pipeline uses the early-stopping mode.
+
+        Args:
+            result (ResultRecord): The result to check.
+
+        Returns:
+            bool: True if the result covers all requested samples, False otherwise.
+        """
+        return subsample_covers(result.subsample, self._subsample_params) and (
+            not result.partial or self._early_stopping is not None
+        )
+
+    def _skip_completed_evaluation(
+        self,
+        experiment: ExperimentConfig,
+        prev_record: ResultRecord,
+        force_rerun: bool,
+    ) -> bool:
+        """Checks whether an evaluation should be skipped, as it has already been
+        completed on all samples available for the evaluation.
+
+        An evaluation completed on a subsample of the requested samples is
+        rerun once the generations cover all the requested samples.
+
+        Args:
+            experiment (ExperimentConfig): The experiment to evaluate.
+            prev_record (ResultRecord): The existing evaluation record.
+            force_rerun (bool): Whether to force rerunning the evaluation.
+
+        Returns:
+            bool: True if the evaluation should be skipped, False otherwise.
+        """
+        if prev_record.status != "success" or force_rerun:
+            return False
+        label = experiment.evaluation_record.label
+        if self._covers_requested_samples(prev_record):
+            logger.info(f"⏭️  Evaluation for {label} skipped — already completed.")
+            return True
+        generation_result = self.project.get_record(experiment.generation_record)
+        if generation_result is None or self._covers_requested_samples(
+            generation_result
         ):
-            logger.info(
-                f"🔄  Starting evaluation for {experiment.evaluation_record.label}"
-            )
+            return False
+        logger.warning(
+            f"⚠️  Evaluation for {label} skipped — the generations only cover "
+            "a subsample of the dataset. Rerun the generation stage to evaluate "
+            "all requested samples."
+        )
+        return True
 
-            # Check if we have a record from the generations.
-            prev_record = self.project.get_record(
-                experiment.evaluation_record,
-                init_eval_record_from_generations=True,
-            )
-            if prev_record is None or prev_record.log_location is None:
-                logger.error("❌  Evaluation skipped — no valid generations found.")
-                continue
-            if prev_record.status == "success" and not force_rerun:
-                logger.info("⏭️  Evaluation skipped — already completed.")
-                continue
+    def _is_pending(
+        self,
+        record: GenerationRecord | EvaluationRecord,
+        force_rerun: bool,
+    ) -> bool:
+        """Checks whether a generation or evaluation stage still needs to be run.
 
-            # Prepare the scorer
-            # Safe cast, as we filtered out any None evaluators above
-            evaluator = cast(Evaluator, experiment.evaluator)
-            scorer = evaluator.scorer
-            if isinstance(scorer, ScorerFactory):
-                if evaluator.model_config is None:
-                    logger.error(
-                        "❌  Using ScorerFactory as a scorer for evaluation requires a "
-                        "model config to specify the used model. Skipping evaluation."
-                    )
-                    continue
-                scorer = scorer.create_scorer(self._load_model(evaluator.model_config))
+        Args:
+            record (GenerationRecord | EvaluationRecord): The record to check.
+            force_rerun (bool): Whether to force rerunning the completed stages.
 
-            # Retrieve the initial evaluation log.
-            init_score_log = self.project.get_log(
-                experiment.evaluation_record,
+        Returns:
+            bool: True if the stage needs to be run, False otherwise.
+        """
+        if force_rerun:
+            return True
+        result = self.project.get_record(record)
+        return (
+            result is None
+            or result.status != "success"
+            or not self._covers_requested_samples(result)
+        )
+
+    def plan(
+        self,
+        force_rerun: bool = False,
+        interleave_stages: bool = True,
+        verbose: bool = True,
+    ) -> ExecutionPlan:
+        """Plans the execution of the pending experiments without running them.
+
+        Args:
+            force_rerun (bool, optional): Whether to plan rerunning the completed
+                experiments. Defaults to False.
+            interleave_stages (bool, optional): Whether to interleave the
+                generation and evaluation stages to minimise the number of model
+                loads. If False, plans all generations before all evaluations,
+                as done by the standard pipeline. Defaults to True.
+            verbose (bool, optional): Whether to print the planned steps and the
+                expected number of model loads. Defaults to True.
+
+        Returns:
+            ExecutionPlan: The planned execution.
+        """
+        generation_experiments = [
+            e
+            for e in self.generation_experiments
+            if self._is_pending(e.generation_record, force_rerun)
+        ]
+        evaluation_experiments = [
+            e
+            for e in self.evaluation_experiments
+            if e.evaluator is not None
+            and self._is_pending(e.evaluation_record, force_rerun)
+        ]
+        if interleave_stages:
+            plan = plan_interleaved_execution(
+                generation_experiments,
+                evaluation_experiments,
+                is_generated=lambda record: not self._is_pending(record, False),
+                max_loaded_models=self._model_pool.max_models,
+                gpu_memory_budget=self._model_pool.gpu_memory_budget,
             )
-            if init_score_log is None:
-                logger.error(
-                    "❌  Couldn't load initial evaluation log. Skipping evaluation."
-                )
-                continue
+        else:
+            plan = plan_staged_execution(
+                generation_experiments,
+                evaluation_experiments,
+                max_loaded_models=self._model_pool.max_models,
+                gpu_memory_budget=self._model_pool.gpu_memory_budget,
+            )
+        if verbose:
+            print(plan)
+        return plan
 
-            # Try scoring the model outputs in the log
-            exception = None
-            try:
-                score_log = score(
-                    log=init_score_log,
-                    scorers=scorer,
-                    action="overwrite",
-                    **(score_kwargs or dict()),
-                )
-            except BaseException as e:
-                score_log = self.project.get_log(experiment.evaluation_record)
-                exception = e
-            score_log = cast(EvalLog, score_log)
-            write_eval_log(score_log, location=score_log.location)
+    def estimate(
+        self,
+        force_rerun: bool = False,
+        force_reload: bool = False,
+    ) -> pl.DataFrame:
+        """Estimates the LLM calls and tokens needed for running the pending
+        experiments, without running them.
+
+        The estimates are computed from the task datasets. Generation is assumed
+        to make a single call per sample, using the reference output length as
+        a proxy for the output length. Evaluation estimates are provided by the
+        evaluators implementing the `CallEstimator` protocol (e.g., G-Eval and
+        QAGS), using the existing generations where available and the reference
+        outputs otherwise. Evaluators not using a model make no calls, while the
+        calls of other evaluators are reported as missing values. The tokens are
+        counted with a local tokenizer for the used model where available.
+
+        Args:
+            force_rerun (bool, optional): Whether to include the completed
+                experiments. Defaults to False.
+            force_reload (bool, optional): Whether to force reloading and
+                reprocessing the datasets. Defaults to False.
+
+        Returns:
+            pl.DataFrame: The estimates, with a row for each pending generation
+                or evaluation and the columns `stage`, `record`, `model`,
+                `samples`, `llm_calls`, `input_tokens` and `output_tokens`.
+        """
+        datasets: dict[tuple[Any, str], list[EstimationSample]] = {}
+
+        def get_samples(experiment: ExperimentConfig) -> list[EstimationSample]:
+            record = experiment.generation_record
+            key = (record.dataset_record, record.task_name)
+            if key not in datasets:
+                datasets[key] = [
+                    EstimationSample.from_sample(sample)
+                    for sample in self._load_inspect_dataset(experiment, force_reload)
+                ]
+            return datasets[key]
+
+        rows = []
+        for experiment in self.generation_experiments:
+            record = experiment.generation_record
+            if not self._is_pending(record, force_rerun):
+                continue
+            samples = get_samples(experiment)
+            estimate = estimate_generation(samples, experiment.model_config.name)
+            rows.append(
+                {
+                    "stage": "generation",
+                    "record": record.label,
+                    "model": experiment.model_config.name,
+                    "samples": len(samples),
+                    "llm_calls": round(estimate.calls),
+                    "input_tokens": round(estimate.input_tokens),
+                    "output_tokens": round(estimate.output_tokens),
+                }
+            )
 
-            # Check scoring status and update the project record
-            status = "error"
-            error_message = "Unknown error"
-            log_location = None
-            if not score_log:
-                error_message = "No log returned from evaluation."
-                logger.error("❌  Evaluation failed: no log returned from evaluation.")
+        for experiment in self.evaluation_experiments:
+            evaluator = experiment.evaluator
+            if evaluator is None or not self._is_pending(
+                experiment.evaluation_record, force_rerun
+            ):
+                continue
+            generation_log = None
+            if not self._is_pending(experiment.generation_record, force_rerun):
+                generation_log = self.project.get_log(experiment.generation_record)
+            if generation_log is not None and generation_log.samples is not None:
+                samples = [
+                    EstimationSample.from_sample(sample)
+                    for sample in generation_log.samples
+                ]
             else:
-                log_location = score_log.location
-                if score_log.status == "error" or exception is not None:
-                    if score_log.error is not None:
-                        error_message = score_log.error.message
-                    elif exception is not None:
-                        error_message = str(exception)
-                    logger.error(
-                        f"❌  Evaluation failed due to an error: {error_message}"
-                    )
-                elif score_log.status == "cancelled":
-                    error_message = "Evaluation was cancelled."
-                    logger.error("❌  Evaluation was cancelled.")
-                elif score_log.status == "success":
-                    status = "success"
-                    error_message = None
-                    logger.info(
-                        f"✅  Evaluation for {experiment.evaluation_record.label} "
-                        "completed successfully."
-                    )
-            self.project.update_record(
-                experiment.evaluation_record,
-                ResultRecord(
-                    status=status,
-                    error_message=error_message,
-                    log_location=log_location,
-                ),
+                samples = get_samples(experiment)
+            estimate = estimate_evaluation(samples, evaluator)
+            rows.append(
+                {
+                    "stage": "evaluation",
+                    "record": experiment.evaluation_record.label,
+                    "model": evaluator.model_name or None,
+                    "samples": len(samples),
+                    "llm_calls": round(estimate.calls) if estimate else None,
+                    "input_tokens": round(estimate.input_tokens) if estimate else None,
+                    "output_tokens": round(estimate.output_tokens)
+                    if estimate
+                    else None,
+                }
             )
 
-            # Perform cleanup if needed
-            if evaluator.cleanup_fun is not None:
-                try:
-                    evaluator.cleanup_fun()
-                except Exception as e:
-                    logger.error(
-                        f"❌  Error during cleanup for {evaluator.name}: {e}. "
-                        "Please check the evaluator's cleanup function."
+        return pl.DataFrame(
+            rows,
+            schema={
+                "stage": pl.String,
+                "record": pl.String,
+                "model": pl.String,
+                "samples": pl.Int64,
+                "llm_calls": pl.Int64,
+                "input_tokens": pl.Int64,
+                "output_tokens": pl.Int64,
+            },
+        )
+
+    def _execute_plan(
+        self,
+        plan: ExecutionPlan,
+        show_progress: bool,
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        score_kwargs: dict[str, Any] | None,
+        fuse_evaluators: bool,
+        concurrent_api_models: bool,
+        max_tasks_per_model: int,
+    ):
+        """Executes the steps of an execution plan in order.
+
+        Evaluations not requiring a model are handed to the background evaluation
+        worker if it is running.
+
+        Args:
+            plan (ExecutionPlan): The plan to execute.
+            show_progress (bool): Whether to show a progress bar.
+            force_rerun (bool): Whether to force rerun the experiments.
+            force_reload (bool): Whether to force reloading and reprocessing
+                the datasets.
+            eval_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect eval function.
+            eval_retry_kwargs (dict[str, Any], optional): Additional arguments
+                to pass to the Inspect eval function for retrying failed tasks.
+            score_kwargs (dict[str, Any], optional): Additional arguments to pass
+                to the Inspect score function.
+            fuse_evaluators (bool): Whether to score the generations with all
+                evaluators sharing the same evaluation model in a single pass.
+            concurrent_api_models (bool): Whether to run the consecutive
+                generations using models not running on the local machine
+                concurrently.
+            max_tasks_per_model (int): The maximum number of experiments to run
+                concurrently for a single model.
+        """
+        planned_generations = {
+            step.experiment.generation_record
+            for step in plan.steps
+            if step.stage == "generation"
+        }
+        with tqdm(
+            total=len(plan.steps),
+            disable=not show_progress,
+            desc="Experiment Execution",
+        ) as progress:
+            step_groups = [
+                (stage, list(steps))
+                for stage, steps in groupby(plan.steps, key=lambda step: step.stage)
+            ]
+            for i, (stage, steps) in enumerate(step_groups):
+                # Prefetch the next model to be loaded after this group of steps
+                next_loads = [
+                    step.model_config
+                    for _, next_steps in step_groups[i + 1 :]
+                    for step in next_steps
+                    if step.loads_model and step.model_config is not None
+                ]
+                if next_loads:
+                    self._prefetch_model(next_loads[0])
+
+                experiments = [step.experiment for step in steps]
+                if stage == "generation":
+                    self._generate_experiments(
+                        experiments,
+                        force_rerun=force_rerun,
+                        force_reload=force_reload,
+                        eval_kwargs=eval_kwargs,
+                        eval_retry_kwargs=eval_retry_kwargs,
+                        concurrent_api_models=concurrent_api_models,
+                        max_tasks_per_model=max_tasks_per_model,
+                        progress=progress,
                     )
+                    continue
 
-            # If user interrupted the evaluation, raise KeyboardInterrupt
-            if isinstance(exception, KeyboardInterrupt):
-                logger.critical("🛑  Execution was interrupted.")
-                raise KeyboardInterrupt()
+                if self._evaluation_worker is not None:
+                    # Background evaluations of new generations are submitted
+                    # by the generation stage
+                    background_experiments = [
+                        e for e in experiments if _is_background_evaluable(e)
+                    ]
+                    experiments = [
+                        e for e in experiments if not _is_background_evaluable(e)
+                    ]
+                    submitted_experiments = [
+                        e
+                        for e in background_experiments
+                        if e.generation_record not in planned_generations
+                    ]
+                    if submitted_experiments:
+                        self._evaluation_worker.submit(submitted_experiments)
+                    progress.update(len(background_experiments))
+                self._evaluate_experiment_block(
+                    experiments,
+                    force_rerun=force_rerun,
+                    score_kwargs=score_kwargs,
+                    fuse_evaluators=fuse_evaluators,
+                    progress=progress,
+                )
 
         self._cleanup_active_model()
-        logger.info("✨  Evaluation tasks completed.")
+        logger.info("✨  Planned tasks completed.")
 
     def run(
         self,
@@ -492,6 +2766,12 @@ class Pipeline:
         eval_kwargs: dict[str, Any] | None = None,
         eval_retry_kwargs: dict[str, Any] | None = None,
         score_kwargs: dict[str, Any] | None = None,
+        pipelined: bool = False,
+        fuse_evaluators: bool = False,
+        interleave_stages: bool = False,
+        concurrent_api_models: bool = False,
+        max_tasks_per_model: int = 1,
+        incremental: bool = False,
     ):
         """Runs the pipeline.
 
@@ -511,16 +2791,204 @@ class Pipeline:
             score_kwargs (dict[str, Any], optional): Additional arguments to pass
                 to the Inspect score function. Defaults to empty dictionary when
                 None.
+            pipelined (bool, optional): Whether to overlap the generation and
+                evaluation stages. If True, the generations are scored by the
+                evaluators not requiring a model in a background thread as soon
+                as they complete, while the remaining experiments are still being
+                generated. The evaluations requiring a model are performed after
+                the generation stage, as usual. Defaults to False.
+            fuse_evaluators (bool, optional): Whether to score each generation
+                log with all evaluators sharing the same evaluation model in
+                a single pass. Defaults to False.
+            interleave_stages (bool, optional): Whether to interleave the
+                generation and evaluation stages according to a global plan
+                minimising the number of model loads, e.g., running evaluations
+                with a judge model right after using the same model for
+                generation. See `Pipeline.plan` for previewing the plan.
+                Defaults to False.
+            concurrent_api_models (bool, optional): Whether to run the experiments
+                for different models not running on the local machine (e.g.,
+                hosted API models) concurrently. Defaults to False.
+            max_tasks_per_model (int, optional): The maximum number of experiments
+                to run concurrently for a single model. The pending experiments for
+                the same model are run in a single multi-task Inspect evaluation,
+                sharing the model connections. Defaults to 1.
+            incremental (bool, optional): Whether to extend the existing successful
+                generations with the samples newly added to the datasets. The
+                sample IDs in the current datasets are compared against the
+                existing generation logs, only the missing samples are generated
+                and appended to the logs, and the dependent evaluations are
+                invalidated. Requires the dataset samples to have stable IDs.
+                Defaults to False.
+
+        Raises:
+            ValueError: If incremental generation is requested when interleaving
+                the stages or running a sample shard.
+            RuntimeError: If a background evaluation fails in the pipelined mode,
+                raised once the remaining evaluations have finished.
         """
-        self.generate(
-            show_progress=show_progress,
-            force_rerun=force_rerun,
-            force_reload=force_reload,
-            eval_kwargs=eval_kwargs,
-            eval_retry_kwargs=eval_retry_kwargs,
-        )
-        self.evaluate(
-            show_progress=show_progress,
-            force_rerun=force_rerun,
-            score_kwargs=score_kwargs,
-        )
+        if incremental and interleave_stages:
+            raise ValueError(
+                "Incremental generation is not supported when interleaving the stages."
+            )
+
+        self._keep_models_loaded = True
+        try:
+            self._run_stages(
+                show_progress=show_progress,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                score_kwargs=score_kwargs,
+                pipelined=pipelined,
+                fuse_evaluators=fuse_evaluators,
+                interleave_stages=interleave_stages,
+                concurrent_api_models=concurrent_api_models,
+                max_tasks_per_model=max_tasks_per_model,
+                incremental=incremental,
+            )
+        finally:
+            self._keep_models_loaded = False
+            self._cleanup_active_model()
+
+    async def arun(self, **kwargs: Any):
+        """Runs the pipeline asynchronously.
+
+        The Inspect evaluations and scoring are run in the current event loop,
+        allowing multiple pipelines to run side by side and share the model
+        connections. The evaluations of different pipelines are serialised,
+        as Inspect does not support concurrent evaluations within a single
+        process, while their scoring may run concurrently. Cancelling the
+        coroutine does not interrupt the evaluations already in progress.
+
+        Args:
+            **kwargs (Any): The arguments to pass to `Pipeline.run`.
+
+        Raises:
+            RuntimeError: If the pipeline is already running asynchronously.
+        """
+        await self._run_async(self.run, **kwargs)
+
+    def _run_stages(
+        self,
+        show_progress: bool,
+        force_rerun: bool,
+        force_reload: bool,
+        eval_kwargs: dict[str, Any] | None,
+        eval_retry_kwargs: dict[str, Any] | None,
+        score_kwargs: dict[str, Any] | None,
+        pipelined: bool,
+        fuse_evaluators: bool,
+        interleave_stages: bool,
+        concurrent_api_models: bool,
+        max_tasks_per_model: int,
+        incremental: bool,
+    ):
+        """Runs the pipeline stages. See `Pipeline.run` for the arguments."""
+        if self._sample_shard is not None:
+            self.generate(
+                show_progress=show_progress,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                incremental=incremental,
+            )
+            logger.info(
+                "⏭️  Evaluation skipped when running a sample shard — run the "
+                "evaluation stage once all sample shards have been merged."
+            )
+            return
+
+        if not pipelined and not interleave_stages:
+            self.generate(
+                show_progress=show_progress,
+                force_rerun=force_rerun,
+                force_reload=force_reload,
+                eval_kwargs=eval_kwargs,
+                eval_retry_kwargs=eval_retry_kwargs,
+                concurrent_api_models=concurrent_api_models,
+                max_tasks_per_model=max_tasks_per_model,
+                incremental=incremental,
+            )
+            self.evaluate(
+                show_progress=show_progress,
+                force_rerun=force_rerun,
+                score_kwargs=score_kwargs,
+                fuse_evaluators=fuse_evaluators,
+            )
+            return
+
+        worker = None
+        if pipelined:
+            worker = _EvaluationWorker(self, force_rerun, score_kwargs, fuse_evaluators)
+            self._evaluation_worker = worker
+            worker.start()
+        interrupted = False
+        try:
+            if interleave_stages:
+                self._execute_plan(
+                    self.plan(force_rerun=force_rerun, verbose=False),
+                    show_progress=show_progress,
+                    force_rerun=force_rerun,
+                    force_reload=force_reload,
+                    eval_kwargs=eval_kwargs,
+                    eval_retry_kwargs=eval_retry_kwargs,
+                    score_kwargs=score_kwargs,
+                    fuse_evaluators=fuse_evaluators,
+                    concurrent_api_models=concurrent_api_models,
+                    max_tasks_per_model=max_tasks_per_model,
+                )
+            else:
+                self.generate(
+                    show_progress=show_progress,
+                    force_rerun=force_rerun,
+                    force_reload=force_reload,
+                    eval_kwargs=eval_kwargs,
+                    eval_retry_kwargs=eval_retry_kwargs,
+                    concurrent_api_models=concurrent_api_models,
+                    max_tasks_per_model=max_tasks_per_model,
+                    incremental=incremental,
+                )
+        except KeyboardInterrupt:
+            interrupted = True
+            raise
+        finally:
+            if worker is not None:
+                self._evaluation_worker = None
+                logger.info("⏳  Waiting for background evaluations to finish.")
+                worker.stop(cancel=interrupted)
+
+        if worker is None:
+            return
+
+        # Evaluate the remaining experiments — when interleaving the stages, only
+        # the background evaluations may be left, otherwise also the experiments
+        # requiring a model. The failed background evaluations are not retried.
+        remaining_experiments = [
+            e
+            for e in self.evaluation_experiments
+            if e.evaluator is not None
+            and e.evaluation_record not in worker.completed
+            and e.evaluation_record not in worker.failed
+            and (
+                not interleave_stages
+                or (
+                    _is_background_evaluable(e)
+                    and self._is_pending(e.evaluation_record, force_rerun=False)
+                )
+            )
+        ]
+        if remaining_experiments or not interleave_stages:
+            self._evaluate_experiments(
+                remaining_experiments,
+                show_progress=show_progress,
+                force_rerun=force_rerun,
+                score_kwargs=score_kwargs,
+                fuse_evaluators=fuse_evaluators,
+            )
+        if worker.errors:
+            raise RuntimeError(
+                f"{len(worker.errors)} background evaluation(s) failed."
+            ) from worker.errors[0]
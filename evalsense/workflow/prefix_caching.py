@@ -0,0 +1,170 @@
+from typing import Iterable
+
+from inspect_ai.dataset import Dataset, MemoryDataset, Sample
+from inspect_ai.log import EvalLog
+from pydantic import BaseModel
+
+
+class PrefixSharingStats(BaseModel, frozen=True):
+    """Estimated prefix sharing between consecutive prompts of a dataset.
+
+    A prompt prefix shared with the immediately preceding prompt is likely
+    to be served from the prefix cache of inference servers such as vLLM,
+    so the shared fraction approximates the achievable cache hit rate.
+
+    Attributes:
+        prompts (int): The number of prompts.
+        total_chars (int): The total number of prompt characters.
+        shared_chars (int): The number of prompt characters shared with the
+            preceding prompt in the original sample order.
+        ordered_shared_chars (int): The number of prompt characters shared with
+            the preceding prompt in the prefix-cache-aware order.
+    """
+
+    prompts: int
+    total_chars: int
+    shared_chars: int
+    ordered_shared_chars: int
+
+    @property
+    def shared_fraction(self) -> float:
+        """The fraction of prompt characters shared in the original order."""
+        return self.shared_chars / self.total_chars if self.total_chars else 0.0
+
+    @property
+    def ordered_shared_fraction(self) -> float:
+        """The fraction of prompt characters shared in the prefix-cache-aware
+        order."""
+        return self.ordered_shared_chars / self.total_chars if self.total_chars else 0.0
+
+
+class PrefixCacheUsage(BaseModel, frozen=True):
+    """Prefix cache usage reported by the model provider for a generation log.
+
+    Attributes:
+        input_tokens (int): The total number of input tokens, including the
+            cached tokens.
+        cached_input_tokens (int): The number of input tokens read from
+            the cache.
+    """
+
+    input_tokens: int
+    cached_input_tokens: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of input tokens read from the cache."""
+        return (
+            self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+        )
+
+
+def get_prompt_text(sample: Sample) -> str:
+    """Returns the prompt text of a sample, used for grouping shared prefixes.
+
+    Args:
+        sample (Sample): The sample.
+
+    Returns:
+        str: The prompt text, with chat messages joined in order.
+    """
+    if isinstance(sample.input, str):
+        return sample.input
+    return "\n".join(f"{message.role}: {message.text}" for message in sample.input)
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Returns the length of the longest common prefix of two strings.
+
+    Args:
+        first (str): The first string.
+        second (str): The second string.
+
+    Returns:
+        int: The length of the common prefix.
+    """
+    length = min(len(first), len(second))
+    for i in range(length):
+        if first[i] != second[i]:
+            return i
+    return length
+
+
+def _count_shared_chars(prompts: Iterable[str]) -> int:
+    """Counts the prompt characters shared with the preceding prompt.
+
+    Args:
+        prompts (Iterable[str]): The prompts in the order they are sent.
+
+    Returns:
+        int: The number of shared characters.
+    """
+    shared_chars = 0
+    previous_prompt = None
+    for prompt in prompts:
+        if previous_prompt is not None:
+            shared_chars += _common_prefix_length(previous_prompt, prompt)
+        previous_prompt = prompt
+    return shared_chars
+
+
+def order_by_shared_prefix(dataset: Dataset) -> tuple[Dataset, PrefixSharingStats]:
+    """Orders the samples of a dataset so that prompts sharing long prefixes
+    are sent consecutively.
+
+    Sorting the prompts lexicographically places prompts with common prefixes
+    next to each other, e.g., the same source document with different
+    instructions appended. The sort is stable, so samples with identical
+    prompts keep their relative order. The original dataset is not modified.
+
+    Args:
+        dataset (Dataset): The dataset to order.
+
+    Returns:
+        tuple[Dataset, PrefixSharingStats]: The ordered dataset and the
+            estimated prefix sharing before and after ordering.
+    """
+    prompts = [(get_prompt_text(sample), sample) for sample in dataset]
+    ordered_prompts = sorted(prompts, key=lambda prompt: prompt[0])
+    stats = PrefixSharingStats(
+        prompts=len(prompts),
+        total_chars=sum(len(prompt) for prompt, _ in prompts),
+        shared_chars=_count_shared_chars(prompt for prompt, _ in prompts),
+        ordered_shared_chars=_count_shared_chars(
+            prompt for prompt, _ in ordered_prompts
+        ),
+    )
+    ordered_dataset = MemoryDataset(
+        samples=[sample for _, sample in ordered_prompts],
+        name=dataset.name,
+        location=dataset.location,
+        shuffled=dataset.shuffled,
+    )
+    return ordered_dataset, stats
+
+
+def get_prefix_cache_usage(eval_log: EvalLog) -> PrefixCacheUsage | None:
+    """Returns the prefix cache usage reported by the model provider.
+
+    Args:
+        eval_log (EvalLog): The generation log.
+
+    Returns:
+        PrefixCacheUsage | None: The cache usage, or None if the provider did
+            not report any cached input tokens.
+    """
+    model_usage = eval_log.stats.model_usage.values()
+    if all(usage.input_tokens_cache_read is None for usage in model_usage):
+        return None
+    # Inspect reports the cached input tokens separately from the input tokens
+    return PrefixCacheUsage(
+        input_tokens=sum(
+            usage.input_tokens
+            + (usage.input_tokens_cache_read or 0)
+            + (usage.input_tokens_cache_write or 0)
+            for usage in model_usage
+        ),
+        cached_input_tokens=sum(
+            usage.input_tokens_cache_read or 0 for usage in model_usage
+        ),
+    )
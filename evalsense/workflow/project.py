@@ -1,9 +1,31 @@
+import functools
 from pathlib import Path
 import shutil
-from typing import Literal, overload
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Concatenate,
+    Iterator,
+    Literal,
+    cast,
+    overload,
+)
+import uuid
+import weakref
 
-from inspect_ai.log import EvalLog, read_eval_log
-from pydantic import BaseModel, field_serializer, model_validator
+from filelock import FileLock, Timeout
+from inspect_ai.log import (
+    EvalLog,
+    EvalSample,
+    read_eval_log,
+    read_eval_log_samples,
+    write_eval_log,
+)
+import polars as pl
+from pydantic import ValidationError
 
 from evalsense.constants import PROJECTS_PATH
 from evalsense.evaluation import (
@@ -14,57 +36,90 @@ from evalsense.evaluation import (
 )
 from evalsense.logging import get_logger
 from evalsense.utils.files import to_safe_filename
+from evalsense.workflow.checkpointing import ScoreCheckpoint
+from evalsense.workflow.log_cache import EvalLogCache
+from evalsense.workflow.record_store import (
+    ProjectRecords,
+    RecordStore,
+    RecordStoreBackend,
+    create_record_store,
+)
+from evalsense.workflow.score_index import (
+    SCORE_INDEX_SCHEMA,
+    get_score_rows,
+    write_score_index,
+)
+from evalsense.workflow.sharding import get_record_digest, merge_eval_logs
+from evalsense.workflow.telemetry import SpanStage, TimingSpan
 
 logger = get_logger(__name__)
 
+# The minimum age of a released session lease before its file is removed,
+# so that a lease being acquired by a starting session is never removed
+_STALE_LEASE_AGE = 3600.0
 
-class ProjectRecords(BaseModel):
-    """Metadata for generation and evaluation records associated with a project."""
+# The sample fields holding the transcripts, which can be skipped when reading
+# the samples for analysing their scores
+TRANSCRIPT_SAMPLE_FIELDS = {"messages", "events", "attachments", "store"}
 
-    generation: dict[GenerationRecord, ResultRecord] = {}
-    evaluation: dict[EvaluationRecord, ResultRecord] = {}
 
-    @field_serializer("generation")
-    def serialise_generation(
-        self,
-        value: dict[GenerationRecord, ResultRecord],
-    ) -> list[tuple[dict, dict]]:
-        """Convert generation records to a serializable format."""
-        return [(k.model_dump(), v.model_dump()) for k, v in value.items()]
+def _release_lease(lease: FileLock):
+    """Releases a session lease and removes its file.
 
-    @field_serializer("evaluation")
-    def serialise_evaluation(
-        self,
-        value: dict[EvaluationRecord, ResultRecord],
-    ) -> list[tuple[dict, dict]]:
-        """Converts evaluation records to a serializable format."""
-        return [(k.model_dump(), v.model_dump()) for k, v in value.items()]
-
-    @model_validator(mode="before")
-    @classmethod
-    def transform_lists_to_dicts(cls, values: dict) -> dict:
-        """Converts serialized lists back into dictionaries."""
-        values["generation"] = {
-            GenerationRecord.model_validate(k): ResultRecord.model_validate(v)
-            for k, v in values.get("generation", [])
-        }
-        values["evaluation"] = {
-            EvaluationRecord.model_validate(k): ResultRecord.model_validate(v)
-            for k, v in values.get("evaluation", [])
-        }
-        return values
+    Args:
+        lease (FileLock): The lease to release.
+    """
+    if lease.is_locked:
+        lease.release(force=True)
+        Path(lease.lock_file).unlink(missing_ok=True)
+
+
+def _synchronised[**P, R](
+    method: Callable[Concatenate["Project", P], R],
+) -> Callable[Concatenate["Project", P], R]:
+    """Decorates a project method to hold the project lock while it runs.
+
+    Args:
+        method (Callable): The project method to decorate.
+
+    Returns:
+        Callable: The decorated method.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "Project", *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Project:
-    """An EvalSense project, tracking the performed experiments and their results."""
+    """An EvalSense project, tracking the performed experiments and their results.
+
+    When enabled, the logs read by `get_log` and `iter_samples` and the log
+    headers read by `get_logs` and `iter_logs` are cached in memory by a cache
+    shared across all projects in the process (`Project.log_cache`), so that
+    repeated analyses of unchanged logs do not parse them again. The cache is
+    disabled by default and can be enabled by setting its maximum size, using
+    the `EVALSENSE_LOG_CACHE_SIZE` environment variable or
+    `Project.log_cache.max_size`. The cached logs are shared by all callers and
+    should be copied before being modified.
 
-    METADATA_FILE = "metadata.json"
+    Each project instance holds a session lease until it is closed, and can be
+    used as a context manager closing it on exit.
+    """
+
+    TELEMETRY_FILE = "telemetry.jsonl"
+    log_cache: ClassVar[EvalLogCache] = EvalLogCache()
 
     def __init__(
         self,
         name: str,
         load_existing: bool = True,
         reset_project: bool = False,
+        cleanup_incomplete: bool = True,
+        record_store: RecordStoreBackend | None = None,
     ) -> None:
         """Initializes a project.
 
@@ -75,9 +130,38 @@ class Project:
             reset_project (bool): Whether to reset the project if it exists. Defaults
                 to False. If True, the existing project will be deleted and a new one
                 will be created.
+            cleanup_incomplete (bool): Whether to remove the incomplete logs when
+                loading an existing project. Defaults to True. The logs are only
+                removed if no other sessions (e.g., pipelines running in other
+                processes or the web UI) are using the project, as the incomplete
+                logs may belong to experiments still running in those sessions.
+            record_store (RecordStoreBackend | None): The backend used to store
+                the project records — an append-only journal compacted into
+                a JSON snapshot ("journal"), a single JSON file rewritten on each
+                change ("json") or an SQLite database ("sqlite"). The journal and
+                the database update the records in constant time. Defaults to
+                None, using the SQLite database for projects that already use
+                it and the journal otherwise. The records of existing projects
+                are moved to the new store when switching to a different
+                backend. The SQLite database may be unreliable on network
+                filesystems.
         """
         PROJECTS_PATH.mkdir(parents=True, exist_ok=True)
         self.name = name
+        self.cleanup_incomplete = cleanup_incomplete
+        # Guards the records when the project is shared by multiple threads
+        self._lock = threading.RLock()
+        # Guards the metadata file when the project is shared by multiple processes
+        self._file_lock = FileLock(PROJECTS_PATH / f"{to_safe_filename(name)}.lock")
+        # Records changed since the last save, None marking removed records
+        self._changed_records: dict[
+            GenerationRecord | EvaluationRecord, ResultRecord | None
+        ] = {}
+        # The records are loaded lazily on first access
+        self._records: ProjectRecords | None = None
+        self._store: RecordStore | None = None
+        # Held while the project is open, marking the session as active
+        self._lease: FileLock | None = None
 
         if reset_project:
             self.remove()
@@ -88,10 +172,12 @@ class Project:
                 f"Project with name {name} already exists. "
                 "Either choose a different name or set load_existing=True."
             )
-        elif project_exists:
+        with self._file_lock:
+            self._store = create_record_store(self.project_path, record_store)
+        self._acquire_lease()
+        if project_exists:
             self._load_existing_project()
         else:
-            self.records = ProjectRecords()
             self._save()
 
     @property
@@ -109,25 +195,226 @@ class Project:
         """Returns the path to the evaluation log directory."""
         return self.project_path / "evaluation_logs"
 
+    @property
+    def score_index_path(self) -> Path:
+        """Returns the path to the directory with the per-sample score tables."""
+        return self.project_path / "scores"
+
+    @property
+    def session_path(self) -> Path:
+        """Returns the path to the directory with the leases of the sessions
+        using the project."""
+        return self.project_path / "sessions"
+
+    def _acquire_lease(self):
+        """Acquires a lease marking this project session as active.
+
+        The lease is a lock held until the project is closed or removed, or the
+        process exits, so that the leases of crashed sessions are released
+        automatically. Projects no longer needed should therefore be closed,
+        e.g., by using them as context managers, as their open sessions prevent
+        other sessions from cleaning up the incomplete logs.
+        """
+        self.session_path.mkdir(parents=True, exist_ok=True)
+        self._lease = FileLock(
+            self.session_path / f"{uuid.uuid4().hex}.lock", thread_local=False
+        )
+        self._lease.acquire()
+        self._lease_finalizer = weakref.finalize(self, _release_lease, self._lease)
+
+    def get_active_sessions(self) -> int:
+        """Returns the number of other active sessions using the project.
+
+        The sessions may belong to other processes or to other project instances
+        in the current process. The leases of inactive sessions are removed.
+
+        Returns:
+            int: The number of other active sessions.
+        """
+        if not self.session_path.exists():
+            return 0
+        active_sessions = 0
+        for lease_file in self.session_path.glob("*.lock"):
+            if self._lease is not None and lease_file == Path(self._lease.lock_file):
+                continue
+            lease = FileLock(lease_file, timeout=0, thread_local=False)
+            try:
+                lease.acquire()
+            except Timeout:
+                active_sessions += 1
+                continue
+            try:
+                if time.time() - lease_file.stat().st_mtime > _STALE_LEASE_AGE:
+                    lease_file.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            finally:
+                lease.release(force=True)
+        return active_sessions
+
+    def close(self):
+        """Closes the project session, releasing its lease and the resources
+        held by the record store.
+
+        The project should not be used after being closed.
+        """
+        if self._lease is not None:
+            self._lease_finalizer()
+            self._lease = None
+        if self._store is not None:
+            self._store.close()
+
+    def __enter__(self) -> "Project":
+        """Enters the project session, closing it on exit.
+
+        Returns:
+            Project: The project.
+        """
+        return self
+
+    def __exit__(self, *args: Any):
+        """Closes the project session."""
+        self.close()
+
+    @property
+    def records(self) -> ProjectRecords:
+        """Returns the generation and evaluation records, loading them on first
+        access."""
+        with self._lock:
+            if self._records is None:
+                with self._file_lock:
+                    self._records = cast(RecordStore, self._store).read()
+            return self._records
+
     def _load_existing_project(self) -> None:
         """Loads an existing project from disk."""
-        metadata_file = self.project_path / self.METADATA_FILE
-        if not metadata_file.exists():
+        if not cast(RecordStore, self._store).exists():
             raise ValueError(f"Attempting to load a non-existent project {self.name}.")
 
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            self.records = ProjectRecords.model_validate_json(f.read())
-        self.cleanup_incomplete_logs()
+        if self.cleanup_incomplete:
+            self.cleanup_incomplete_logs()
+
+    @_synchronised
+    def _refresh(self) -> None:
+        """Reloads the project records from disk, unless there are unsaved changes.
+
+        This picks up the records saved by other processes sharing the project,
+        so that the project methods reading the records see their latest state.
+        The records are only re-read if the store has been modified since the
+        last read, and only the changes made since then are loaded where
+        supported by the record store.
+        """
+        store = cast(RecordStore, self._store)
+        if not self._changed_records and (self._records is None or store.has_changes()):
+            with self._file_lock:
+                self._records = store.read()
+
+    def _set_record(
+        self,
+        record_key: GenerationRecord | EvaluationRecord,
+        record_value: ResultRecord | None,
+    ):
+        """Sets or removes a record, tracking the change for the next save.
+
+        Args:
+            record_key (GenerationRecord | EvaluationRecord): The generation
+                or evaluation record to set.
+            record_value (ResultRecord | None): The generation or evaluation
+                result, or None to remove the record.
+        """
+        self.records.set(record_key, record_value)
+        self._changed_records[record_key] = record_value
 
     def _save(self) -> None:
-        """Saves the project metadata to disk."""
+        """Saves the project metadata to disk.
+
+        The records changed by this project instance are written to the record
+        store, which merges them with the records saved by other processes
+        sharing the project directory, so that the processes do not overwrite
+        each other's records. The merged records are then reloaded into the
+        project.
+        """
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        with self._file_lock:
+            self._records = cast(RecordStore, self._store).write(self._changed_records)
+            self._changed_records.clear()
+
+    @_synchronised
+    def record_span(self, span: TimingSpan):
+        """Records a timed span of a pipeline stage.
+
+        The spans are appended to the telemetry file stored alongside the project
+        metadata, so that they are kept across pipeline runs and processes.
+
+        Args:
+            span (TimingSpan): The span to record.
+        """
         self.project_path.mkdir(parents=True, exist_ok=True)
-        metadata_file = self.project_path / self.METADATA_FILE
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            f.write(self.records.model_dump_json(indent=4))
+        with open(self.project_path / self.TELEMETRY_FILE, "a", encoding="utf-8") as f:
+            f.write(span.model_dump_json() + "\n")
+
+    def get_spans(self, stage: SpanStage | None = None) -> list[TimingSpan]:
+        """Returns the recorded timed spans of the pipeline stages.
+
+        Args:
+            stage (SpanStage | None): The stage of the spans to retrieve.
+                Defaults to None (i.e., retrieving the spans of all stages).
+
+        Returns:
+            list[TimingSpan]: The recorded spans, in the order of recording.
+        """
+        telemetry_file = self.project_path / self.TELEMETRY_FILE
+        if not telemetry_file.exists():
+            return []
+        spans = []
+        with open(telemetry_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    span = TimingSpan.model_validate_json(line)
+                except ValidationError:
+                    # Skip lines partially written by interrupted processes
+                    continue
+                if stage is None or span.stage == stage:
+                    spans.append(span)
+        return spans
+
+    def get_timing_summary(self) -> pl.DataFrame:
+        """Summarises the time spent in the individual pipeline stages.
+
+        Returns:
+            pl.DataFrame: The summary, with a row for each stage and the columns
+                `stage`, `count`, `errors`, `total_duration`, `mean_duration`
+                and `max_duration` (in seconds), sorted by the total duration.
+        """
+        spans = pl.DataFrame(
+            [span.model_dump() for span in self.get_spans()],
+            schema={"stage": pl.String, "duration": pl.Float64, "error": pl.String},
+        )
+        return (
+            spans.group_by("stage")
+            .agg(
+                pl.len().alias("count"),
+                pl.col("error").is_not_null().sum().alias("errors"),
+                pl.col("duration").sum().alias("total_duration"),
+                pl.col("duration").mean().alias("mean_duration"),
+                pl.col("duration").max().alias("max_duration"),
+            )
+            .sort("total_duration", descending=True)
+        )
+
+    @_synchronised
+    def clear_spans(self):
+        """Removes all recorded timed spans."""
+        (self.project_path / self.TELEMETRY_FILE).unlink(missing_ok=True)
 
     def remove(self) -> None:
         """Removes the project from disk."""
+        self.close()
+        if self.get_active_sessions() > 0:
+            logger.warning(
+                f"⚠️  Removing project {self.name}, which is still being used "
+                "by other sessions."
+            )
         if self.project_path.exists():
             shutil.rmtree(self.project_path)
 
@@ -144,7 +431,9 @@ class Project:
             log_path = Path(record.log_location)
             if log_path.exists():
                 log_path.unlink()
+            self.log_cache.discard(log_path)
 
+    @_synchronised
     def update_record(
         self,
         record_key: GenerationRecord | EvaluationRecord,
@@ -173,15 +462,13 @@ class Project:
             and current_record.log_location != record_value.log_location
         ):
             self._remove_log_file(current_record)
+        if type(record_key) is EvaluationRecord and record_value.status != "success":
+            self._remove_score_index(record_key)
 
-        if type(record_key) is GenerationRecord:
-            self.records.generation[record_key] = record_value
-        elif type(record_key) is EvaluationRecord:
-            self.records.evaluation[record_key] = record_value
-        else:
-            raise TypeError(f"Invalid record type: {type(record_key)}")
+        self._set_record(record_key, record_value)
         self._save()
 
+    @_synchronised
     def remove_record(
         self,
         record_key: GenerationRecord | EvaluationRecord,
@@ -193,15 +480,95 @@ class Project:
                 or evaluation record to remove.
         """
         if type(record_key) is GenerationRecord:
-            record = self.records.generation.pop(record_key, None)
+            record = self.records.generation.get(record_key, None)
         elif type(record_key) is EvaluationRecord:
-            record = self.records.evaluation.pop(record_key, None)
+            record = self.records.evaluation.get(record_key, None)
         else:
             raise TypeError(f"Invalid record type: {type(record_key)}")
 
+        self._set_record(record_key, None)
         self._remove_log_file(record)
+        if type(record_key) is EvaluationRecord:
+            self._remove_score_index(record_key)
         self._save()
 
+    def score_index_file(self, record_key: EvaluationRecord) -> Path:
+        """Returns the path to the per-sample score table for an evaluation.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+
+        Returns:
+            Path: The path to the Parquet file with the score table.
+        """
+        return self.score_index_path / f"{get_record_digest(record_key)}.parquet"
+
+    def _remove_score_index(self, record_key: EvaluationRecord):
+        """Removes the per-sample score table for an evaluation, if it exists.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+        """
+        self.score_index_file(record_key).unlink(missing_ok=True)
+
+    def write_scores(self, record_key: EvaluationRecord, eval_log: EvalLog):
+        """Writes the per-sample score table for a successful evaluation.
+
+        The table holds a row for each numeric metric value of each sample, and
+        is queried together with the tables for the other evaluations using
+        `Project.scores`.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+            eval_log (EvalLog): The evaluation log with the scored samples.
+        """
+        write_score_index(
+            self.score_index_file(record_key), get_score_rows(record_key, eval_log)
+        )
+
+    def scores(self, backfill: bool = True) -> pl.LazyFrame:
+        """Returns the per-sample scores of the successful evaluations.
+
+        The scores are read from the score tables written at evaluation time,
+        without reading the evaluation logs. The frame has a row for each numeric
+        metric value of each sample, with the columns `record` (a digest of the
+        evaluation record), `dataset`, `splits`, `task`, `generator`, `model`,
+        `experiment`, `evaluator`, `sample_id`, `epoch`, `scorer`, `metric`,
+        `value` and `metadata` (the sample metadata as a JSON string).
+
+        Args:
+            backfill (bool): Whether to create the missing score tables from
+                the evaluation logs, e.g., for evaluations run with earlier
+                versions of EvalSense. Defaults to True.
+
+        Returns:
+            pl.LazyFrame: The per-sample scores.
+        """
+        with self._lock:
+            self._refresh()
+            evaluation_records = {
+                k: v
+                for k, v in self.records.evaluation.items()
+                if v.status == "success"
+            }
+
+        score_files = []
+        for record_key, record_value in evaluation_records.items():
+            score_file = self.score_index_file(record_key)
+            if (
+                not score_file.exists()
+                and backfill
+                and record_value.log_location is not None
+                and Path(record_value.log_location).exists()
+            ):
+                self.write_scores(record_key, read_eval_log(record_value.log_location))
+            if score_file.exists():
+                score_files.append(score_file)
+
+        if not score_files:
+            return pl.LazyFrame(schema=SCORE_INDEX_SCHEMA)
+        return pl.scan_parquet(score_files)
+
     def _retrieve_verify_record(self, record_key: GenerationRecord | EvaluationRecord):
         """Retrieves and verifies the generation or evaluation record.
 
@@ -231,6 +598,59 @@ class Project:
                 retrieved_record = None
         return retrieved_record
 
+    def _derive_evaluation_log_path(
+        self,
+        record_key: EvaluationRecord,
+        generation_log_path: Path,
+    ) -> Path:
+        """Derives the path of an evaluation log from the generation log path.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+            generation_log_path (Path): The path to the generation log.
+
+        Returns:
+            Path: The path to the evaluation log.
+        """
+        evaluator_name = record_key.evaluator_name
+        log_time, core_name, random_id = generation_log_path.stem.split("_", 2)
+        return self.evaluation_log_path / (
+            f"{log_time}_{core_name}-{to_safe_filename(evaluator_name)}_"
+            + f"{random_id}{generation_log_path.suffix}"
+        )
+
+    @_synchronised
+    def evaluation_log_location(self, record_key: EvaluationRecord) -> str | None:
+        """Returns the location for the evaluation log of the given record
+        without initialising the record or its log.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+
+        Returns:
+            str | None: The location of the existing evaluation log, or the
+                location at which a new evaluation log should be stored, or None
+                if there are no successful generations for the record.
+        """
+        self._refresh()
+        eval_record = self._retrieve_verify_record(record_key)
+        if eval_record is not None and eval_record.log_location is not None:
+            return eval_record.log_location
+
+        generation_record = self._retrieve_verify_record(record_key.generation_record)
+        if (
+            generation_record is None
+            or generation_record.status != "success"
+            or generation_record.log_location is None
+        ):
+            return None
+        return str(
+            self._derive_evaluation_log_path(
+                record_key, Path(generation_record.log_location)
+            )
+        )
+
+    @_synchronised
     def get_record(
         self,
         record_key: GenerationRecord | EvaluationRecord,
@@ -241,7 +661,9 @@ class Project:
 
         Note: Calling this method may initialise a new evaluation record from
         the matching generation record if the evaluation record does not exist
-        yet and `init_eval_record_from_generations` is set to True.
+        yet and `init_eval_record_from_generations` is set to True. In that case,
+        an existing evaluation record based on generations for a different
+        dataset subsample is replaced as well.
 
         Args:
             record_key (GenerationRecord | EvaluationRecord): The generation
@@ -255,49 +677,274 @@ class Project:
             ResultRecord | None: The generation or evaluation result, or None if
                 a valid record does not exist.
         """
+        self._refresh()
         if type(record_key) is GenerationRecord:
             return self._retrieve_verify_record(record_key)
         elif type(record_key) is EvaluationRecord:
             retrieved_eval_record = self._retrieve_verify_record(record_key)
-            if (
-                retrieved_eval_record is not None
-                or not init_eval_record_from_generations
-            ):
+            if not init_eval_record_from_generations:
                 return retrieved_eval_record
 
             generation_result = self._retrieve_verify_record(
                 record_key.generation_record
             )
+            if retrieved_eval_record is not None:
+                if (
+                    generation_result is None
+                    or generation_result.subsample == retrieved_eval_record.subsample
+                ):
+                    return retrieved_eval_record
+                # The evaluation is based on generations for a different subsample
+                # of the dataset, which have since been replaced
+                self.remove_record(record_key)
             if generation_result is None:
                 return None
             if (
                 generation_result.status != "success"
                 or generation_result.log_location is None
             ):
-                self.records.evaluation[record_key] = generation_result
+                self._set_record(record_key, generation_result)
                 self._save()
                 return generation_result
 
             # Create a new evaluation log based on the generation log
             log_path = Path(generation_result.log_location)
-            evaluator_name = record_key.evaluator_name
-            log_time, core_name, random_id = log_path.stem.split("_", 2)
-            new_log_path = self.evaluation_log_path / (
-                f"{log_time}_{core_name}-{to_safe_filename(evaluator_name)}_"
-                + f"{random_id}{log_path.suffix}"
-            )
+            new_log_path = self._derive_evaluation_log_path(record_key, log_path)
             new_log_path.parent.mkdir(parents=True, exist_ok=True)
             if not new_log_path.exists():
                 shutil.copy(log_path, new_log_path)
             new_record = ResultRecord(
                 log_location=str(new_log_path),
+                subsample=generation_result.subsample,
             )
-            self.records.evaluation[record_key] = new_record
+            self._set_record(record_key, new_record)
             self._save()
             return new_record
         else:
             raise TypeError(f"Invalid record type: {type(record_key)}")
 
+    def sample_shard_log_path(
+        self,
+        record_key: GenerationRecord,
+        shard_index: int,
+        num_shards: int,
+    ) -> Path:
+        """Returns the path to the log directory for a sample shard of generations.
+
+        Args:
+            record_key (GenerationRecord): The generation record.
+            shard_index (int): The index of the sample shard.
+            num_shards (int): The total number of sample shards.
+
+        Returns:
+            Path: The path to the log directory for the sample shard.
+        """
+        return (
+            self.generation_log_path
+            / "shards"
+            / get_record_digest(record_key)
+            / f"{shard_index}-of-{num_shards}"
+        )
+
+    def get_sample_shard_log(
+        self,
+        record_key: GenerationRecord,
+        shard_index: int,
+        num_shards: int,
+        header_only: bool = False,
+    ) -> EvalLog | None:
+        """Returns the latest log for a sample shard of generations.
+
+        Args:
+            record_key (GenerationRecord): The generation record.
+            shard_index (int): The index of the sample shard.
+            num_shards (int): The total number of sample shards.
+            header_only (bool): Whether to read only the log header, without
+                the samples. Defaults to False.
+
+        Returns:
+            EvalLog | None: The latest log for the sample shard, or None if
+                no log exists.
+        """
+        log_path = self.sample_shard_log_path(record_key, shard_index, num_shards)
+        if not log_path.exists():
+            return None
+        # Log file names start with a timestamp
+        log_files = sorted(
+            [*log_path.glob("*.eval"), *log_path.glob("*.json")],
+            key=lambda f: f.name,
+        )
+        if not log_files:
+            return None
+        return read_eval_log(str(log_files[-1]), header_only=header_only)
+
+    @_synchronised
+    def merge_sample_shards(
+        self,
+        record_key: GenerationRecord,
+        num_shards: int,
+        subsample: dict[str, Any] | None = None,
+    ) -> bool:
+        """Merges the logs for the sample shards of generations into a single log,
+        if all sample shards have been completed successfully.
+
+        The merged log is tracked as the generation log for the record, while the
+        logs for the individual sample shards are removed.
+
+        Args:
+            record_key (GenerationRecord): The generation record.
+            num_shards (int): The total number of sample shards.
+            subsample (dict[str, Any] | None): The selection parameters of the
+                dataset subsample the shards were generated on, or None if they
+                cover the full dataset. Defaults to None.
+
+        Returns:
+            bool: True if the generations are available as a single log, False
+                if some sample shards are still missing or unsuccessful.
+        """
+        with self._file_lock:
+            # Another process may have already merged the shards
+            self._refresh()
+            record = self._retrieve_verify_record(record_key)
+            if (
+                record is not None
+                and record.status == "success"
+                and record.subsample == subsample
+            ):
+                return True
+
+            for shard_index in range(num_shards):
+                try:
+                    header = self.get_sample_shard_log(
+                        record_key, shard_index, num_shards, header_only=True
+                    )
+                except (OSError, ValueError):
+                    # The log is still being written by another worker
+                    return False
+                if header is None or header.status != "success":
+                    return False
+
+            logs = [
+                cast(EvalLog, self.get_sample_shard_log(record_key, i, num_shards))
+                for i in range(num_shards)
+            ]
+            merged_log = merge_eval_logs(logs)
+            merged_log_path = self.generation_log_path / Path(logs[0].location).name
+            write_eval_log(merged_log, str(merged_log_path))
+            self.update_record(
+                record_key,
+                ResultRecord(
+                    status="success",
+                    log_location=str(merged_log_path),
+                    subsample=subsample,
+                ),
+            )
+            shutil.rmtree(self.sample_shard_log_path(record_key, 0, num_shards).parent)
+            return True
+
+    def increment_log_path(self, record_key: GenerationRecord) -> Path:
+        """Returns the path to the log directory for newly added samples being
+        generated incrementally.
+
+        Args:
+            record_key (GenerationRecord): The generation record.
+
+        Returns:
+            Path: The path to the log directory for the new samples.
+        """
+        return self.generation_log_path / "increments" / get_record_digest(record_key)
+
+    @_synchronised
+    def append_generations(
+        self,
+        record_key: GenerationRecord,
+        increment_log: EvalLog,
+        subsample: dict[str, Any] | None = None,
+    ):
+        """Appends the samples from a log of incremental generations to the
+        existing successful generation log for the record.
+
+        The evaluation records depending on the generations are removed, as they
+        no longer cover all the generated samples, and the log directory for the
+        incremental generations is cleaned up. The scores from the successful
+        evaluations are kept as score checkpoints, so that the evaluations only
+        score the newly generated samples when resumed with checkpointing enabled.
+
+        Args:
+            record_key (GenerationRecord): The generation record.
+            increment_log (EvalLog): The log with the newly generated samples.
+            subsample (dict[str, Any] | None): The selection parameters of the
+                dataset subsample covered by the extended generations, or None
+                if they cover the full dataset. Defaults to None.
+
+        Raises:
+            ValueError: If the record has no successful generation log.
+        """
+        with self._file_lock:
+            self._refresh()
+            record = self._retrieve_verify_record(record_key)
+            if (
+                record is None
+                or record.status != "success"
+                or record.log_location is None
+            ):
+                raise ValueError(
+                    f"No successful generations to append to for {record_key.label}."
+                )
+
+            existing_log = read_eval_log(record.log_location)
+            merged_log = merge_eval_logs([existing_log, increment_log])
+            write_eval_log(merged_log, record.log_location)
+            for evaluation_record in [
+                k for k in self.records.evaluation if k.generation_record == record_key
+            ]:
+                self._checkpoint_evaluation_scores(
+                    evaluation_record, log_id=existing_log.eval.eval_id
+                )
+                self.remove_record(evaluation_record)
+            self._set_record(
+                record_key, record.model_copy(update={"subsample": subsample})
+            )
+            self._save()
+            shutil.rmtree(self.increment_log_path(record_key), ignore_errors=True)
+
+    def _checkpoint_evaluation_scores(self, record_key: EvaluationRecord, log_id: str):
+        """Saves the sample scores of a successful evaluation as a score
+        checkpoint, so that they can be reused when re-evaluating the samples.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+            log_id (str): The ID of the generation log the scores belong to.
+        """
+        record = self.records.evaluation.get(record_key)
+        if record is None or record.status != "success" or record.log_location is None:
+            return
+        checkpoint = ScoreCheckpoint(
+            self.evaluation_checkpoint_path(record_key), log_id=log_id
+        )
+        for sample in read_eval_log(record.log_location).samples or []:
+            if sample.scores:
+                checkpoint.add(
+                    sample.id, sample.epoch, next(iter(sample.scores.values()))
+                )
+        checkpoint.flush()
+
+    def evaluation_checkpoint_path(self, record_key: EvaluationRecord) -> Path:
+        """Returns the path to the checkpoint of the sample scores for an
+        evaluation in progress.
+
+        Args:
+            record_key (EvaluationRecord): The evaluation record.
+
+        Returns:
+            Path: The path to the score checkpoint file.
+        """
+        return (
+            self.evaluation_log_path
+            / "checkpoints"
+            / f"{get_record_digest(record_key)}.jsonl"
+        )
+
     def get_log(
         self,
         record_key: GenerationRecord | EvaluationRecord,
@@ -325,55 +972,195 @@ class Project:
         if record is not None and record.log_location is not None:
             log_path = Path(record.log_location)
             if log_path.exists():
-                return read_eval_log(str(log_path))
+                return self.log_cache.read(log_path)
+
+    @overload
+    def iter_logs(
+        self,
+        type: Literal["generation"],
+        status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
+    ) -> Iterator[tuple[GenerationRecord, EvalLog]]: ...
+    @overload
+    def iter_logs(
+        self,
+        type: Literal["evaluation"],
+        status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
+    ) -> Iterator[tuple[EvaluationRecord, EvalLog]]: ...
+    def iter_logs(
+        self,
+        type: Literal["generation", "evaluation"],
+        status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
+    ) -> (
+        Iterator[tuple[GenerationRecord, EvalLog]]
+        | Iterator[tuple[EvaluationRecord, EvalLog]]
+    ):
+        """Iterates over the logs for the given type and status, sorted by the
+        corresponding record keys.
+
+        The logs are read lazily, one at a time, so that only a single log is held
+        in memory if the caller does not keep references to the previous ones.
+
+        Args:
+            type (Literal["generation", "evaluation"]): The type of logs to retrieve.
+            status (RecordStatus | None): The status of the logs to retrieve.
+                Defaults to None (i.e., retrieving all logs regardless of status).
+            header_only (bool): Whether to read only the log headers (including
+                the results and metrics) without the samples. Defaults to False.
+
+        Raises:
+            ValueError: If the log type is invalid.
+
+        Returns:
+            Iterator[tuple[GenerationRecord | EvaluationRecord, EvalLog]]: An
+                iterator over the record keys and the corresponding logs.
+        """
+        with self._lock:
+            self._refresh()
+            if type == "generation":
+                generation_records = dict(self.records.generation)
+                return self._iter_record_logs(generation_records, status, header_only)
+            elif type == "evaluation":
+                evaluation_records = dict(self.records.evaluation)
+                return self._iter_record_logs(evaluation_records, status, header_only)
+            else:
+                raise ValueError(f"Invalid log type: {type}")
+
+    def _iter_record_logs[K: GenerationRecord | EvaluationRecord](
+        self,
+        records: dict[K, ResultRecord],
+        status: RecordStatus | None,
+        header_only: bool,
+    ) -> Iterator[tuple[K, EvalLog]]:
+        """Reads the logs of the given records one at a time.
+
+        Args:
+            records (dict[K, ResultRecord]): The records of the logs to read.
+            status (RecordStatus | None): The status of the logs to read, or None
+                to read all logs regardless of status.
+            header_only (bool): Whether to read only the log headers.
+
+        Returns:
+            Iterator[tuple[K, EvalLog]]: An iterator over the record keys and
+                the corresponding logs.
+        """
+        for key in sorted(records):
+            value = records[key]
+            if status is not None and value.status != status:
+                continue
+            if value.log_location is not None:
+                log_path = Path(value.log_location)
+                if log_path.exists():
+                    # Only the headers are cached, as the full logs are read to be
+                    # processed one at a time
+                    if header_only:
+                        eval_log = self.log_cache.read(log_path, header_only=True)
+                    else:
+                        eval_log = read_eval_log(str(log_path))
+                    yield key, eval_log
 
     @overload
     def get_logs(
         self,
         type: Literal["generation"],
         status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
     ) -> dict[GenerationRecord, EvalLog]: ...
     @overload
     def get_logs(
         self,
         type: Literal["evaluation"],
         status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
     ) -> dict[EvaluationRecord, EvalLog]: ...
     def get_logs(
         self,
         type: Literal["generation", "evaluation"],
         status: RecordStatus | None = None,
+        *,
+        header_only: bool = False,
     ) -> dict[GenerationRecord, EvalLog] | dict[EvaluationRecord, EvalLog]:
         """Returns a dictionary of logs for the given type and status. The dictionary
         is automatically sorted by the corresponding record keys.
 
+        All logs are read into memory at once, which may require a large amount
+        of memory for big projects. Use `iter_logs` to process the logs one at
+        a time, `header_only` when only the results and metrics are needed, or
+        `iter_samples` to stream the samples of individual logs.
+
         Args:
             type (Literal["generation", "evaluation"]): The type of logs to retrieve.
             status (RecordStatus | None): The status of the logs to retrieve.
                 Defaults to None (i.e., retrieving all logs regardless of status).
+            header_only (bool): Whether to read only the log headers (including
+                the results and metrics) without the samples. Defaults to False.
+
+        Raises:
+            ValueError: If the log type is invalid.
 
         Returns:
             dict[GenerationRecord | EvaluationRecord, EvalLog]: A dictionary of logs.
         """
         if type == "generation":
-            records = self.records.generation
+            return dict(self.iter_logs(type, status, header_only=header_only))
         elif type == "evaluation":
-            records = self.records.evaluation
+            return dict(self.iter_logs(type, status, header_only=header_only))
         else:
             raise ValueError(f"Invalid log type: {type}")
 
-        results = {}
-        for key, value in records.items():
-            if status is not None and value.status != status:
-                continue
-            if value.log_location is not None:
-                log_path = Path(value.log_location)
-                if log_path.exists():
-                    eval_log = read_eval_log(str(log_path))
-                    if eval_log is not None:
-                        results[key] = eval_log
+    def iter_samples(
+        self,
+        record_key: GenerationRecord | EvaluationRecord,
+        exclude_fields: set[str] | None = None,
+    ) -> Iterator[EvalSample]:
+        """Iterates over the samples of the log for the given record key.
 
-        return dict(sorted(results.items()))
+        Logs fitting into the log cache (if enabled) are read in full through the
+        cache, which is faster than reading the samples individually and makes
+        repeated reads near-instant, in which case all sample fields are
+        included. The samples of larger logs are read from the log file one at
+        a time, so that the whole log does not need to be held in memory.
+        Samples missing from incomplete logs are skipped.
+
+        Args:
+            record_key (GenerationRecord | EvaluationRecord): The generation
+                or evaluation record whose samples to retrieve.
+            exclude_fields (set[str] | None): The sample fields to skip when
+                reading the samples (e.g., `TRANSCRIPT_SAMPLE_FIELDS` when only
+                the scores are needed). Defaults to None.
+
+        Returns:
+            Iterator[EvalSample]: An iterator over the samples, or an empty
+                iterator if a valid log does not exist.
+        """
+        record = self.get_record(record_key)
+        if record is None or record.log_location is None:
+            return
+        log_path = Path(record.log_location)
+        if not log_path.exists():
+            return
+
+        if self.log_cache.fits(log_path):
+            yield from self.log_cache.read(log_path).samples or []
+            return
+
+        header = self.log_cache.read(log_path, header_only=True)
+        if header.eval.dataset.sample_ids is None:
+            # Older logs without sample IDs can only be read in full
+            yield from read_eval_log(str(log_path)).samples or []
+            return
+        yield from read_eval_log_samples(
+            str(log_path),
+            all_samples_required=False,
+            exclude_fields=exclude_fields,
+        )
 
     def get_incomplete_logs(
         self,
@@ -387,22 +1174,24 @@ class Project:
         Returns:
             list[EvalLog]: A list of incomplete logs.
         """
-        if type == "generation":
-            log_path = self.generation_log_path
-            known_logs = [
-                v.log_location
-                for v in self.records.generation.values()
-                if v.log_location
-            ]
-        elif type == "evaluation":
-            log_path = self.evaluation_log_path
-            known_logs = [
-                v.log_location
-                for v in self.records.evaluation.values()
-                if v.log_location
-            ]
-        else:
-            raise ValueError(f"Invalid log type: {type}")
+        with self._lock:
+            self._refresh()
+            if type == "generation":
+                log_path = self.generation_log_path
+                known_logs = [
+                    v.log_location
+                    for v in self.records.generation.values()
+                    if v.log_location
+                ]
+            elif type == "evaluation":
+                log_path = self.evaluation_log_path
+                known_logs = [
+                    v.log_location
+                    for v in self.records.evaluation.values()
+                    if v.log_location
+                ]
+            else:
+                raise ValueError(f"Invalid log type: {type}")
 
         incomplete_logs = []
         extensions = [".json", ".eval"]
@@ -414,7 +1203,16 @@ class Project:
         return incomplete_logs
 
     def cleanup_incomplete_logs(self):
-        """Removes all incomplete logs in the project directory."""
+        """Removes all incomplete logs in the project directory, unless the
+        project is being used by other sessions, which may still be writing
+        the logs."""
+        active_sessions = self.get_active_sessions()
+        if active_sessions > 0:
+            logger.info(
+                f"⏭️  Skipping the cleanup of incomplete logs, as project "
+                f"{self.name} is being used by {active_sessions} other session(s)."
+            )
+            return
         incomplete_logs = self.get_incomplete_logs(
             "generation"
         ) + self.get_incomplete_logs("evaluation")
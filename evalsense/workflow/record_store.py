@@ -0,0 +1,601 @@
+import os
+from pathlib import Path
+import sqlite3
+from typing import Literal, Mapping, Protocol
+
+from pydantic import BaseModel, ValidationError, field_serializer, model_validator
+
+from evalsense.evaluation import EvaluationRecord, GenerationRecord, ResultRecord
+from evalsense.logging import get_logger
+from evalsense.utils.files import get_file_signature
+from evalsense.workflow.sharding import get_record_digest
+
+logger = get_logger(__name__)
+
+type RecordKey = GenerationRecord | EvaluationRecord
+type RecordStoreBackend = Literal["journal", "json", "sqlite"]
+
+# Seconds to wait for the database lock held by other processes
+_SQLITE_TIMEOUT = 60.0
+
+
+class ProjectRecords(BaseModel):
+    """Metadata for generation and evaluation records associated with a project."""
+
+    generation: dict[GenerationRecord, ResultRecord] = {}
+    evaluation: dict[EvaluationRecord, ResultRecord] = {}
+
+    @field_serializer("generation")
+    def serialise_generation(
+        self,
+        value: dict[GenerationRecord, ResultRecord],
+    ) -> list[tuple[dict, dict]]:
+        """Convert generation records to a serializable format."""
+        return [(k.model_dump(), v.model_dump()) for k, v in value.items()]
+
+    @field_serializer("evaluation")
+    def serialise_evaluation(
+        self,
+        value: dict[EvaluationRecord, ResultRecord],
+    ) -> list[tuple[dict, dict]]:
+        """Converts evaluation records to a serializable format."""
+        return [(k.model_dump(), v.model_dump()) for k, v in value.items()]
+
+    @model_validator(mode="before")
+    @classmethod
+    def transform_lists_to_dicts(cls, values: dict) -> dict:
+        """Converts serialized lists back into dictionaries."""
+        values["generation"] = {
+            GenerationRecord.model_validate(k): ResultRecord.model_validate(v)
+            for k, v in values.get("generation", [])
+        }
+        values["evaluation"] = {
+            EvaluationRecord.model_validate(k): ResultRecord.model_validate(v)
+            for k, v in values.get("evaluation", [])
+        }
+        return values
+
+    def set(self, record_key: RecordKey, record_value: ResultRecord | None):
+        """Sets or removes a record.
+
+        Args:
+            record_key (GenerationRecord | EvaluationRecord): The generation
+                or evaluation record to set.
+            record_value (ResultRecord | None): The generation or evaluation
+                result, or None to remove the record.
+
+        Raises:
+            TypeError: If the record type is invalid.
+        """
+        if type(record_key) is GenerationRecord:
+            record_dict = self.generation
+        elif type(record_key) is EvaluationRecord:
+            record_dict = self.evaluation
+        else:
+            raise TypeError(f"Invalid record type: {type(record_key)}")
+
+        if record_value is None:
+            record_dict.pop(record_key, None)  # type: ignore
+        else:
+            record_dict[record_key] = record_value  # type: ignore
+
+
+class _RecordChange(BaseModel, frozen=True):
+    """A change of a single record, as stored in a record journal or database.
+
+    Attributes:
+        kind (Literal["generation", "evaluation"]): The type of the record.
+        key (dict): The serialised generation or evaluation record.
+        value (dict | None): The serialised result, or None if the record
+            was removed.
+    """
+
+    kind: Literal["generation", "evaluation"]
+    key: dict
+    value: dict | None = None
+
+    @classmethod
+    def create(
+        cls, record_key: RecordKey, record_value: ResultRecord | None
+    ) -> "_RecordChange":
+        """Creates a record change.
+
+        Args:
+            record_key (GenerationRecord | EvaluationRecord): The changed record.
+            record_value (ResultRecord | None): The new result, or None if the
+                record was removed.
+
+        Returns:
+            _RecordChange: The record change.
+        """
+        return cls(
+            kind="evaluation" if type(record_key) is EvaluationRecord else "generation",
+            key=record_key.model_dump(mode="json"),
+            value=(
+                record_value.model_dump(mode="json")
+                if record_value is not None
+                else None
+            ),
+        )
+
+    def apply(self, records: ProjectRecords):
+        """Applies the change to the records.
+
+        Args:
+            records (ProjectRecords): The records to update.
+        """
+        record_type = (
+            EvaluationRecord if self.kind == "evaluation" else GenerationRecord
+        )
+        records.set(
+            record_type.model_validate(self.key),
+            ResultRecord.model_validate(self.value) if self.value is not None else None,
+        )
+
+
+def _write_atomically(path: Path, content: str):
+    """Writes a text file atomically, replacing any existing file.
+
+    Args:
+        path (Path): The path to the file.
+        content (str): The content to write.
+    """
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_file, path)
+
+
+class RecordStore(Protocol):
+    """A protocol for persisting the generation and evaluation records of
+    a project.
+
+    The records are cached in memory and the stores only read the changes made
+    by other processes where possible. Callers sharing the store between
+    processes must hold the project file lock while reading or writing.
+    """
+
+    def exists(self) -> bool:
+        """Checks whether the store has been created on disk.
+
+        Returns:
+            bool: True if the store exists, False otherwise.
+        """
+        ...
+
+    def has_changes(self) -> bool:
+        """Checks whether the store may have been modified since the last read,
+        without reading the records. The check does not require holding the
+        project file lock.
+
+        Returns:
+            bool: True if the records have not been read yet or the store has
+                been modified since, False otherwise.
+        """
+        ...
+
+    def read(self) -> ProjectRecords:
+        """Reads the current records, including the changes made by other
+        processes.
+
+        Returns:
+            ProjectRecords: The current records, or empty records if the store
+                does not exist.
+        """
+        ...
+
+    def write(self, changes: Mapping[RecordKey, ResultRecord | None]) -> ProjectRecords:
+        """Applies the record changes atomically, creating the store if needed.
+
+        Args:
+            changes (Mapping[GenerationRecord | EvaluationRecord, ResultRecord | None]):
+                The changed records, with None marking the removed records.
+
+        Returns:
+            ProjectRecords: The current records after applying the changes.
+        """
+        ...
+
+    def close(self):
+        """Releases the resources held by the store and clears its cache."""
+        ...
+
+    def remove(self):
+        """Closes the store and deletes its files."""
+        ...
+
+
+class JsonRecordStore:
+    """A record store keeping all records in a single JSON file, which is
+    rewritten in full on each change.
+
+    This is the format used by earlier versions of EvalSense.
+    """
+
+    def __init__(self, path: Path):
+        """Initializes the JSON record store.
+
+        Args:
+            path (Path): The path to the JSON file.
+        """
+        self.path = path
+        self._records: ProjectRecords | None = None
+        self._signature: tuple[int, int, int] | None = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def has_changes(self) -> bool:
+        return self._records is None or get_file_signature(self.path) != self._signature
+
+    def read(self) -> ProjectRecords:
+        signature = get_file_signature(self.path)
+        if self._records is None or signature != self._signature:
+            if signature is None:
+                self._records = ProjectRecords()
+            else:
+                self._records = ProjectRecords.model_validate_json(
+                    self.path.read_text(encoding="utf-8")
+                )
+            self._signature = signature
+        return self._records
+
+    def write(self, changes: Mapping[RecordKey, ResultRecord | None]) -> ProjectRecords:
+        records = self.read()
+        for record_key, record_value in changes.items():
+            records.set(record_key, record_value)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(self.path, records.model_dump_json(indent=4))
+        self._signature = get_file_signature(self.path)
+        return records
+
+    def close(self):
+        self._records = None
+        self._signature = None
+
+    def remove(self):
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class JournalRecordStore:
+    """A record store appending the record changes to a journal file, which
+    is periodically compacted into a JSON snapshot.
+
+    Each change is appended as a single JSON line, so that updating a record
+    takes constant time, and the changes appended by other processes are read
+    incrementally. A line partially written by a crashed process is ignored and
+    overwritten by the next change. The snapshot uses the format of
+    `JsonRecordStore`, so that projects created by earlier versions of EvalSense
+    are loaded without migration.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        journal_path: Path,
+        compaction_threshold: int = 1000,
+    ):
+        """Initializes the journal record store.
+
+        Args:
+            snapshot_path (Path): The path to the JSON snapshot file.
+            journal_path (Path): The path to the journal file.
+            compaction_threshold (int): The minimum number of journal entries
+                before the journal is compacted into the snapshot. The journal
+                is only compacted once it has at least as many entries as there
+                are records, keeping the amortised cost of a change constant.
+                Defaults to 1000.
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compaction_threshold = compaction_threshold
+        self._records: ProjectRecords | None = None
+        self._snapshot_signature: tuple[int, int, int] | None = None
+        # The journal position up to which the changes have been read
+        self._journal_offset = 0
+        self._journal_entries = 0
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def has_changes(self) -> bool:
+        if self._records is None:
+            return True
+        if get_file_signature(self.snapshot_path) != self._snapshot_signature:
+            return True
+        journal_size = (
+            self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        )
+        return journal_size != self._journal_offset
+
+    def _read_journal(self, records: ProjectRecords):
+        """Applies the journal entries appended since the last read.
+
+        Args:
+            records (ProjectRecords): The records to update.
+        """
+        try:
+            with open(self.journal_path, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Skip a trailing line still being written or left by a crashed process
+        complete_length = data.rfind(b"\n") + 1
+        for line in data[:complete_length].splitlines():
+            if not line.strip():
+                continue
+            try:
+                _RecordChange.model_validate_json(line).apply(records)
+            except ValidationError:
+                logger.warning(
+                    f"⚠️  Skipping an invalid entry in the record journal "
+                    f"{self.journal_path}."
+                )
+                continue
+            self._journal_entries += 1
+        self._journal_offset += complete_length
+
+    def read(self) -> ProjectRecords:
+        snapshot_signature = get_file_signature(self.snapshot_path)
+        journal_size = (
+            self.journal_path.stat().st_size if self.journal_path.exists() else 0
+        )
+        if (
+            self._records is None
+            or snapshot_signature != self._snapshot_signature
+            or journal_size < self._journal_offset
+        ):
+            # The journal has been compacted, so the records are reloaded
+            if snapshot_signature is None:
+                self._records = ProjectRecords()
+            else:
+                self._records = ProjectRecords.model_validate_json(
+                    self.snapshot_path.read_text(encoding="utf-8")
+                )
+            self._snapshot_signature = snapshot_signature
+            self._journal_offset = 0
+            self._journal_entries = 0
+        if journal_size > self._journal_offset:
+            self._read_journal(self._records)
+        return self._records
+
+    def write(self, changes: Mapping[RecordKey, ResultRecord | None]) -> ProjectRecords:
+        records = self.read()
+        if not self.exists():
+            self.compact()
+        if not changes:
+            return records
+
+        data = "".join(
+            _RecordChange.create(record_key, record_value).model_dump_json() + "\n"
+            for record_key, record_value in changes.items()
+        ).encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            # Drop any partial line left by a crashed process
+            f.truncate(self._journal_offset)
+            f.write(data)
+        for record_key, record_value in changes.items():
+            records.set(record_key, record_value)
+        self._journal_offset += len(data)
+        self._journal_entries += len(changes)
+
+        if self._journal_entries >= max(
+            self.compaction_threshold,
+            len(records.generation) + len(records.evaluation),
+        ):
+            self.compact()
+        return records
+
+    def compact(self):
+        """Writes the current records into the snapshot and clears the journal.
+
+        A crash between writing the snapshot and clearing the journal is safe,
+        as replaying the journal entries on top of the snapshot is idempotent.
+        """
+        records = self.read()
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(self.snapshot_path, records.model_dump_json(indent=4))
+        self.journal_path.write_bytes(b"")
+        self._snapshot_signature = get_file_signature(self.snapshot_path)
+        self._journal_offset = 0
+        self._journal_entries = 0
+
+    def close(self):
+        self._records = None
+        self._snapshot_signature = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+
+    def remove(self):
+        self.close()
+        self.snapshot_path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+
+
+class SQLiteRecordStore:
+    """A record store keeping the records in an SQLite database, with each
+    change applied in a transaction.
+
+    The records are only re-read when another connection has modified the
+    database since the last read. The database uses a rollback journal rather
+    than write-ahead logging, which relies on shared memory and is unsafe when
+    processes on different hosts share the project (e.g., SLURM jobs sharding
+    a pipeline over a network filesystem). SQLite locking may still be
+    unreliable on some network filesystems, so the journal store remains the
+    default.
+    """
+
+    def __init__(self, path: Path):
+        """Initializes the SQLite record store.
+
+        Args:
+            path (Path): The path to the database file.
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._records: ProjectRecords | None = None
+        self._data_version: int | None = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the database connection, creating the database if needed.
+
+        Returns:
+            sqlite3.Connection: The database connection.
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Transactions are managed explicitly
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=_SQLITE_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=DELETE")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "kind TEXT NOT NULL, digest TEXT NOT NULL, change TEXT NOT NULL, "
+                "PRIMARY KEY (kind, digest))"
+            )
+        return self._connection
+
+    def _get_data_version(self) -> int:
+        """Returns the version of the database, changed by commits from other
+        connections.
+
+        Returns:
+            int: The data version.
+        """
+        return self._connect().execute("PRAGMA data_version").fetchone()[0]
+
+    def has_changes(self) -> bool:
+        return self._records is None or self._get_data_version() != self._data_version
+
+    def read(self) -> ProjectRecords:
+        if self._connection is None and not self.exists():
+            return ProjectRecords()
+        data_version = self._get_data_version()
+        if self._records is None or data_version != self._data_version:
+            records = ProjectRecords()
+            for (change,) in self._connect().execute("SELECT change FROM records"):
+                _RecordChange.model_validate_json(change).apply(records)
+            self._records = records
+            self._data_version = data_version
+        return self._records
+
+    def write(self, changes: Mapping[RecordKey, ResultRecord | None]) -> ProjectRecords:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            records = self.read()
+            for record_key, record_value in changes.items():
+                change = _RecordChange.create(record_key, record_value)
+                if record_value is None:
+                    connection.execute(
+                        "DELETE FROM records WHERE kind = ? AND digest = ?",
+                        (change.kind, get_record_digest(record_key)),
+                    )
+                else:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO records VALUES (?, ?, ?)",
+                        (
+                            change.kind,
+                            get_record_digest(record_key),
+                            change.model_dump_json(),
+                        ),
+                    )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            self._records = None
+            raise
+        for record_key, record_value in changes.items():
+            records.set(record_key, record_value)
+        return records
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._records = None
+        self._data_version = None
+
+    def remove(self):
+        self.close()
+        for suffix in ["", "-journal", "-wal", "-shm"]:
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+
+def create_record_store(
+    project_path: Path,
+    backend: RecordStoreBackend | None = None,
+) -> RecordStore:
+    """Creates the record store for a project.
+
+    When switching an existing project to a different backend, the records
+    are moved from the currently used store, which is then removed, so that
+    the records are only kept in a single store.
+
+    Args:
+        project_path (Path): The path to the project directory.
+        backend (RecordStoreBackend | None): The backend of the store — an
+            append-only journal compacted into a JSON snapshot ("journal"),
+            a single JSON file rewritten on each change ("json") or an SQLite
+            database ("sqlite"). Defaults to None, using the SQLite database
+            if it exists and the journal otherwise.
+
+    Raises:
+        ValueError: If the backend is invalid or if the project has records
+            in multiple stores, as it is then unclear which of them is current.
+
+    Returns:
+        RecordStore: The record store.
+    """
+    snapshot_path = project_path / "metadata.json"
+    journal_path = project_path / "metadata.journal.jsonl"
+    database_path = project_path / "records.db"
+    if backend is None:
+        backend = "sqlite" if database_path.exists() else "journal"
+
+    store: RecordStore
+    if backend == "journal":
+        store = JournalRecordStore(snapshot_path, journal_path)
+        previous_store: RecordStore = SQLiteRecordStore(database_path)
+    elif backend == "json":
+        if journal_path.exists():
+            # Fold the journal into the JSON file
+            JournalRecordStore(snapshot_path, journal_path).compact()
+            journal_path.unlink()
+        store = JsonRecordStore(snapshot_path)
+        previous_store = SQLiteRecordStore(database_path)
+    elif backend == "sqlite":
+        store = SQLiteRecordStore(database_path)
+        previous_store = JournalRecordStore(snapshot_path, journal_path)
+    else:
+        raise ValueError(f"Invalid record store backend: {backend}")
+
+    if previous_store.exists():
+        if store.exists():
+            previous_store.close()
+            raise ValueError(
+                f"Project at {project_path} has records in multiple stores, "
+                f"so it is unclear whether the {backend} store is up to date. "
+                "Remove the stale store files before loading the project."
+            )
+        previous_records = previous_store.read()
+        logger.info(f"🔄  Moving the project records into the {backend} store.")
+        store.write(
+            {
+                **previous_records.generation,
+                **previous_records.evaluation,
+            }
+        )
+        previous_store.remove()
+    else:
+        previous_store.close()
+    return store
@@ -0,0 +1,323 @@
+from dataclasses import dataclass, field
+from typing import Callable, Literal, cast
+
+from inspect_ai.model import Model
+
+from evalsense.evaluation import ExperimentConfig, GenerationRecord, ScorerFactory
+from evalsense.generation import ModelConfig
+from evalsense.workflow.model_pool import ModelPool, get_model_key
+
+type PlanStage = Literal["generation", "evaluation"]
+
+
+@dataclass
+class PlanStep:
+    """A single step of an execution plan.
+
+    Attributes:
+        stage (PlanStage): The pipeline stage performed in the step.
+        experiment (ExperimentConfig): The experiment processed in the step.
+        model_config (ModelConfig | None): The configuration of the model used
+            in the step, or None if the step does not require a model.
+        loads_model (bool): Whether the step requires loading a new model.
+    """
+
+    stage: PlanStage
+    experiment: ExperimentConfig
+    model_config: ModelConfig | None
+    loads_model: bool = False
+
+    @property
+    def label(self) -> str:
+        """Returns the label of the record processed in the step.
+
+        Returns:
+            str: The label of the generation or evaluation record.
+        """
+        if self.stage == "generation":
+            return self.experiment.generation_record.label
+        return self.experiment.evaluation_record.label
+
+
+@dataclass
+class ExecutionPlan:
+    """An ordered plan of the pending generation and evaluation steps.
+
+    Attributes:
+        steps (list[PlanStep]): The planned steps, in the order of execution.
+    """
+
+    steps: list[PlanStep] = field(default_factory=list)
+
+    @property
+    def model_loads(self) -> int:
+        """Returns the expected number of model loads when executing the plan.
+
+        Returns:
+            int: The expected number of model loads.
+        """
+        return sum(step.loads_model for step in self.steps)
+
+    def __str__(self) -> str:
+        """Formats the plan as a human-readable table.
+
+        Returns:
+            str: The formatted plan.
+        """
+        lines = [
+            f"Execution plan: {len(self.steps)} steps, "
+            f"{self.model_loads} expected model loads"
+        ]
+        for i, step in enumerate(self.steps, start=1):
+            load_marker = "⏏" if step.loads_model else " "
+            model_name = step.model_config.name if step.model_config else "—"
+            lines.append(
+                f"{i:>4}. {load_marker} {step.stage:<10} [{model_name}] {step.label}"
+            )
+        return "\n".join(lines)
+
+
+def _evaluation_model_config(experiment: ExperimentConfig) -> ModelConfig | None:
+    """Returns the configuration of the model loaded for evaluating an experiment.
+
+    Args:
+        experiment (ExperimentConfig): The experiment to evaluate.
+
+    Returns:
+        ModelConfig | None: The evaluation model configuration, or None if the
+            evaluation does not require loading a model.
+    """
+    if experiment.evaluator is None or not isinstance(
+        experiment.evaluator.scorer, ScorerFactory
+    ):
+        return None
+    return experiment.evaluator.model_config
+
+
+def _simulate_model_load(
+    model_pool: ModelPool,
+    model_config: ModelConfig | None,
+) -> bool:
+    """Simulates using a model from a model pool.
+
+    Args:
+        model_pool (ModelPool): The simulated model pool.
+        model_config (ModelConfig | None): The configuration of the used model,
+            or None if no model is used.
+
+    Returns:
+        bool: Whether the model would need to be loaded.
+    """
+    if model_config is None:
+        return False
+    loads_model = model_config not in model_pool
+    model_pool.get(model_config)
+    return loads_model
+
+
+def _create_simulated_model_pool(
+    max_loaded_models: int,
+    gpu_memory_budget: float,
+) -> ModelPool:
+    """Creates a model pool simulating model loads without loading any models.
+
+    Args:
+        max_loaded_models (int): The maximum number of models kept loaded at
+            the same time.
+        gpu_memory_budget (float): The maximum total fraction of the GPU memory
+            used by the loaded models.
+
+    Returns:
+        ModelPool: The simulated model pool.
+    """
+    return ModelPool(
+        create_model=lambda _: cast(Model, None),
+        close_model=lambda *_: None,
+        max_models=max_loaded_models,
+        gpu_memory_budget=gpu_memory_budget,
+    )
+
+
+def plan_staged_execution(
+    generation_experiments: list[ExperimentConfig],
+    evaluation_experiments: list[ExperimentConfig],
+    max_loaded_models: int = 1,
+    gpu_memory_budget: float = 1.0,
+) -> ExecutionPlan:
+    """Plans the execution of all generations followed by all evaluations.
+
+    This mirrors the standard behaviour of the pipeline.
+
+    Args:
+        generation_experiments (list[ExperimentConfig]): The pending generation
+            experiments, in the order of execution.
+        evaluation_experiments (list[ExperimentConfig]): The pending evaluation
+            experiments, in the order of execution.
+        max_loaded_models (int): The maximum number of models kept loaded at
+            the same time. Defaults to 1.
+        gpu_memory_budget (float): The maximum total fraction of the GPU memory
+            used by the loaded models. Defaults to 1.0.
+
+    Returns:
+        ExecutionPlan: The planned execution.
+    """
+    model_pool = _create_simulated_model_pool(max_loaded_models, gpu_memory_budget)
+    plan = ExecutionPlan()
+    for experiment in generation_experiments:
+        plan.steps.append(
+            PlanStep(
+                stage="generation",
+                experiment=experiment,
+                model_config=experiment.model_config,
+                loads_model=_simulate_model_load(model_pool, experiment.model_config),
+            )
+        )
+    for experiment in evaluation_experiments:
+        model_config = _evaluation_model_config(experiment)
+        plan.steps.append(
+            PlanStep(
+                stage="evaluation",
+                experiment=experiment,
+                model_config=model_config,
+                loads_model=_simulate_model_load(model_pool, model_config),
+            )
+        )
+    return plan
+
+
+def plan_interleaved_execution(
+    generation_experiments: list[ExperimentConfig],
+    evaluation_experiments: list[ExperimentConfig],
+    is_generated: Callable[[GenerationRecord], bool],
+    max_loaded_models: int = 1,
+    gpu_memory_budget: float = 1.0,
+) -> ExecutionPlan:
+    """Plans the execution of generations and evaluations minimising model loads.
+
+    The planner considers the dependencies between the generation and evaluation
+    stages. Each time a model is loaded, all pending generations using the model
+    are performed, followed by all evaluations using the model as a judge whose
+    generations are available. Evaluations not requiring a model are scheduled
+    as soon as their generations are available. When choosing the next model,
+    the planner prefers the loaded models and models that can complete all their
+    pending work, so that they do not need to be loaded again later.
+
+    Args:
+        generation_experiments (list[ExperimentConfig]): The pending generation
+            experiments. Their order is used to break ties between models.
+        evaluation_experiments (list[ExperimentConfig]): The pending evaluation
+            experiments. Their order is used to break ties between models.
+        is_generated (Callable[[GenerationRecord], bool]): A function checking
+            whether the generations for a given record are already available.
+        max_loaded_models (int): The maximum number of models kept loaded at
+            the same time. Defaults to 1.
+        gpu_memory_budget (float): The maximum total fraction of the GPU memory
+            used by the loaded models. Defaults to 1.0.
+
+    Returns:
+        ExecutionPlan: The planned execution.
+    """
+    pending_generations = list(generation_experiments)
+    pending_evaluations = list(evaluation_experiments)
+    pending_generation_models = {
+        e.generation_record: get_model_key(e.model_config) for e in pending_generations
+    }
+    model_configs: dict[str, ModelConfig] = {}
+    for model_config in [e.model_config for e in pending_generations] + [
+        _evaluation_model_config(e) for e in pending_evaluations
+    ]:
+        key = get_model_key(model_config)
+        if key is not None and key not in model_configs:
+            model_configs[key] = cast(ModelConfig, model_config)
+
+    planned_generations = set(pending_generation_models)
+    model_pool = _create_simulated_model_pool(max_loaded_models, gpu_memory_budget)
+    plan = ExecutionPlan()
+
+    def is_runnable(experiment: ExperimentConfig) -> bool:
+        record = experiment.generation_record
+        return record not in pending_generation_models and (
+            record in planned_generations or is_generated(record)
+        )
+
+    def schedule_evaluations(key: str | None):
+        for experiment in [
+            e
+            for e in pending_evaluations
+            if get_model_key(_evaluation_model_config(e)) == key and is_runnable(e)
+        ]:
+            pending_evaluations.remove(experiment)
+            model_config = _evaluation_model_config(experiment)
+            plan.steps.append(
+                PlanStep(
+                    stage="evaluation",
+                    experiment=experiment,
+                    model_config=model_config,
+                    loads_model=_simulate_model_load(model_pool, model_config),
+                )
+            )
+
+    schedule_evaluations(None)
+    while True:
+        # Collect the models with pending work
+        candidate_keys = [
+            key
+            for key in model_configs
+            if any(get_model_key(e.model_config) == key for e in pending_generations)
+            or any(
+                get_model_key(_evaluation_model_config(e)) == key and is_runnable(e)
+                for e in pending_evaluations
+            )
+        ]
+        if not candidate_keys:
+            break
+
+        # Prefer models whose evaluations do not wait for other models
+        def is_blocked(key: str) -> bool:
+            return any(
+                get_model_key(_evaluation_model_config(e)) == key
+                and pending_generation_models.get(e.generation_record, key) != key
+                for e in pending_evaluations
+            )
+
+        unblocked_keys = [key for key in candidate_keys if not is_blocked(key)]
+        preferred_keys = unblocked_keys or candidate_keys
+        loaded_keys = [
+            key for key in preferred_keys if model_configs[key] in model_pool
+        ]
+        key = (loaded_keys or preferred_keys)[0]
+
+        # Schedule the generations for the selected model
+        for experiment in [
+            e for e in pending_generations if get_model_key(e.model_config) == key
+        ]:
+            pending_generations.remove(experiment)
+            del pending_generation_models[experiment.generation_record]
+            plan.steps.append(
+                PlanStep(
+                    stage="generation",
+                    experiment=experiment,
+                    model_config=experiment.model_config,
+                    loads_model=_simulate_model_load(
+                        model_pool, experiment.model_config
+                    ),
+                )
+            )
+
+        # Schedule the evaluations for the selected model and model-free
+        # evaluations unlocked by the new generations
+        schedule_evaluations(key)
+        schedule_evaluations(None)
+
+    # Any remaining evaluations lack generations — keep them for error reporting
+    for experiment in pending_evaluations:
+        model_config = _evaluation_model_config(experiment)
+        plan.steps.append(
+            PlanStep(
+                stage="evaluation",
+                experiment=experiment,
+                model_config=model_config,
+                loads_model=_simulate_model_load(model_pool, model_config),
+            )
+        )
+    return plan
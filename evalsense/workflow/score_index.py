@@ -0,0 +1,107 @@
+import json
+import os
+from pathlib import Path
+
+from inspect_ai.log import EvalLog
+import polars as pl
+
+from evalsense.evaluation import EvaluationRecord
+from evalsense.workflow.sharding import get_record_digest
+
+SCORE_INDEX_SCHEMA = {
+    "record": pl.String,
+    "dataset": pl.String,
+    "splits": pl.String,
+    "task": pl.String,
+    "generator": pl.String,
+    "model": pl.String,
+    "experiment": pl.String,
+    "evaluator": pl.String,
+    "sample_id": pl.String,
+    "epoch": pl.Int64,
+    "scorer": pl.String,
+    "metric": pl.String,
+    "value": pl.Float64,
+    "metadata": pl.String,
+}
+
+
+def _to_score_value(value: object) -> float | None:
+    """Converts a numeric score value to a float.
+
+    Args:
+        value (object): The score value.
+
+    Returns:
+        float | None: The score value as a float, or None if it is not numeric.
+    """
+    if type(value) in (float, int, bool):
+        return float(value)  # type: ignore
+    return None
+
+
+def get_score_rows(record_key: EvaluationRecord, eval_log: EvalLog) -> pl.DataFrame:
+    """Extracts the numeric sample scores from an evaluation log.
+
+    Each row holds a single metric value for a sample, together with the
+    identifying fields of the evaluation record. Scores returning a dictionary
+    of values (e.g., QAGS) produce a row for each numeric value, using its key as
+    the metric name, while other scores use the scorer name as the metric name.
+    The sample metadata are stored as JSON strings.
+
+    Args:
+        record_key (EvaluationRecord): The evaluation record.
+        eval_log (EvalLog): The evaluation log with the scored samples.
+
+    Returns:
+        pl.DataFrame: The score rows, following `SCORE_INDEX_SCHEMA`.
+    """
+    record_fields = {
+        "record": get_record_digest(record_key),
+        "dataset": record_key.dataset_record.name,
+        "splits": ", ".join(record_key.dataset_record.splits),
+        "task": record_key.task_name,
+        "generator": record_key.generator_name,
+        "model": record_key.model_record.name,
+        "experiment": record_key.experiment_name,
+        "evaluator": record_key.evaluator_name,
+    }
+    rows = []
+    for sample in eval_log.samples or []:
+        if not sample.scores:
+            continue
+        metadata = json.dumps(sample.metadata, default=str) if sample.metadata else None
+        for scorer_name, score in sample.scores.items():
+            if isinstance(score.value, dict):
+                values = score.value.items()
+            else:
+                values = [(scorer_name, score.value)]
+            for metric_name, value in values:
+                float_value = _to_score_value(value)
+                if float_value is None:
+                    continue
+                rows.append(
+                    record_fields
+                    | {
+                        "sample_id": str(sample.id),
+                        "epoch": sample.epoch,
+                        "scorer": scorer_name,
+                        "metric": metric_name,
+                        "value": float_value,
+                        "metadata": metadata,
+                    }
+                )
+    return pl.DataFrame(rows, schema=SCORE_INDEX_SCHEMA)
+
+
+def write_score_index(path: Path, scores: pl.DataFrame):
+    """Writes the score rows to a Parquet file atomically.
+
+    Args:
+        path (Path): The path to the Parquet file.
+        scores (pl.DataFrame): The score rows.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    scores.write_parquet(temp_file)
+    os.replace(temp_file, path)
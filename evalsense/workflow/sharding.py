@@ -0,0 +1,129 @@
+import hashlib
+import os
+
+from inspect_ai.dataset import Dataset
+from inspect_ai.log import EvalLog
+
+from evalsense.evaluation import EvaluationRecord, GenerationRecord
+
+
+def get_record_digest(record: GenerationRecord | EvaluationRecord) -> str:
+    """Computes a stable digest of a generation or evaluation record.
+
+    The digest is consistent across processes and machines.
+
+    Args:
+        record (GenerationRecord | EvaluationRecord): The record.
+
+    Returns:
+        str: The hexadecimal digest of the record.
+    """
+    return hashlib.sha256(record.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def get_shard_index(record: GenerationRecord, num_shards: int) -> int:
+    """Deterministically assigns a generation record to a shard.
+
+    The assignment is based on a stable hash of the record, so that it is
+    consistent across processes and machines.
+
+    Args:
+        record (GenerationRecord): The generation record to assign.
+        num_shards (int): The total number of shards.
+
+    Returns:
+        int: The index of the shard the record is assigned to.
+    """
+    return int(get_record_digest(record)[:16], 16) % num_shards
+
+
+def get_sample_shard(dataset: Dataset, shard_index: int, num_shards: int) -> Dataset:
+    """Selects a deterministic shard of the samples in a dataset.
+
+    The shards are contiguous and non-overlapping ranges of the samples,
+    differing in size by at most one sample.
+
+    Args:
+        dataset (Dataset): The dataset to shard.
+        shard_index (int): The index of the shard to select.
+        num_shards (int): The total number of shards.
+
+    Returns:
+        Dataset: The samples in the selected shard.
+    """
+    start = len(dataset) * shard_index // num_shards
+    end = len(dataset) * (shard_index + 1) // num_shards
+    return dataset[start:end]  # type: ignore
+
+
+def merge_eval_logs(logs: list[EvalLog]) -> EvalLog:
+    """Merges the logs for disjoint subsets of samples of the same task (e.g.,
+    sample shards) into a single log.
+
+    The header of the first log is used as the base of the merged log, while the
+    samples, dataset information, sample counts and model usage are combined
+    across all logs.
+
+    Args:
+        logs (list[EvalLog]): The logs to merge, in the order of their samples.
+
+    Returns:
+        EvalLog: The merged log.
+
+    Raises:
+        ValueError: If no logs are given.
+    """
+    if not logs:
+        raise ValueError("No logs to merge.")
+
+    # Avoid deep-copying the samples of the first log
+    merged_log = logs[0].model_copy(update={"samples": None}).model_copy(deep=True)
+    merged_log.samples = [sample for log in logs for sample in log.samples or []]
+    merged_log.status = (
+        "success" if all(log.status == "success" for log in logs) else "error"
+    )
+    merged_log.eval.dataset.samples = sum(log.eval.dataset.samples or 0 for log in logs)
+    if all(log.eval.dataset.sample_ids is not None for log in logs):
+        merged_log.eval.dataset.sample_ids = [
+            sample_id for log in logs for sample_id in log.eval.dataset.sample_ids or []
+        ]
+
+    started_at = [log.stats.started_at for log in logs if log.stats.started_at]
+    completed_at = [log.stats.completed_at for log in logs if log.stats.completed_at]
+    merged_log.stats.started_at = min(started_at, default="")
+    merged_log.stats.completed_at = max(completed_at, default="")
+    for log in logs[1:]:
+        for model, usage in log.stats.model_usage.items():
+            if model in merged_log.stats.model_usage:
+                merged_log.stats.model_usage[model] += usage
+            else:
+                merged_log.stats.model_usage[model] = usage
+
+    if merged_log.results is not None:
+        merged_log.results.total_samples = sum(
+            log.results.total_samples for log in logs if log.results is not None
+        )
+        merged_log.results.completed_samples = sum(
+            log.results.completed_samples for log in logs if log.results is not None
+        )
+    return merged_log
+
+
+def slurm_array_shard() -> tuple[int, int]:
+    """Returns the shard corresponding to the current SLURM array job task.
+
+    The array task IDs are assumed to form a contiguous range.
+
+    Returns:
+        tuple[int, int]: The index of the shard and the total number of shards.
+
+    Raises:
+        RuntimeError: If not running as a part of a SLURM array job.
+    """
+    if "SLURM_ARRAY_TASK_ID" not in os.environ:
+        raise RuntimeError("Not running as a part of a SLURM array job.")
+    task_id = int(os.environ["SLURM_ARRAY_TASK_ID"])
+    task_min = int(os.environ.get("SLURM_ARRAY_TASK_MIN", 0))
+    task_max = int(os.environ.get("SLURM_ARRAY_TASK_MAX", task_id))
+    task_count = int(os.environ.get("SLURM_ARRAY_TASK_COUNT", task_max - task_min + 1))
+    return task_id - task_min, task_count
@@ -0,0 +1,243 @@
+from collections import defaultdict
+from dataclasses import dataclass
+import hashlib
+import math
+from typing import Any
+
+from inspect_ai.dataset import Dataset, Sample
+from inspect_ai.log import EvalSample
+from pydantic import BaseModel
+
+from evalsense.utils.stats import bootstrap_confidence_interval
+from evalsense.workflow.early_stopping import get_primary_score_values
+
+
+@dataclass
+class SubsampleConfig:
+    """Configuration of a stratified subsample of the datasets, used for quick
+    iterations before running the experiments on the full datasets.
+
+    The subsample is selected deterministically based on the sample IDs, so that
+    a subsample with a larger fraction includes all samples of a subsample with
+    a smaller fraction. A subsampled run can thus be expanded later by running
+    the pipeline with a larger fraction (or without subsampling) in the
+    incremental mode, which only generates and scores the missing samples.
+
+    Attributes:
+        fraction (float): The fraction of samples to select from each stratum.
+        stratify_by (str | None): The metadata field used for stratification,
+            e.g., a perturbation tier or a specialty. The samples are selected
+            from the whole dataset when None. Defaults to None.
+        min_per_stratum (int): The minimum number of samples selected from each
+            stratum. Defaults to 1.
+        seed (int): The random seed for selecting the samples and computing the
+            bootstrap intervals. Defaults to 0.
+        confidence (float): The confidence level of the reported bootstrap
+            intervals. Defaults to 0.95.
+        num_bootstrap_resamples (int): The number of bootstrap resamples.
+            Defaults to 1000.
+        score_key (str | None): The key of the primary score for evaluators
+            returning multiple scores per sample (e.g., QAGS). Defaults to the
+            first key when None.
+    """
+
+    fraction: float
+    stratify_by: str | None = None
+    min_per_stratum: int = 1
+    seed: int = 0
+    confidence: float = 0.95
+    num_bootstrap_resamples: int = 1000
+    score_key: str | None = None
+
+    def __post_init__(self):
+        if not 0 < self.fraction <= 1:
+            raise ValueError("The subsample fraction must be between 0 and 1.")
+        if self.min_per_stratum < 1:
+            raise ValueError("At least one sample must be selected per stratum.")
+        if not 0 < self.confidence < 1:
+            raise ValueError("The confidence level must be between 0 and 1.")
+
+    def get_selection_params(self) -> dict[str, Any]:
+        """Returns the parameters determining the selected samples, which are
+        stored in the records of the results produced on the subsample.
+
+        Returns:
+            dict[str, Any]: The selection parameters.
+        """
+        return {
+            "fraction": self.fraction,
+            "stratify_by": self.stratify_by,
+            "min_per_stratum": self.min_per_stratum,
+            "seed": self.seed,
+        }
+
+    def get_stratum(self, sample: Sample | EvalSample) -> str | None:
+        """Returns the stratum of a sample.
+
+        Args:
+            sample (Sample | EvalSample): The sample.
+
+        Returns:
+            str | None: The stratum, or None if the samples are not stratified.
+        """
+        if self.stratify_by is None:
+            return None
+        return str((sample.metadata or {}).get(self.stratify_by))
+
+
+class SubsampleInterval(BaseModel, frozen=True):
+    """A bootstrap confidence interval for the mean of the primary score over
+    the samples of a subsample stratum.
+
+    Attributes:
+        stratum (str | None): The stratum, or None for all samples.
+        samples (int): The number of samples with a valid score.
+        mean (float | None): The mean score, if any samples were scored.
+        ci_lower (float | None): The lower bound of the interval, if computed.
+        ci_upper (float | None): The upper bound of the interval, if computed.
+    """
+
+    stratum: str | None
+    samples: int
+    mean: float | None = None
+    ci_lower: float | None = None
+    ci_upper: float | None = None
+
+
+def subsample_covers(
+    selection_params: dict[str, Any] | None,
+    requested_params: dict[str, Any] | None,
+) -> bool:
+    """Checks whether the results produced on a subsample cover all samples
+    of the requested subsample.
+
+    A subsample covers another subsample selected from the same strata with
+    the same seed, if it has at least the same fraction and minimum number of
+    samples per stratum.
+
+    Args:
+        selection_params (dict[str, Any] | None): The selection parameters of
+            the subsample the results were produced on, or None for results
+            produced on the full datasets.
+        requested_params (dict[str, Any] | None): The selection parameters of
+            the requested subsample, or None if the full datasets are requested.
+
+    Returns:
+        bool: True if the results cover all requested samples, False otherwise.
+    """
+    if selection_params is None:
+        return True
+    if requested_params is None:
+        return False
+    return (
+        selection_params["stratify_by"] == requested_params["stratify_by"]
+        and selection_params["seed"] == requested_params["seed"]
+        and selection_params["fraction"] >= requested_params["fraction"]
+        and selection_params["min_per_stratum"] >= requested_params["min_per_stratum"]
+    )
+
+
+def _get_sample_rank(sample_id: str | int, seed: int) -> str:
+    """Returns a pseudo-random rank of a sample, stable across dataset versions.
+
+    Args:
+        sample_id (str | int): The ID of the sample.
+        seed (int): The random seed.
+
+    Returns:
+        str: The rank of the sample.
+    """
+    return hashlib.sha256(f"{seed}:{sample_id}".encode()).hexdigest()
+
+
+def select_stratified_subsample(dataset: Dataset, config: SubsampleConfig) -> Dataset:
+    """Selects a stratified subsample of a dataset.
+
+    Args:
+        dataset (Dataset): The dataset to subsample.
+        config (SubsampleConfig): The subsample configuration.
+
+    Returns:
+        Dataset: The subsampled dataset.
+
+    Raises:
+        ValueError: If some samples have no IDs.
+    """
+    strata: dict[str | None, list[str | int]] = defaultdict(list)
+    for sample in dataset:
+        if sample.id is None:
+            raise ValueError("Subsampling requires all dataset samples to have IDs.")
+        strata[config.get_stratum(sample)].append(sample.id)
+
+    selected_ids: set[str | int] = set()
+    for sample_ids in strata.values():
+        num_selected = max(
+            config.min_per_stratum, math.ceil(config.fraction * len(sample_ids))
+        )
+        ranked_ids = sorted(
+            sample_ids, key=lambda sample_id: _get_sample_rank(sample_id, config.seed)
+        )
+        selected_ids.update(ranked_ids[:num_selected])
+    return dataset.filter(lambda sample: sample.id in selected_ids)
+
+
+def _get_interval(
+    stratum: str | None,
+    samples: list[EvalSample],
+    config: SubsampleConfig,
+) -> SubsampleInterval:
+    """Computes the bootstrap interval for the mean score over the samples.
+
+    Args:
+        stratum (str | None): The stratum of the samples, or None for all samples.
+        samples (list[EvalSample]): The scored samples.
+        config (SubsampleConfig): The subsample configuration.
+
+    Returns:
+        SubsampleInterval: The bootstrap interval.
+    """
+    values = get_primary_score_values(samples, config.score_key)
+    if not values:
+        return SubsampleInterval(stratum=stratum, samples=0)
+    ci_lower, ci_upper = (
+        bootstrap_confidence_interval(
+            values,
+            confidence=config.confidence,
+            num_resamples=config.num_bootstrap_resamples,
+            seed=config.seed,
+        )
+        if len(values) >= 2
+        else (None, None)
+    )
+    return SubsampleInterval(
+        stratum=stratum,
+        samples=len(values),
+        mean=sum(values) / len(values),
+        ci_lower=ci_lower,
+        ci_upper=ci_upper,
+    )
+
+
+def get_subsample_intervals(
+    samples: list[EvalSample],
+    config: SubsampleConfig,
+) -> list[SubsampleInterval]:
+    """Computes the bootstrap intervals for the mean of the primary score over
+    all scored samples and within the individual strata.
+
+    Args:
+        samples (list[EvalSample]): The scored samples.
+        config (SubsampleConfig): The subsample configuration.
+
+    Returns:
+        list[SubsampleInterval]: The interval for all samples, followed by the
+            intervals for the individual strata, if stratified.
+    """
+    intervals = [_get_interval(None, samples, config)]
+    if config.stratify_by is not None:
+        strata: dict[str | None, list[EvalSample]] = defaultdict(list)
+        for sample in samples:
+            strata[config.get_stratum(sample)].append(sample)
+        for stratum in sorted(strata, key=str):
+            intervals.append(_get_interval(stratum, strata[stratum], config))
+    return intervals
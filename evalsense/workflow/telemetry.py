@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import os
+import time
+from typing import Callable, Iterator, Literal
+
+from pydantic import BaseModel
+
+type SpanStage = Literal[
+    "dataset_load",
+    "task_preprocessing",
+    "model_load",
+    "model_cleanup",
+    "generation",
+    "log_read",
+    "scoring",
+    "log_write",
+    "score_index",
+    "evaluator_cleanup",
+]
+
+
+class TimingSpan(BaseModel, frozen=True):
+    """A timed span of a pipeline stage.
+
+    Attributes:
+        stage (SpanStage): The pipeline stage.
+        label (str | None): The label of the records or the name of the model
+            processed in the stage, if applicable.
+        started_at (datetime): The time at which the stage started.
+        duration (float): The duration of the stage in seconds.
+        error (str | None): The error raised during the stage, if any.
+        process_id (int): The ID of the process running the stage.
+    """
+
+    stage: SpanStage
+    label: str | None = None
+    started_at: datetime
+    duration: float
+    error: str | None = None
+    process_id: int
+
+
+@contextmanager
+def timed_span(
+    stage: SpanStage,
+    label: str | None,
+    record_span: Callable[[TimingSpan], None],
+) -> Iterator[None]:
+    """Times a pipeline stage, recording the span when the stage finishes.
+
+    Args:
+        stage (SpanStage): The pipeline stage.
+        label (str | None): The label of the records or the name of the model
+            processed in the stage, if applicable.
+        record_span (Callable[[TimingSpan], None]): The function used for
+            recording the span.
+    """
+    started_at = datetime.now(timezone.utc)
+    start_time = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record_span(
+            TimingSpan(
+                stage=stage,
+                label=label,
+                started_at=started_at,
+                duration=time.perf_counter() - start_time,
+                error=error,
+                process_id=os.getpid(),
+            )
+        )
@@ -0,0 +1,373 @@
+"""Benchmarks the throughput of the EvalSense pipeline offline.
+
+The benchmark drives `Pipeline.run` with the Inspect mock model over synthetic
+datasets of increasing size, separately for each selected built-in evaluator.
+The evaluators using a model are run with a mock judge returning a fixed
+response, so that the measured times reflect the EvalSense and Inspect
+overheads rather than model latency. For each run, the benchmark reports:
+
+- the total and per-sample wall-clock time of the pipeline run,
+- the time spent in the individual pipeline stages (from the project telemetry),
+- the cost of reading and writing the generation log, and
+- the cost of loading the project and updating its metadata.
+
+Example usage:
+
+    uv run python scripts/benchmark_pipeline.py --samples 1000 10000 100000
+
+The results can be saved for comparison between revisions using `--output`.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+
+import polars as pl
+
+DATASET_PREFIX = "evalsense-benchmark-"
+DEFAULT_EVALUATORS = ["bleu", "rouge", "g-eval", "qags"]
+ALL_EVALUATORS = [*DEFAULT_EVALUATORS, "bertscore"]
+MOCK_MODEL_NAME = "mockllm/model"
+# A response parseable by the G-Eval scorer and the QAGS question generation,
+# answering and answer comparison steps
+MOCK_JUDGE_RESPONSE = "Is the summary consistent with the source?\nyes\nScore: 7"
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the EvalSense pipeline with a mock model."
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        nargs="+",
+        default=[1000],
+        help="The synthetic dataset sizes to benchmark (default: 1000).",
+    )
+    parser.add_argument(
+        "--evaluators",
+        nargs="+",
+        choices=ALL_EVALUATORS,
+        default=DEFAULT_EVALUATORS,
+        help="The evaluators to benchmark (default: all except bertscore, "
+        "which requires the local model dependencies).",
+    )
+    parser.add_argument(
+        "--bertscore-model",
+        default="distilbert-base-uncased",
+        help="The model used by the BERTScore evaluator.",
+    )
+    parser.add_argument(
+        "--words-per-sample",
+        type=int,
+        default=200,
+        help="The number of words in each synthetic input (default: 200).",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=100,
+        help="The maximum number of concurrent mock model calls (default: 100).",
+    )
+    parser.add_argument(
+        "--metadata-records",
+        type=int,
+        default=500,
+        help="The number of records added when measuring the project metadata "
+        "cost (default: 500).",
+    )
+    parser.add_argument(
+        "--storage-dir",
+        type=Path,
+        default=None,
+        help="The EvalSense storage directory to use. Defaults to a temporary "
+        "directory removed after the benchmark.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="The path to save the results to, as a CSV or JSON file. When saving "
+        "to a CSV file, the project metadata results are saved next to it, with "
+        "a -metadata suffix.",
+    )
+    return parser.parse_args()
+
+
+def time_call(fun: Callable[[], Any], repeats: int = 1) -> float:
+    """Measures the mean wall-clock time of a function call.
+
+    Args:
+        fun (Callable[[], Any]): The function to call.
+        repeats (int): The number of calls to average over. Defaults to 1.
+
+    Returns:
+        float: The mean duration of the call in seconds.
+    """
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        fun()
+    return (time.perf_counter() - start_time) / repeats
+
+
+def main():
+    args = parse_args()
+    storage_dir = args.storage_dir or Path(tempfile.mkdtemp(prefix=DATASET_PREFIX))
+    # The storage directory and the Inspect settings are read on import
+    os.environ["EVALSENSE_STORAGE_DIR"] = str(storage_dir)
+    os.environ.setdefault("INSPECT_DISPLAY", "none")
+    os.environ.setdefault("INSPECT_LOG_LEVEL", "warning")
+
+    from datasets import Dataset, DatasetDict
+    from inspect_ai.dataset import FieldSpec
+    from inspect_ai.log import read_eval_log, write_eval_log
+    from inspect_ai.model import GenerateConfigArgs, ModelOutput, get_model
+    from inspect_ai.solver import generate
+
+    from evalsense.datasets import DatasetManager
+    from evalsense.evaluation import (
+        Evaluator,
+        ExperimentBatchConfig,
+        ResultRecord,
+        TaskConfig,
+    )
+    from evalsense.evaluation.evaluators import (
+        QagsConfig,
+        get_bertscore_evaluator,
+        get_bleu_evaluator,
+        get_g_eval_evaluator,
+        get_qags_evaluator,
+        get_rouge_evaluator,
+    )
+    from evalsense.generation import GenerationSteps, ModelConfig
+    from evalsense.workflow import Pipeline, Project
+    from evalsense.workflow.record_store import ProjectRecords
+
+    class SyntheticDatasetManager(DatasetManager):
+        """A dataset manager for synthetic benchmark datasets.
+
+        The number of samples is encoded in the dataset name, e.g.,
+        `evalsense-benchmark-1000`.
+        """
+
+        priority = 10
+
+        def retrieve(self, **kwargs):
+            num_samples = int(self.name.removeprefix(DATASET_PREFIX))
+            filler = " ".join(["lorem"] * args.words_per_sample)
+            rows = {
+                "id": [f"sample-{i}" for i in range(num_samples)],
+                "input": [
+                    f"Summarise document {i}: {filler}" for i in range(num_samples)
+                ],
+                "target": [f"Summary of document {i}." for i in range(num_samples)],
+            }
+            DatasetDict({"test": Dataset.from_dict(rows)}).save_to_disk(
+                self.main_data_path
+            )
+
+        @classmethod
+        def can_handle(cls, name: str) -> bool:
+            return name.startswith(DATASET_PREFIX)
+
+    class BenchmarkQagsConfig(QagsConfig):
+        """A minimal QAGS configuration for the benchmark."""
+
+        def __init__(self):
+            super().__init__(answer_comparison_mode="ternary", logprobs=False)
+
+        def get_question_generation_prompt(self, *, source, prediction, **kwargs):
+            text = prediction if source == "prediction" else kwargs["reference"]
+            return f"Generate yes/no questions about the text:\n{text}"
+
+        def get_answer_generation_prompt(self, *, source, question, **kwargs):
+            text = kwargs["prediction"] if source == "prediction" else kwargs["input"]
+            return f"Answer the question about the text:\n{text}\n{question}"
+
+    def mock_judge_output(input, tools, tool_choice, config) -> ModelOutput:
+        return ModelOutput.from_content(MOCK_MODEL_NAME, MOCK_JUDGE_RESPONSE)
+
+    def create_evaluator(name: str) -> Evaluator:
+        generation_args = GenerateConfigArgs(max_connections=args.max_connections)
+        judge_config = ModelConfig(
+            get_model(MOCK_MODEL_NAME, custom_outputs=mock_judge_output),
+            generation_args=generation_args,
+        )
+        match name:
+            case "bleu":
+                return get_bleu_evaluator()
+            case "rouge":
+                return get_rouge_evaluator()
+            case "bertscore":
+                return get_bertscore_evaluator(model_type=args.bertscore_model)
+            case "g-eval":
+                return get_g_eval_evaluator(
+                    prompt_template="Rate the summary from 1 to 10.\n{prediction}",
+                    model_config=judge_config,
+                    logprobs=False,
+                )
+            case "qags":
+                return get_qags_evaluator(
+                    config=BenchmarkQagsConfig(), model_config=judge_config
+                )
+            case _:
+                raise ValueError(f"Unknown evaluator: {name}")
+
+    def load_project(name: str) -> ProjectRecords:
+        with Project(name) as project:
+            # The project records are loaded lazily
+            return project.records
+
+    def benchmark_pipeline(num_samples: int, evaluator_name: str) -> dict[str, Any]:
+        with Project(
+            f"benchmark-{num_samples}-{evaluator_name}", reset_project=True
+        ) as project:
+            results = run_pipeline(project, num_samples, evaluator_name)
+        # Loaded once closed, so that the benchmark session is not active
+        results["project_load_ms"] = (
+            time_call(lambda: load_project(project.name), repeats=10) * 1000
+        )
+        return results
+
+    def run_pipeline(
+        project: Project, num_samples: int, evaluator_name: str
+    ) -> dict[str, Any]:
+        dataset_manager = SyntheticDatasetManager(
+            name=f"{DATASET_PREFIX}{num_samples}", splits=["test"]
+        )
+        # Exclude the one-off creation of the synthetic dataset from the timings
+        if not dataset_manager.is_retrieved():
+            dataset_manager.retrieve()
+        batch_config = ExperimentBatchConfig(
+            tasks=[
+                TaskConfig(
+                    dataset_manager=dataset_manager,
+                    generation_steps=GenerationSteps(
+                        name="Generate", steps=[generate()]
+                    ),
+                    field_spec=FieldSpec(input="input", target="target", id="id"),
+                )
+            ],
+            model_configs=[
+                ModelConfig(
+                    MOCK_MODEL_NAME,
+                    generation_args=GenerateConfigArgs(
+                        max_connections=args.max_connections
+                    ),
+                )
+            ],
+            evaluators=[create_evaluator(evaluator_name)],
+        )
+        pipeline = Pipeline(experiments=batch_config, project=project)
+        run_time = time_call(lambda: pipeline.run(show_progress=False))
+        stage_times = {
+            f"{row['stage']}_s": row["total_duration"]
+            for row in project.get_timing_summary().sort("stage").iter_rows(named=True)
+        }
+
+        results = [
+            *project.records.generation.values(),
+            *project.records.evaluation.values(),
+        ]
+        for result in results:
+            if result.status != "success":
+                raise RuntimeError(
+                    f"Benchmark experiment failed: {result.error_message}"
+                )
+        generation_result = next(iter(project.records.generation.values()))
+        log_path = Path(cast(str, generation_result.log_location))
+        log = read_eval_log(log_path)
+        copy_path = storage_dir / f"log-copy{log_path.suffix}"
+        log_write_time = time_call(lambda: write_eval_log(log, copy_path))
+        copy_path.unlink()
+
+        return {
+            "samples": num_samples,
+            "evaluator": evaluator_name,
+            "run_s": run_time,
+            "per_sample_ms": run_time / num_samples * 1000,
+            **stage_times,
+            "log_file_size_mb": log_path.stat().st_size / 2**20,
+            "log_file_read_s": time_call(lambda: read_eval_log(log_path)),
+            "log_file_read_header_s": time_call(
+                lambda: read_eval_log(log_path, header_only=True)
+            ),
+            "log_file_write_s": log_write_time,
+        }
+
+    def benchmark_metadata(num_records: int) -> dict[str, Any]:
+        with Project(
+            f"benchmark-{args.samples[0]}-{args.evaluators[0]}"
+        ) as template_project:
+            template_record = next(iter(template_project.records.generation))
+        with Project("benchmark-metadata", reset_project=True) as project:
+            start_time = time.perf_counter()
+            for i in range(num_records):
+                project.update_record(
+                    template_record.model_copy(
+                        update={"experiment_name": f"record-{i}"}
+                    ),
+                    ResultRecord(status="success"),
+                )
+            update_time = time.perf_counter() - start_time
+
+        return {
+            "records": num_records,
+            "mean_update_ms": update_time / num_records * 1000,
+            "total_update_s": update_time,
+            "project_load_ms": time_call(lambda: load_project(project.name), repeats=10)
+            * 1000,
+        }
+
+    try:
+        results = pl.DataFrame(
+            [
+                benchmark_pipeline(num_samples, evaluator_name)
+                for num_samples in args.samples
+                for evaluator_name in args.evaluators
+            ],
+            strict=False,
+        )
+        metadata_results = pl.DataFrame([benchmark_metadata(args.metadata_records)])
+    finally:
+        if args.storage_dir is None:
+            shutil.rmtree(storage_dir, ignore_errors=True)
+
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=1000, float_precision=4):
+        print("Pipeline throughput:")
+        print(results)
+        print("Project metadata cost:")
+        print(metadata_results)
+
+    if args.output is not None:
+        if args.output.suffix == ".json":
+            args.output.write_text(
+                json.dumps(
+                    {
+                        "pipeline": results.to_dicts(),
+                        "metadata": metadata_results.to_dicts(),
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            results.write_csv(args.output)
+            metadata_results.write_csv(
+                args.output.with_stem(f"{args.output.stem}-metadata")
+            )
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()